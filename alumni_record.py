@@ -0,0 +1,202 @@
+"""
+Tek bir mezun satırını temsil eden hafif (__slots__ tabanlı) kayıt tipi.
+"""
+import sys
+from typing import Dict, List, Optional, Sequence, Tuple
+import config
+
+# Çok sayıda satırda tekrar eden değerler (aynı şirket, aynı yıl...) tek bir nesnede tutulur
+_INTERNED_FIELDS = ("graduation_year", "company", "position", "status")
+
+
+class AlumniRecord:
+    """
+    Mezun verisini sözlük yerine sabit alanlarla taşır.
+    Ham satır, başlık listesiyle birlikte referans olarak saklanır; '_original' sözlüğü
+    sadece istendiğinde üretilir.
+    """
+
+    __slots__ = (
+        "name",
+        "linkedin_url",
+        "graduation_year",
+        "company",
+        "position",
+        "status",
+        "notes",
+        "row_num",
+        "_headers",
+        "_values",
+    )
+
+    name: str
+    linkedin_url: str
+    graduation_year: str
+    company: str
+    position: str
+    status: str
+    notes: str
+    row_num: int
+
+    def __init__(
+        self,
+        name: str = "",
+        linkedin_url: str = "",
+        graduation_year: str = "",
+        company: str = "",
+        position: str = "",
+        status: str = "",
+        notes: str = "",
+        row_num: int = -1,
+        headers: Optional[List[str]] = None,
+        values: Optional[Tuple[str, ...]] = None
+    ):
+        self.name = name
+        self.linkedin_url = linkedin_url
+        self.graduation_year = graduation_year
+        self.company = company
+        self.position = position
+        self.status = status
+        self.notes = notes
+        self.row_num = row_num
+        self._headers = headers
+        self._values = values
+
+    @classmethod
+    def from_row(
+        cls,
+        headers: List[str],
+        values: Sequence,
+        row_num: int,
+        field_indexes: Dict[str, int]
+    ) -> "AlumniRecord":
+        """
+        E-tablodaki ham satırdan kayıt oluşturur.
+
+        Args:
+            headers: Başlık satırı (tüm kayıtlar aynı liste nesnesini paylaşır)
+            values: Satır değerleri
+            row_num: 0-tabanlı veri satırı numarası
+            field_indexes: Alan adı -> sütun indeksi (bkz. field_indexes_for)
+        """
+        cells = [str(v) for v in values]
+        for key in _INTERNED_FIELDS:
+            index = field_indexes.get(key)
+            if index is not None and index < len(cells):
+                cells[index] = sys.intern(cells[index])
+
+        fields = {
+            key: cells[index] if index < len(cells) else ""
+            for key, index in field_indexes.items()
+        }
+        return cls(row_num=row_num, headers=headers, values=tuple(cells), **fields)
+
+    @property
+    def original(self) -> Dict[str, str]:
+        # Ham satırı başlık -> değer sözlüğü olarak döndürür (her çağrıda yeniden üretilir).
+        if self._headers is None:
+            return self.to_dict()
+        values = self._values or ()
+        return {
+            header: values[i] if i < len(values) else ""
+            for i, header in enumerate(self._headers)
+        }
+
+    def to_dict(self) -> Dict[str, str]:
+        return {key: getattr(self, key) for key in config.COLUMN_MAPPING}
+
+    # --- Sözlük uyumluluğu (CampaignLogger gibi dict bekleyen kodlar için) ---
+
+    def get(self, key: str, default=None):
+        if key == "_row_num":
+            return self.row_num
+        if key == "_original":
+            return self.original
+        if key in config.COLUMN_MAPPING:
+            return getattr(self, key)
+        return default
+
+    def __getitem__(self, key: str):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __repr__(self) -> str:
+        return f"AlumniRecord(row_num={self.row_num}, name={self.name!r}, status={self.status!r})"
+
+
+_MISSING = object()
+
+
+def field_indexes_for(headers: List[str]) -> Dict[str, int]:
+    # COLUMN_MAPPING'deki her alan için başlık satırındaki sütun indeksini bulur (olmayanlar atlanır).
+    return {
+        key: headers.index(column)
+        for key, column in config.COLUMN_MAPPING.items()
+        if column in headers
+    }
+
+
+# ---------- BELLEK KARŞILAŞTIRMASI ----------
+
+if __name__ == "__main__":
+    import gc
+    import tracemalloc
+
+    COUNT = 100_000
+    headers = list(config.COLUMN_MAPPING.values())
+    indexes = field_indexes_for(headers)
+    companies = ["Google", "Aselsan", "Turkcell", "Havelsan", "Trendyol"]
+
+    def make_rows():
+        # Her satır, e-tablodan gelmiş gibi kendi string nesnelerine sahip olur
+        return [
+            [
+                f"Mezun {i}",
+                f"https://linkedin.com/in/mezun-{i}",
+                str(2010 + i % 12),
+                "".join(companies[i % len(companies)]),
+                "".join("Yazılım Mühendisi"),
+                "",
+                "",
+            ]
+            for i in range(COUNT)
+        ]
+
+    def measure(build) -> int:
+        # Satırların kendisi de ölçüme dahil: kayıtlarda yaşamaya devam eden string'ler sayılır
+        gc.collect()
+        tracemalloc.start()
+        rows = make_rows()
+        records = build(rows)
+        del rows
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del records
+        return size
+
+    def build_dicts(rows):
+        records = []
+        for row_num, values in enumerate(rows):
+            original = dict(zip(headers, values))
+            normalized = {key: original.get(col, "") for key, col in config.COLUMN_MAPPING.items()}
+            normalized["_original"] = original
+            normalized["_row_num"] = row_num
+            records.append(normalized)
+        return records
+
+    def build_records(rows):
+        return [
+            AlumniRecord.from_row(headers, values, row_num, indexes)
+            for row_num, values in enumerate(rows)
+        ]
+
+    dict_bytes = measure(build_dicts)
+    record_bytes = measure(build_records)
+
+    print(f"{COUNT} kayıt için bellek kullanımı:")
+    print(f"  dict + _original : {dict_bytes / 1e6:8.1f} MB ({dict_bytes / COUNT:.0f} B/kayıt)")
+    print(f"  AlumniRecord     : {record_bytes / 1e6:8.1f} MB ({record_bytes / COUNT:.0f} B/kayıt)")
+    print(f"  Kazanç           : {(dict_bytes - record_bytes) / 1e6:8.1f} MB")
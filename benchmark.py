@@ -0,0 +1,312 @@
+"""
+LinkedInAutomation'ın hız ölçümü: headless Chrome, yerel taklit LinkedIn sunucusuna
+(mock_linkedin.py) karşı send_message_fast'i sürer. Canlı hesap gerekmez.
+
+Dakikada profil, adım bazında p95 süreler ve profil başına WebDriver istek sayısı raporlanır;
+her çalıştırmanın özeti config.BENCHMARK_RESULTS_PATH dosyasına eklenir ve aynı ayarlı
+bir önceki çalıştırmayla karşılaştırılır.
+
+    python benchmark.py --profiles 30
+    python benchmark.py --profiles 60 --mode parallel --workers 3 --latency 0.1 --popup-rate 0.2
+    python benchmark.py --profiles 30 --latency 0.05 --compare-load
+"""
+import json
+import queue
+import shutil
+import socket
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+import config
+from linkedin_automation import LinkedInAutomation
+from metrics import MetricsRecorder, format_summary, set_recorder
+from mock_linkedin import MockLinkedInServer
+from outcomes import SendOutcome
+from selector_engine import SelectorStats
+
+_DEFAULT_MESSAGE = (
+    "Merhaba, bölümümüzün MÜDEK akreditasyon süreci için mezunlarımıza kısa bir anket "
+    "gönderiyoruz. Katkınız bizim için çok değerli, şimdiden teşekkür ederiz."
+)
+
+
+def count_round_trips(driver) -> Counter:
+    """
+    driver.execute'u sararak WebDriver isteklerini komut adına göre sayar.
+    WebElement çağrıları da sürücünün execute metodundan geçtiği için hepsi sayılır.
+    """
+    counts: Counter = Counter()
+    execute = driver.execute
+
+    def counted(command, params=None):
+        counts[command] += 1
+        return execute(command, params)
+
+    driver.execute = counted
+    return counts
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+# ---------- ÇALIŞTIRMA BİÇİMLERİ ----------
+# Her biçim (tarayıcılar, adresler, mesaj) alır ve her profil için send_message_fast sonucunu döndürür.
+
+def run_serial(bots: List[LinkedInAutomation], urls: List[str], message: str) -> List[SendOutcome]:
+    bot = bots[0]
+    return [bot.send_message_fast(url, message) for url in urls]
+
+
+def run_parallel(bots: List[LinkedInAutomation], urls: List[str], message: str) -> List[SendOutcome]:
+    # Her tarayıcı kendi iş parçacığında ortak kuyruktan adres çeker (main.py --workers gibi)
+    work: queue.Queue = queue.Queue()
+    for url in urls:
+        work.put(url)
+    results: List[SendOutcome] = []
+
+    def worker(bot):
+        while True:
+            try:
+                url = work.get_nowait()
+            except queue.Empty:
+                return
+            results.append(bot.send_message_fast(url, message))
+
+    with ThreadPoolExecutor(max_workers=len(bots), thread_name_prefix="bench") as pool:
+        list(pool.map(worker, bots))
+    return results
+
+
+MODES: Dict[str, Callable[[List[LinkedInAutomation], List[str], str], List[SendOutcome]]] = {
+    "serial": run_serial,
+    "parallel": run_parallel,
+}
+
+
+def run_benchmark(
+    server: MockLinkedInServer,
+    profiles: int,
+    mode: str = "serial",
+    workers: int = 1,
+    warmup: int = 1,
+    message: str = _DEFAULT_MESSAGE,
+    load_profile: Optional[str] = None
+) -> Dict[str, object]:
+    """
+    Tarayıcıları açar, ısınma turundan sonra `profiles` adet profile mesaj gönderir.
+    Tarayıcı açılışı ve ısınma turu ölçüme girmez.
+
+    Args:
+        server: Çalışan MockLinkedInServer
+        profiles: Ölçülecek profil sayısı
+        mode: MODES anahtarı
+        workers: Tarayıcı sayısı ('serial' biçiminde 1)
+        warmup: Ölçümden önce tarayıcı başına gönderilecek profil sayısı
+        message: Gönderilecek mesaj
+        load_profile: 'full' | 'light' (varsayılan: config.PAGE_LOAD_PROFILE)
+
+    Returns:
+        Çalıştırma özeti (BENCHMARK_RESULTS_PATH'e yazılan satır)
+    """
+    if mode == "serial":
+        workers = 1
+    load_profile = load_profile or config.PAGE_LOAD_PROFILE
+    run_id = f"bench-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+    workdir = Path(tempfile.mkdtemp(prefix="mudek_bench_"))
+    # Ölçüm, kalıcı seçici istatistiklerini ve kampanya ölçümlerini etkilemesin
+    stats = SelectorStats(workdir / "selector_stats.json")
+    previous = set_recorder(MetricsRecorder(enabled=False))
+
+    bots = []
+    try:
+        for n in range(workers):
+            bots.append(LinkedInAutomation(
+                profile_path=str(workdir / f"chrome_{n}"), debug_port=_free_port(),
+                selector_stats=stats, load_profile=load_profile
+            ))
+        counters = [count_round_trips(bot.driver) for bot in bots]
+
+        if warmup:
+            warmup_urls = [server.profile_url(f"isinma-{n}") for n in range(warmup * workers)]
+            MODES[mode](bots, warmup_urls, message)
+
+        recorder = MetricsRecorder(path=config.BENCHMARK_METRICS_PATH, run_id=run_id)
+        set_recorder(recorder)
+        for counter in counters:
+            counter.clear()
+        selector_calls = sum(bot.selectors.round_trips for bot in bots)
+        delivered = len(server.sent)
+        # Profil başına indirilen veri sunucu tarafında sayılır (engellenen istekler sunucuya hiç gelmez)
+        bytes_sent = server.bytes_sent
+
+        urls = [server.profile_url(f"mezun-{n}") for n in range(profiles)]
+        started = time.perf_counter()
+        results = MODES[mode](bots, urls, message)
+        elapsed = time.perf_counter() - started
+
+        selector_calls = sum(bot.selectors.round_trips for bot in bots) - selector_calls
+        bytes_sent = server.bytes_sent - bytes_sent
+        commands = sum(counters, Counter())
+        steps = {
+            step: values for step, values in recorder.summary().items()
+            if step.startswith(("send.", "wait."))
+        }
+        recorder.close()
+    finally:
+        for bot in bots:
+            bot.close()
+        set_recorder(previous)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    count = len(results) or 1
+    sent = sum(1 for outcome in results if outcome.sent)
+    return {
+        "run": run_id,
+        "mode": mode,
+        "workers": workers,
+        "load_profile": load_profile,
+        "profiles": len(results),
+        "sent": sent,
+        "errors": len(results) - sent,
+        "error_reasons": dict(Counter(outcome.reason for outcome in results if not outcome.sent)),
+        "delivered": len(server.sent) - delivered,
+        "seconds": round(elapsed, 3),
+        "profiles_per_min": round(len(results) / elapsed * 60, 2) if elapsed else 0.0,
+        "round_trips_per_profile": round(sum(commands.values()) / count, 2),
+        "selector_calls_per_profile": round(selector_calls / count, 2),
+        "kb_per_profile": round(bytes_sent / 1024 / count, 1),
+        "top_commands": commands.most_common(6),
+        "steps": steps,
+        "server": {
+            "latency": server.latency,
+            "jitter": server.jitter,
+            "render_delay": server.render_delay,
+            "bubble_delay": server.bubble_delay,
+            "send_delay": server.send_delay,
+            "popup_rate": server.popup_rate,
+            "no_button_rate": server.no_button_rate,
+            "asset_kb": server.asset_kb,
+        },
+    }
+
+
+def save_result(result: Dict[str, object], path: Optional[Path] = None):
+    path = Path(path or config.BENCHMARK_RESULTS_PATH)
+    with open(path, mode="a", encoding="utf-8") as f:
+        f.write(json.dumps(result, ensure_ascii=False) + "\n")
+
+
+def previous_result(result: Dict[str, object], path: Optional[Path] = None) -> Optional[Dict[str, object]]:
+    # Aynı biçim, tarayıcı sayısı ve sunucu ayarlarıyla yapılmış son çalıştırma
+    path = Path(path or config.BENCHMARK_RESULTS_PATH)
+    if not path.exists():
+        return None
+    match = None
+    with open(path, mode="r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if all(entry.get(key) == result[key] for key in ("mode", "workers", "load_profile", "server")):
+                match = entry
+    return match
+
+
+def format_result(result: Dict[str, object], baseline: Optional[Dict[str, object]] = None) -> str:
+    lines = [
+        f"Biçim: {result['mode']} ({result['workers']} tarayıcı, {result['load_profile']} yükleme) | "
+        f"profil: {result['profiles']} (gönderildi {result['sent']}, hata {result['errors']}, "
+        f"sunucuya ulaşan {result['delivered']})",
+        f"Süre: {result['seconds']:.1f} sn | {result['profiles_per_min']:.1f} profil/dk",
+    ]
+    if result.get("error_reasons"):
+        lines.append("Hata nedenleri: " + ", ".join(f"{r} {n}" for r, n in result["error_reasons"].items()))
+    lines += [
+        f"Profil başına WebDriver isteği: {result['round_trips_per_profile']:.1f} "
+        f"(seçici çözümü: {result['selector_calls_per_profile']:.1f})",
+        f"Profil başına indirilen: {result['kb_per_profile']:.0f} KB",
+        "En sık komutlar: " + ", ".join(f"{name} {n}" for name, n in result["top_commands"]),
+    ]
+    if baseline:
+        change = result["profiles_per_min"] / baseline["profiles_per_min"] - 1 if baseline["profiles_per_min"] else 0.0
+        lines.append(
+            f"Önceki çalıştırma ({baseline['run']}): {baseline['profiles_per_min']:.1f} profil/dk, "
+            f"{baseline['round_trips_per_profile']:.1f} istek/profil ({change:+.0%})"
+        )
+    lines.append("")
+    lines.append(format_summary(result["steps"]))
+    return "\n".join(lines)
+
+
+def format_load_savings(full: Dict[str, object], light: Dict[str, object]) -> str:
+    # 'light' yüklemenin profil başına kazandırdığı süre ve veri
+    def per_profile(result, step):
+        return result["steps"].get(step, {}).get("p50", 0.0)
+
+    def change(before, after):
+        return f"{after / before - 1:+.0%}" if before else "-"
+
+    lines = []
+    for step, label in (("send.navigate", "Profil açılışı"), ("send.total", "Profil başına toplam")):
+        before, after = per_profile(full, step), per_profile(light, step)
+        lines.append(f"{label} (p50): {before:.0f} ms -> {after:.0f} ms ({change(before, after)})")
+    lines.append(
+        f"İndirilen veri: {full['kb_per_profile']:.0f} KB -> {light['kb_per_profile']:.0f} KB "
+        f"({change(full['kb_per_profile'], light['kb_per_profile'])})"
+    )
+    lines.append(
+        f"Hız: {full['profiles_per_min']:.1f} -> {light['profiles_per_min']:.1f} profil/dk "
+        f"({change(full['profiles_per_min'], light['profiles_per_min'])})"
+    )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Taklit LinkedIn sunucusuna karşı gönderim hızı ölçümü")
+    parser.add_argument("--profiles", type=int, default=20, help="Ölçülecek profil sayısı")
+    parser.add_argument("--mode", choices=sorted(MODES), default="serial")
+    parser.add_argument("--workers", type=int, default=1, help="Tarayıcı sayısı (parallel)")
+    parser.add_argument("--warmup", type=int, default=1, help="Tarayıcı başına ısınma profili")
+    parser.add_argument("--headed", action="store_true", help="Tarayıcı penceresini göster")
+    parser.add_argument("--latency", type=float, default=0.0, help="Yanıt başına gecikme (sn)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Rastgele ek gecikme üst sınırı (sn)")
+    parser.add_argument("--render-delay", type=float, default=0.0, help="Profil içeriğinin çizilme süresi (sn)")
+    parser.add_argument("--bubble-delay", type=float, default=0.0, help="Sohbet kutusunun açılma süresi (sn)")
+    parser.add_argument("--send-delay", type=float, default=0.0, help="Gönderimden sonra kutunun boşalma süresi (sn)")
+    parser.add_argument("--popup-rate", type=float, default=0.0, help="Popup gösterilen profil oranı")
+    parser.add_argument("--no-button-rate", type=float, default=0.0, help="Mesaj butonu olmayan profil oranı")
+    parser.add_argument("--asset-kb", type=int, default=150, help="Ağır kaynak (fotoğraf, video vb.) boyutu (KB)")
+    load = parser.add_mutually_exclusive_group()
+    load.add_argument("--load-profile", choices=["full", "light"], default=None, help="Sayfa yükleme biçimi")
+    load.add_argument("--compare-load", action="store_true", help="'full' ve 'light' yüklemeyi karşılaştır")
+    args = parser.parse_args()
+
+    config.HEADLESS_MODE = not args.headed
+    with MockLinkedInServer(
+        latency=args.latency, jitter=args.jitter, render_delay=args.render_delay,
+        bubble_delay=args.bubble_delay, send_delay=args.send_delay,
+        popup_rate=args.popup_rate, no_button_rate=args.no_button_rate, asset_kb=args.asset_kb
+    ) as server:
+        profiles = ["full", "light"] if args.compare_load else [args.load_profile]
+        results = [
+            run_benchmark(server, args.profiles, args.mode, args.workers, args.warmup, load_profile=profile)
+            for profile in profiles
+        ]
+
+    for result in results:
+        baseline = previous_result(result)
+        save_result(result)
+        print(format_result(result, baseline))
+        print()
+    if args.compare_load:
+        print(format_load_savings(*results))
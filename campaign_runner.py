@@ -0,0 +1,348 @@
+"""
+Kampanya döngüsünün asyncio ile yürütülmesi.
+Her gönderici hesabın tarayıcısı kendi iş parçacığında çalışırken e-tablo yazımları,
+kampanya logu ve bir sonraki kaydın mesajı arka planda hazırlanır; böylece profil başına
+süre sadece tarayıcının harcadığı süreye iner.
+"""
+import asyncio
+import signal
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Set
+import config
+from alumni_record import AlumniRecord
+from logger_utils import setup_logger
+from metrics import get_recorder
+from outcomes import DRIVER_ERROR, SendOutcome, failed
+from retry_queue import RetryQueue
+from scheduler import RateScheduler
+
+logger = setup_logger(__name__)
+
+# person: AlumniRecord, url: tam profil adresi, message: hazırlanmış mesaj
+Job = namedtuple("Job", ["person", "url", "message"])
+# outcome: SendOutcome, worker: işi yapan hesabın adı,
+# sheet_status / notes: tekrar kuyruğunun belirlediği ve e-tabloya yazılan durum ve açıklama
+Result = namedtuple("Result", ["job", "outcome", "worker", "sheet_status", "notes"])
+
+
+def sender_accounts(count: int) -> List[Dict]:
+    """
+    İlk `count` gönderici hesabı döndürür; config.SENDER_ACCOUNTS yetmezse
+    ayrı profil klasörü ve boş bir port ile yeni hesap tanımları üretilir.
+    """
+    accounts = [dict(account) for account in config.SENDER_ACCOUNTS[:count]]
+    used_ports = {account["debug_port"] for account in accounts}
+    port = config.CHROME_DEBUG_PORT
+    for n in range(len(accounts), count):
+        while port in used_ports:
+            port += 1
+        used_ports.add(port)
+        accounts.append({
+            "name": f"hesap{n + 1}",
+            "profile_path": f"{config.CHROME_PROFILE_PATH}_{n + 1}",
+            "debug_port": port
+        })
+    return accounts
+
+
+class CampaignRunner:
+    """
+    Mesaj gönderimini hesap başına bir asyncio görevine böler.
+
+    Args:
+        sheets: AlumniSource (okuma ve yazımlar tek bir G/Ç iş parçacığında yapılır)
+        bots: Hesap adı -> LinkedInAutomation (veya DryRunAutomation)
+        generator: MessageGenerator
+        campaign_log: Verilirse her sonuç CampaignLogger'a da yazılır
+        on_result: Her sonuç e-tabloya yazıldıktan sonra olay döngüsünde çağrılır
+        journal: Verilirse her deneme/sonuç/yazım CampaignJournal'a kaydedilir (çökme sonrası kurtarma)
+        scheduler: Gönderim kotaları (varsayılan: config.RATE_LIMITS ile RateScheduler)
+        retries: Başarısız gönderimlerin tekrar kuyruğu (varsayılan: RetryQueue)
+    """
+
+    def __init__(
+        self,
+        sheets,
+        bots: Dict[str, object],
+        generator,
+        campaign_log=None,
+        on_result: Optional[Callable[[Result], None]] = None,
+        journal=None,
+        scheduler: Optional[RateScheduler] = None,
+        retries: Optional[RetryQueue] = None
+    ):
+        self.sheets = sheets
+        self.bots = bots
+        self.generator = generator
+        self.campaign_log = campaign_log
+        self.on_result = on_result
+        self.journal = journal
+        self.scheduler = scheduler or RateScheduler(bots)
+        self.retries = retries or RetryQueue()
+        self.limit_reached = False
+        self.completed = 0
+        self.recorder = get_recorder()
+
+        # Veri kaynakları iş parçacığı güvenli değildir: tüm okuma/yazımlar tek iş parçacığında, sırayla
+        self._io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sheets-io")
+        # Her tarayıcı hep aynı iş parçacığından sürülür
+        self._browsers = {
+            name: ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"browser-{name}")
+            for name in bots
+        }
+        self._writes: Set[asyncio.Task] = set()
+        self._idle_flush: Optional[asyncio.Task] = None
+        # Durumu tampona alınmış ama e-tabloya yazıldığı henüz doğrulanmamış kişiler (satır -> kayıt)
+        self._unconfirmed: Dict[int, AlumniRecord] = {}
+        self._buffered_since: Optional[float] = None  # En eski doğrulanmamış yazımın zamanı (monotonic)
+        self._stop: Optional[asyncio.Event] = None
+        self._pending = None
+
+    async def run(self, pending: Iterator[AlumniRecord]) -> int:
+        """
+        Bekleyen kayıtları işler; Ctrl-C'de tarayıcılar ellerindeki profili bitirir,
+        arka plandaki yazımlar tamamlanır ve sonra döner.
+
+        Returns:
+            İşlenen kişi sayısı
+        """
+        loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        self._pending = pending
+        interrupt_handled = self._install_interrupt_handler(loop)
+
+        jobs: asyncio.Queue = asyncio.Queue(maxsize=len(self.bots))
+        producer = asyncio.create_task(self._produce(pending, jobs))
+        senders = [
+            asyncio.create_task(self._send_loop(name, bot, jobs))
+            for name, bot in self.bots.items()
+        ]
+        try:
+            await asyncio.gather(*senders)
+        finally:
+            self._stop.set()
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+            # Sırada kalan (kota dolduğu ya da durdurulduğu için gönderilmeyen) kişiler bırakılır
+            while not jobs.empty():
+                job = jobs.get_nowait()
+                if job is not None:
+                    self._release(job)
+            # Kuyrukta kalan durum yazımlarını ve logları bitir
+            while self._writes:
+                await asyncio.gather(*list(self._writes), return_exceptions=True)
+            # Son toplu yazım da burada yapılır ki günlükte 'written' olarak işaretlensin
+            await loop.run_in_executor(self._io, self._flush_sync)
+            if interrupt_handled:
+                loop.remove_signal_handler(signal.SIGINT)
+            for executor in [*self._browsers.values(), self._io]:
+                executor.shutdown(wait=True)
+        return self.completed
+
+    def _install_interrupt_handler(self, loop) -> bool:
+        # İlk Ctrl-C sadece yeni iş almayı durdurur; ikincisi varsayılan davranışa döner
+        def interrupt():
+            logger.warning("⏹️ Durduruluyor: tarayıcılar ellerindeki profili bitirince çıkılacak")
+            self._stop.set()
+            loop.remove_signal_handler(signal.SIGINT)
+
+        try:
+            loop.add_signal_handler(signal.SIGINT, interrupt)
+            return True
+        except (NotImplementedError, RuntimeError):
+            # Windows: asyncio.run ana görevi iptal eder, finally bloğu yine de boşaltır
+            return False
+
+    async def _produce(self, pending: Iterator[AlumniRecord], jobs: asyncio.Queue):
+        loop = asyncio.get_running_loop()
+        try:
+            while not self._stop.is_set():
+                # Sıradaki kayıt, yazımlarla aynı G/Ç iş parçacığında okunur
+                person = await loop.run_in_executor(self._io, next, pending, None)
+                if person is None:
+                    break
+
+                # Adres ön kontrolde (prevalidate.py) tam https adresine çevrildi
+                url = person.linkedin_url
+
+                # Mesaj, tarayıcı bir önceki profille uğraşırken hazırlanır
+                with self.recorder.span("main.render"):
+                    message = self.generator.generate(person)
+
+                job = Job(person, url, message)
+                try:
+                    await jobs.put(job)
+                except asyncio.CancelledError:
+                    self._release(job)
+                    raise
+        finally:
+            # Her gönderici için 'iş bitti' işareti (iptal edildiyse gerek yok)
+            if not self._stop.is_set():
+                for _ in self.bots:
+                    await jobs.put(None)
+
+    async def _send_loop(self, name: str, bot, jobs: asyncio.Queue):
+        loop = asyncio.get_running_loop()
+        executor = self._browsers[name]
+
+        while True:
+            job = await self._next_job(jobs)
+            if job is None:
+                break
+
+            # Kota hakkı gelene kadar beklenir; bu sırada sıradaki mesajlar hazırlanır ve
+            # tampondaki durum yazımları gönderilir
+            if not await self._wait_for_quota(name):
+                self._requeue(jobs, job)
+                break
+
+            if self.journal is not None:
+                self.journal.attempted(job.person, name)
+
+            started = time.perf_counter()
+            try:
+                outcome: SendOutcome = await loop.run_in_executor(
+                    executor, bot.send_message_fast, job.url, job.message
+                )
+            except Exception as e:
+                logger.error("%s: gönderim hatası: %s", name, e)
+                outcome = failed(DRIVER_ERROR, str(e))
+            # Geçici hata 'Hata' (sonra tekrar denenir), kalıcı hata 'Atlandı' olarak yazılır
+            sheet_status, notes = self.retries.record(job.person, outcome)
+            if self.journal is not None:
+                self.journal.finished(job.person, outcome.sent, sheet_status, name)
+            self.recorder.record(
+                "main.profile", time.perf_counter() - started,
+                outcome=outcome.status, reason=outcome.reason, worker=name
+            )
+
+            # Yazım beklenmez; sıradaki profile hemen geçilir
+            self._schedule_write(Result(job, outcome, name, sheet_status, notes))
+
+    async def _wait_for_quota(self, name: str) -> bool:
+        started = time.perf_counter()
+        try:
+            while not self._stop.is_set():
+                wait = self.scheduler.wait_time(name)
+                if wait <= 0 and self.scheduler.try_acquire(name):
+                    return True
+                if wait > config.RATE_LIMIT_MAX_WAIT:
+                    logger.info("%s: gönderim kotası doldu (sıradaki hak %.0f dk sonra)", name, wait / 60)
+                    self.limit_reached = True
+                    return False
+                # Tampon kendi eşiklerini (SHEETS_BATCH_SIZE / SHEETS_FLUSH_INTERVAL) korur; beklerken
+                # sadece uzun beklemelerde ya da süresi dolmuş tamponda yazılır
+                if wait >= config.SHEETS_FLUSH_INTERVAL or self._flush_overdue():
+                    self._flush_while_idle()
+                await self._pause(min(max(wait, 0.05), 1.0))
+            return False
+        finally:
+            self.recorder.record("main.quota_wait", time.perf_counter() - started, worker=name)
+
+    def _requeue(self, jobs: asyncio.Queue, job: Job):
+        # Kotası dolan hesabın elindeki kişi başka bir hesaba kalsın
+        try:
+            jobs.put_nowait(job)
+        except asyncio.QueueFull:
+            logger.debug("%s bu çalıştırmada işlenmeyecek (kuyruk dolu)", job.person.name)
+            self._release(job)
+
+    def _release(self, job: Job):
+        # Sıradan alınıp gönderilmeyen kişi öncelik sırasına bildirilir (PriorityScheduler.finished);
+        # aksi halde yılı 'yolda' sayılmaya devam eder
+        finished = getattr(self._pending, "finished", None)
+        if finished is not None:
+            finished(job.person, job.person.status.strip())
+
+    def _flush_overdue(self) -> bool:
+        since = self._buffered_since
+        return since is not None and time.monotonic() - since >= config.SHEETS_FLUSH_INTERVAL
+
+    def _flush_while_idle(self):
+        # Beklerken tamponlanmış durum güncellemeleri e-tabloya gönderilir (aynı anda tek istek)
+        if self._idle_flush is not None and not self._idle_flush.done():
+            return
+        loop = asyncio.get_running_loop()
+        self._idle_flush = asyncio.ensure_future(loop.run_in_executor(self._io, self._flush_sync))
+        self._writes.add(self._idle_flush)
+        self._idle_flush.add_done_callback(self._writes.discard)
+
+    async def _next_job(self, jobs: asyncio.Queue) -> Optional[Job]:
+        # Durdurma isteği gelirse kuyruğu beklemeyi bırakır
+        if self._stop.is_set():
+            return None
+        get = asyncio.ensure_future(jobs.get())
+        stop = asyncio.ensure_future(self._stop.wait())
+        await asyncio.wait([get, stop], return_when=asyncio.FIRST_COMPLETED)
+        stop.cancel()
+        if not get.done():
+            get.cancel()
+            return None
+        job = get.result()
+        if job is not None and self._stop.is_set():
+            # Durdurma ile aynı anda alınan kişi kaybolmasın: sıraya geri konur
+            self._requeue(jobs, job)
+            return None
+        return job
+
+    async def _pause(self, seconds: float):
+        try:
+            await asyncio.wait_for(self._stop.wait(), seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    def _schedule_write(self, result: Result):
+        task = asyncio.create_task(self._write(result))
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    async def _write(self, result: Result):
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self._io, self._write_sync, result)
+        except Exception as e:
+            logger.error("Durum yazılamadı (%s): %s", result.job.person.name, e)
+        self.completed += 1
+        if self.on_result:
+            self.on_result(result)
+
+    def _write_sync(self, result: Result):
+        # G/Ç iş parçacığında çalışır; yazımlar gönderim sırasıyla işlenir
+        status = result.sheet_status
+        person = result.job.person
+
+        # Durum yazımları tamponlanır, eşik dolunca tek istekte gönderilir
+        with self.recorder.span("main.update_status"):
+            queued = self.sheets.update_status(person.row_num, status, result.notes)
+        if queued:
+            if self._buffered_since is None:
+                self._buffered_since = time.monotonic()
+            self._unconfirmed[person.row_num] = person
+        else:
+            logger.error("%s için durum yazılamadı; bir sonraki açılışta günlükten tekrar denenecek", person.name)
+        if self.campaign_log is not None:
+            self.campaign_log.log_action(person, "mesaj_gonderimi", status, result.notes)
+        self._confirm_written()
+
+    def _flush_sync(self):
+        self.sheets.flush_updates()
+        self._confirm_written()
+        if self._unconfirmed:
+            # Yazılamadı: bir sonraki deneme yine SHEETS_FLUSH_INTERVAL sonra
+            self._buffered_since = time.monotonic()
+
+    def _confirm_written(self):
+        # Tampondan çıkmış (e-tabloya yazılmış) satırlar günlükte 'written' olarak işaretlenir
+        if not self._unconfirmed:
+            return
+        pending = self.sheets.pending_rows()
+        confirmed = [row for row in self._unconfirmed if row not in pending]
+        if self.journal is not None and confirmed:
+            self.journal.written(self._unconfirmed[row] for row in confirmed)
+        for row in confirmed:
+            del self._unconfirmed[row]
+        if confirmed:
+            # Tampon boşaltıldı; kalanlar boşaltmadan sonra tampona girmiş yeni yazımlardır
+            self._buffered_since = time.monotonic() if self._unconfirmed else None
@@ -10,11 +10,27 @@ CREDENTIALS_PATH = BASE_DIR / "credentials.json"
 LOGS_DIR = BASE_DIR / "logs"
 LOGS_DIR.mkdir(exist_ok=True)
 CAMPAIGN_LOG_PATH = LOGS_DIR / "campaign_log.csv"
+CAMPAIGN_LOG_INDEX_PATH = LOGS_DIR / "campaign_log_index.sqlite3"  # Gönderilmiş URL'lerin yan dizini
+CAMPAIGN_LOG_FLUSH_INTERVAL = 5  # Kampanya logu en geç kaç saniyede bir diske boşaltılır
 
 # --- 2. TARAYICI AYARLARI (BOT) ---
 # Bot, proje klasörü içinde 'bot_chrome_data' adında kendine ait temiz bir Chrome açar.
 CHROME_PROFILE_PATH = os.path.join(BASE_DIR, "bot_chrome_data")
 CHROME_PROFILE_NAME = ""  
+CHROME_DEBUG_PORT = 9223
+
+# --- ÇOKLU HESAP (main.py --workers N) ---
+# Her işçi kendi Chrome profiliyle (ayrı bir LinkedIn hesabı) ve kendi hata ayıklama portuyla açılır.
+# Listede tanımlı olmayan işçiler için profil 'bot_chrome_data_<n>', port CHROME_DEBUG_PORT + n olur.
+SENDER_ACCOUNTS = [
+    {"name": "hesap1", "profile_path": CHROME_PROFILE_PATH, "debug_port": CHROME_DEBUG_PORT},
+]
+
+# --- SÜREKLİ AÇIK TARAYICI (python driver_daemon.py) ---
+# Servis çalışıyorsa main.py Chrome'u sıfırdan açmak yerine hesabın açık tarayıcısına bağlanır.
+DRIVER_DAEMON_PORT = 9322          # Yerel kontrol soketi (sadece 127.0.0.1)
+DRIVER_HEALTH_INTERVAL = 15        # Sağlık kontrolü aralığı (sn)
+DRIVER_RESTART_AFTER = 2           # Üst üste bu kadar başarısız kontrolden sonra tarayıcı yeniden açılır
 
 BROWSER_WIDTH = 1200
 BROWSER_HEIGHT = 900
@@ -31,17 +47,94 @@ COLUMN_MAPPING = {
     "graduation_year": "Mezuniyet Yılı",
     "company": "Şirket",
     "position": "Pozisyon",
-    "status": "Durum"
+    "status": "Durum",
+    "notes": "Notlar"
 }
 
+# Durum yazımları tamponlanır ve tek bir batch_update isteğiyle gönderilir
+SHEETS_BATCH_SIZE = 20         # Bu kadar hücre biriktiğinde tampon boşaltılır
+SHEETS_FLUSH_INTERVAL = 60     # Saniye; ilk bekleyen yazımdan bu kadar sonra boşaltılır
+
+# Çalışma sayfasının yerel anlık görüntüsü (e-tablo değişmediyse tekrar indirilmez)
+SHEETS_CACHE_ENABLED = True
+SHEETS_CACHE_PATH = LOGS_DIR / "sheets_snapshot.sqlite3"
+SHEETS_CHUNK_ROWS = 500        # Sayfa okunurken tek istekte çekilen satır sayısı
+# E-tablo değiştiyse önce COLUMN_MAPPING sütunları çekilir, sadece bunlarda farkı olan satırlar indirilir
+SHEETS_DIFF_MAX_RATIO = 0.5           # Satırların bu orandan fazlası değiştiyse sayfa baştan indirilir
+SHEETS_DIFF_RANGES_PER_REQUEST = 100  # Tek batch_get isteğindeki en fazla aralık sayısı
+
 # --- ZAMANLAMA VE GÜVENLİK LİMİTLERİ ---
-DELAY_BETWEEN_PROFILES = 45  
 PAGE_LOAD_TIMEOUT = 60
+
+# Sayfa yükleme biçimi:
+#   'full'  : Chrome varsayılanı; driver.get tüm görseller, yazı tipleri ve betikler inene kadar bekler
+#   'light' : driver.get DOM hazır olunca döner (pageLoadStrategy=eager) ve aşağıdaki kaynaklar
+#             DevTools (Network.setBlockedURLs) ile hiç indirilmez; profil başlığı ve mesaj
+#             kontrolleri yine koşul tabanlı beklemelerle beklenir
+PAGE_LOAD_PROFILE = "light"
+LIGHT_LOAD_BLOCKED_URLS = [
+    # Görseller (LinkedIn fotoğrafları uzantısız adreslerden gelir)
+    "*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*",
+    "*media.licdn.com/dms/image*",
+    # Yazı tipleri ve medya
+    "*.woff*", "*.ttf*", "*.otf*", "*.mp4*", "*.webm*", "*.m3u8*",
+    "*dms.licdn.com/playlist*",
+    # İzleme ve reklam
+    "*/li/track*", "*px.ads.linkedin.com*", "*li.protechts.net*",
+    "*doubleclick.net*", "*google-analytics.com*", "*googletagmanager.com*", "*bat.bing.com*",
+]
 ELEMENT_WAIT_TIMEOUT = 30
 SHORT_DELAY = 1.5
 MEDIUM_DELAY = 3.0
 
-MAX_PROFILES_PER_SESSION = 25  # Günlük en fazla 25 kişiye bak (spam riskini azaltmak için)
+# Koşul tabanlı beklemeler: her adım sayfa hazır olur olmaz devam eder,
+# aşağıdaki süreler sadece üst sınırdır (saniye)
+WAIT_POLL_INTERVAL = 0.1
+WAIT_TIMEOUTS = {
+    "profile_load": 15,      # Profil başlığı (h1) görünene kadar
+    "message_button": 8,     # Profildeki Mesaj butonu görünene kadar
+    "message_bubble": 8,     # Tıklamadan sonra sohbet kutusu açılana kadar
+    "textbox_focus": 2,      # Mesaj kutusu odaklanana kadar
+    "send_enabled": 5,       # Yazdıktan sonra Gönder butonu aktif olana kadar
+    "send_done": 5,          # Gönderimden sonra kutu boşalana kadar
+    "popup_closed": 2,       # Kapatılan popup kaybolana kadar
+    "chats_closed": 3,       # Açık sohbet pencerelerinin hepsi kapanana kadar
+    "login_check": 10,       # Akış sayfası açılınca oturum (akış/giriş yönlendirmesi) belli olana kadar
+}
+
+# Seçici isabet istatistikleri (rapor için: python selector_engine.py)
+SELECTOR_STATS_PATH = LOGS_DIR / "selector_stats.json"
+SELECTOR_DEAD_AFTER = 50  # Grup bu kadar kez çözüldüğü halde hiç isabet etmeyen seçici 'ölü' sayılır ve en sona alınır
+
+# Gönderim kotaları: (adet, süre sn). Herhangi bir 'süre' uzunluğundaki pencerede en fazla 'adet'
+# gönderim yapılır (kayan pencere); '_gap' ile bitenler iki gönderim arası aralıktır (token bucket).
+# 'global_' ile başlayanlar tüm hesapların toplamına, 'account_' ile başlayanlar her gönderici
+# hesaba ayrı uygulanır. Gönderim zamanları çalıştırmalar arasında saklanır (durum: python scheduler.py)
+RATE_LIMITS = {
+    "global_hour": (30, 3600),
+    "global_day": (50, 86400),     # Günde en fazla 50 kişi (spam riskini azaltmak için)
+    "account_hour": (15, 3600),
+    "account_day": (25, 86400),    # Tek hesapla günde en fazla 25 kişi
+    "account_gap": (1, 5),         # Aynı hesapla iki kişi arası en az 5 saniye
+}
+RATE_LIMIT_MAX_WAIT = 15 * 60  # Sıradaki hak bundan uzun süre sonra geliyorsa o hesap durur
+QUOTA_STATE_PATH = LOGS_DIR / "quota_state.json"
+
+# Kampanya günlüğü: her kişi için 'denendi', 'gönderildi/hata' ve 'e-tabloya yazıldı' kayıtları.
+# Açılışta okunur; e-tabloya ulaşmamış durumlar tekrar yazılır, gönderilmiş kişiler atlanır.
+JOURNAL_PATH = LOGS_DIR / "campaign_journal.jsonl"
+JOURNAL_FSYNC = "critical"  # always | critical (gönderimden hemen önce/sonra) | never
+
+# Tekrar kuyruğu: geçici hatalar (zaman aşımı vb.) üstel artan beklemeyle tekrar denenir;
+# kalıcı hatalar ve deneme hakkı bitenler 'Atlandı' yazılır (durum için: python retry_queue.py)
+RETRY_QUEUE_PATH = LOGS_DIR / "retry_queue.json"
+RETRY_MAX_ATTEMPTS = 3         # Bu kadar başarısız denemeden sonra kişi atlanır
+RETRY_BASE_DELAY = 30 * 60     # İlk tekrar 30 dk sonra; her hatada iki katına çıkar
+RETRY_MAX_DELAY = 24 * 3600    # Bekleme en fazla 1 gün
+
+# Öncelik sırası: günlük kota önce bu orana ulaşmamış mezuniyet yıllarına harcanır
+# (yıl başına 'Gönderildi' oranı; sıralamayı görmek için: python priority_scheduler.py)
+MUDEK_TARGET_RATE = 0.30
 
 # --- DURUM KODLARI ---
 STATUS_PENDING = "Bekliyor"
@@ -50,6 +143,14 @@ STATUS_SKIPPED = "Atlandı"
 STATUS_ERROR = "Hata"
 
 # --- MESAJ İÇERİĞİ ---
+UNIVERSITY_NAME = "Örnek Üniversitesi"
+FACULTY_NAME = "Mühendislik Fakültesi"
+DEPARTMENT_NAME = "Bilgisayar Mühendisliği Bölümü"
+SENDER_NAME = "Özge"
+
+MESSAGE_TEMPLATE = "tr_casual"  # message_generator.TEMPLATES anahtarlarından biri
+MESSAGE_CACHE_SIZE = 1024        # Aynı yer tutucu değerleriyle üretilmiş mesajların LRU önbelleği
+
 SURVEY_URL = "https://forms.google.com/ornek-anket-linki"
 CONTACT_EMAIL = "ornek@univ.edu.tr"  # İsteğe bağlı ileride eklenebilir
 CONTACT_PHONE = "0555-555-5555"      # İsteğe bağlı ileride eklenebilir
@@ -57,4 +158,19 @@ CONTACT_PHONE = "0555-555-5555"      # İsteğe bağlı ileride eklenebilir
 # --- LOGLAMA AYARLARI ---
 LOG_LEVEL = "INFO"
 CONSOLE_OUTPUT = True
-FILE_LOGGING = True
\ No newline at end of file
+FILE_LOGGING = True
+LOG_FILE_PATH = LOGS_DIR / "survey.log"
+
+# survey.log ve campaign_log.csv bu eşiklerde döndürülür; eski parçalar sıkıştırılıp saklanır
+# (örn. campaign_log.20261016-235959.csv.gz). Tüm parçaların özeti: python log_rotation.py
+LOG_ROTATE_MAX_BYTES = 5 * 1024 * 1024
+LOG_ROTATE_DAILY = True
+LOG_ARCHIVE_COMPRESSION = "gzip"  # gzip | zstd (zstandard paketi gerekir)
+
+# Adım süreleri (p50/p95/max özeti için: python metrics.py)
+METRICS_ENABLED = True
+METRICS_LOG_PATH = LOGS_DIR / "metrics.jsonl"
+
+# Taklit LinkedIn sunucusuyla hız ölçümü (python benchmark.py)
+BENCHMARK_RESULTS_PATH = LOGS_DIR / "benchmark.jsonl"           # Çalıştırma başına tek özet satırı
+BENCHMARK_METRICS_PATH = LOGS_DIR / "benchmark_metrics.jsonl"   # Adım süreleri (python metrics.py --file ...)
\ No newline at end of file
@@ -0,0 +1,365 @@
+"""
+Mezun verisi kaynakları: Google E-Tablolar dışında CSV, Parquet ve SQLite dosyalarından
+okuma/yazma yapılabilmesini sağlar. Böylece tüm akış ağ bağlantısı olmadan çalıştırılabilir.
+"""
+import csv
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+import config
+from alumni_record import AlumniRecord, field_indexes_for
+from linkedin_urls import normalize_linkedin_url
+from logger_utils import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class AlumniSource(ABC):
+    """
+    Mezun kayıtlarının okunduğu ve durumlarının geri yazıldığı kaynak arayüzü.
+    """
+
+    @abstractmethod
+    def iter_alumni(
+        self,
+        chunk_rows: Optional[int] = None,
+        statuses: Optional[List[str]] = None
+    ) -> Iterator[AlumniRecord]:
+        """
+        Mezun kayıtlarını satır sırasıyla üretir.
+
+        Args:
+            chunk_rows: Kaynak destekliyorsa tek seferde okunacak satır sayısı
+            statuses: Verilirse sadece bu durumlardaki kayıtlar üretilir
+        """
+
+    @abstractmethod
+    def update_status(self, row_index: int, status: str, notes: str = "") -> bool:
+        # 0-tabanlı satırın durumunu (ve varsa notlarını) günceller; yazım tamponlanabilir.
+        # Güncelleme kabul edildiyse (tampona alındıysa) True döner.
+        pass
+
+    def iter_pending_alumni(self, chunk_rows: Optional[int] = None) -> Iterator[AlumniRecord]:
+        return self.iter_alumni(chunk_rows, ["", config.STATUS_PENDING])
+
+    def get_all_alumni(self) -> List[AlumniRecord]:
+        return list(self.iter_alumni())
+
+    def get_pending_alumni(self) -> List[AlumniRecord]:
+        return list(self.iter_pending_alumni())
+
+    def find_rows(self, linkedin_urls: Iterable[str], refresh: bool = False) -> Dict[str, Optional[int]]:
+        # URL'lerin güncel 0-tabanlı satırları (bulunamazsa None); aynı profil birden çok satırdaysa ilki.
+        # Varsayılan uygulama kaynağı bir kez baştan sona okur.
+        linkedin_urls = list(linkedin_urls)
+        wanted = {normalize_linkedin_url(url) for url in linkedin_urls}
+        found: Dict[str, int] = {}
+        for person in self.iter_alumni():
+            key = normalize_linkedin_url(person.linkedin_url)
+            if key in wanted and key not in found:
+                found[key] = person.row_num
+        return {url: found.get(normalize_linkedin_url(url)) for url in linkedin_urls}
+
+    def flush_updates(self) -> bool:
+        # Tamponlanmış yazımları kaynağa işler; başarılıysa True döner.
+        return True
+
+    def pending_rows(self) -> Set[int]:
+        # Güncellemesi kabul edilmiş ama henüz kaynağa yazılmamış 0-tabanlı satırlar.
+        return set()
+
+    def close(self):
+        self.flush_updates()
+
+
+class ReadOnlySource(AlumniSource):
+    """
+    Başka bir kaynağı salt okunur sarar (main.py --dry-run): okumalar aynen geçer,
+    durum güncellemeleri kabul edilir ama kaynağa hiç yazılmaz.
+
+    Args:
+        source: Okunacak asıl kaynak
+    """
+
+    def __init__(self, source: AlumniSource):
+        self.source = source
+
+    def iter_alumni(
+        self,
+        chunk_rows: Optional[int] = None,
+        statuses: Optional[List[str]] = None
+    ) -> Iterator[AlumniRecord]:
+        return self.source.iter_alumni(chunk_rows, statuses)
+
+    def update_status(self, row_index: int, status: str, notes: str = "") -> bool:
+        logger.debug("[DRY-RUN] %d. satırın durumu yazılmadı: %s", row_index + 2, status)
+        return True
+
+    def find_rows(self, linkedin_urls: Iterable[str], refresh: bool = False) -> Dict[str, Optional[int]]:
+        return self.source.find_rows(linkedin_urls, refresh)
+
+    def close(self):
+        self.source.close()
+
+
+class TableSource(AlumniSource):
+    """
+    Tüm tabloyu belleğe alan yerel dosya kaynakları için ortak taban.
+    Alt sınıflar sadece _load ve _save metodlarını yazar.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.headers, self.rows = self._load()
+        self._field_indexes = field_indexes_for(self.headers)
+        self._dirty_rows: Set[int] = set()
+        logger.info("Yerel kaynak açıldı: %s (%d satır)", self.path, len(self.rows))
+
+    @abstractmethod
+    def _load(self) -> Tuple[List[str], List[List[str]]]:
+        # (başlıklar, satırlar) döndürür.
+        pass
+
+    @abstractmethod
+    def _save(self, dirty_rows: Set[int]):
+        # Değişen satırları dosyaya yazar.
+        pass
+
+    def iter_alumni(
+        self,
+        chunk_rows: Optional[int] = None,
+        statuses: Optional[List[str]] = None
+    ) -> Iterator[AlumniRecord]:
+        status_index = self._field_indexes.get("status")
+        for row_num, values in enumerate(self.rows):
+            if not any(str(v).strip() for v in values):
+                continue
+            if statuses is not None and _cell(values, status_index).strip() not in statuses:
+                continue
+            yield AlumniRecord.from_row(self.headers, values, row_num, self._field_indexes)
+
+    def update_status(self, row_index: int, status: str, notes: str = "") -> bool:
+        status_index = self._field_indexes.get("status")
+        if status_index is None:
+            status_col_name = config.COLUMN_MAPPING.get("status", "Durum")
+            logger.warning("Durum sütunu '%s' bulunamadı", status_col_name)
+            return False
+        if not 0 <= row_index < len(self.rows):
+            logger.error("Durum güncelleme hatası: %d. satır yok", row_index)
+            return False
+
+        self._set_cell(row_index, status_index, status)
+        notes_index = self._field_indexes.get("notes")
+        if notes and notes_index is not None:
+            self._set_cell(row_index, notes_index, notes)
+
+        self._dirty_rows.add(row_index)
+        if len(self._dirty_rows) >= config.SHEETS_BATCH_SIZE:
+            self.flush_updates()
+        return True
+
+    def _set_cell(self, row_index: int, col: int, value: str):
+        row = self.rows[row_index]
+        row.extend([""] * (col + 1 - len(row)))
+        row[col] = value
+
+    def flush_updates(self) -> bool:
+        if not self._dirty_rows:
+            return True
+        try:
+            self._save(self._dirty_rows)
+            logger.debug("%d satır %s dosyasına yazıldı", len(self._dirty_rows), self.path.name)
+            self._dirty_rows = set()
+            return True
+        except Exception as e:
+            logger.error("Yerel kaynağa yazma hatası: %s", e)
+            return False
+
+    def pending_rows(self) -> Set[int]:
+        return set(self._dirty_rows)
+
+
+class CsvSource(TableSource):
+    """İlk satırı başlık olan UTF-8 CSV dosyası."""
+
+    def _load(self) -> Tuple[List[str], List[List[str]]]:
+        with open(self.path, mode="r", newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            headers = next(reader, [])
+            return headers, [row for row in reader]
+
+    def _save(self, dirty_rows: Set[int]):
+        # Yarım yazılmış dosya kalmasın diye önce geçici dosyaya yazılır
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, mode="w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.headers)
+            writer.writerows(self.rows)
+        os.replace(tmp_path, self.path)
+
+
+class ParquetSource(TableSource):
+    """Parquet dosyası (pandas ve pyarrow/fastparquet gerekir)."""
+
+    def _load(self) -> Tuple[List[str], List[List[str]]]:
+        import pandas as pd
+
+        df = pd.read_parquet(self.path).fillna("").astype(str)
+        return list(df.columns), df.values.tolist()
+
+    def _save(self, dirty_rows: Set[int]):
+        import pandas as pd
+
+        width = len(self.headers)
+        rows = [(row + [""] * width)[:width] for row in self.rows]
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        pd.DataFrame(rows, columns=self.headers).to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, self.path)
+
+
+class SqliteSource(TableSource):
+    """SQLite veritabanındaki bir tablo; satır sırası rowid sırasıdır."""
+
+    def __init__(self, path, table: str = "alumni"):
+        self.table = table
+        self._rowids: List[int] = []
+        super().__init__(path)
+
+    def _load(self) -> Tuple[List[str], List[List[str]]]:
+        with sqlite3.connect(str(self.path)) as conn:
+            cursor = conn.execute(f'SELECT rowid, * FROM "{self.table}" ORDER BY rowid')
+            headers = [d[0] for d in cursor.description[1:]]
+            rows = []
+            for rowid, *values in cursor:
+                self._rowids.append(rowid)
+                rows.append(["" if v is None else str(v) for v in values])
+        return headers, rows
+
+    def _save(self, dirty_rows: Set[int]):
+        # Sadece değişen satırlar güncellenir
+        assignments = ", ".join(f'"{h}" = ?' for h in self.headers)
+        width = len(self.headers)
+        params = [
+            (*(self.rows[r] + [""] * width)[:width], self._rowids[r])
+            for r in sorted(dirty_rows)
+        ]
+        with sqlite3.connect(str(self.path)) as conn:
+            conn.executemany(
+                f'UPDATE "{self.table}" SET {assignments} WHERE rowid = ?', params
+            )
+
+
+def _cell(values: List[str], index: Optional[int]) -> str:
+    if index is None or index >= len(values):
+        return ""
+    return str(values[index])
+
+
+def open_source(spec: str = "sheets") -> AlumniSource:
+    """
+    Komut satırı tanımından veri kaynağı oluşturur.
+
+    Args:
+        spec: 'sheets' | 'csv:<yol>' | 'parquet:<yol>' | 'sqlite:<yol>[#tablo]' |
+              'fake-sheets[:<csv yolu>]' (ağ olmadan, bellek içi Sheets API)
+
+    Returns:
+        Kullanıma hazır AlumniSource
+    """
+    kind, _, target = spec.partition(":")
+
+    if kind == "sheets":
+        from sheets_reader import GoogleSheetsReader
+        return GoogleSheetsReader()
+    if kind == "csv":
+        return CsvSource(target)
+    if kind == "parquet":
+        return ParquetSource(target)
+    if kind == "sqlite":
+        path, _, table = target.partition("#")
+        return SqliteSource(path, table or "alumni")
+    if kind == "fake-sheets":
+        from fake_sheets import FakeSheetsClient
+        from sheets_reader import GoogleSheetsReader
+        client = FakeSheetsClient.from_csv(target) if target else FakeSheetsClient()
+        return GoogleSheetsReader(client=client)
+
+    raise ValueError(f"Bilinmeyen veri kaynağı: {spec}")
+
+
+# ---------- OKUMA/YAZMA HIZ ÖLÇÜMÜ ----------
+
+if __name__ == "__main__":
+    import argparse
+    import tempfile
+    import time
+
+    parser = argparse.ArgumentParser(description="Veri kaynaklarının okuma/yazma hızını ölçer")
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Sahte Sheets API'de istek başına gecikme (saniye)")
+    args = parser.parse_args()
+
+    from fake_sheets import FakeSheetsClient, sample_rows
+
+    config.SHEETS_CACHE_ENABLED = False
+    headers = list(config.COLUMN_MAPPING.values())
+    rows = sample_rows(args.rows)
+    workdir = Path(tempfile.mkdtemp(prefix="alumni_bench_"))
+
+    def build_csv():
+        path = workdir / "alumni.csv"
+        with open(path, mode="w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(headers)
+            writer.writerows(rows)
+        return CsvSource(path)
+
+    def build_sqlite():
+        path = workdir / "alumni.sqlite3"
+        with sqlite3.connect(str(path)) as conn:
+            conn.execute(f"CREATE TABLE alumni ({', '.join(repr(h) for h in headers)})")
+            conn.executemany(f"INSERT INTO alumni VALUES ({', '.join('?' * len(headers))})", rows)
+        return SqliteSource(path)
+
+    def build_parquet():
+        import pandas as pd
+        path = workdir / "alumni.parquet"
+        pd.DataFrame(rows, columns=headers).to_parquet(path, index=False)
+        return ParquetSource(path)
+
+    def build_fake_sheets():
+        from sheets_reader import GoogleSheetsReader
+        client = FakeSheetsClient(headers, rows, latency=args.latency)
+        return GoogleSheetsReader(client=client)
+
+    print(f"{args.rows} satır ile ölçülüyor ({workdir})")
+    print(f"{'kaynak':<14}{'okuma (satır/s)':>18}{'yazma (güncelleme/s)':>24}{'API isteği':>12}")
+    for name, build in [
+        ("csv", build_csv),
+        ("sqlite", build_sqlite),
+        ("parquet", build_parquet),
+        ("fake-sheets", build_fake_sheets),
+    ]:
+        try:
+            source = build()
+        except ImportError as e:
+            print(f"{name:<14}atlandı ({e})")
+            continue
+
+        started = time.perf_counter()
+        count = sum(1 for _ in source.iter_alumni())
+        read_rate = count / (time.perf_counter() - started)
+
+        updates = range(0, args.rows, 10)
+        started = time.perf_counter()
+        for row_num in updates:
+            source.update_status(row_num, config.STATUS_SENT)
+        source.close()
+        write_rate = len(updates) / (time.perf_counter() - started)
+
+        client = getattr(source, "client", None)
+        requests = str(client.request_count) if isinstance(client, FakeSheetsClient) else "-"
+        print(f"{name:<14}{read_rate:>18,.0f}{write_rate:>24,.0f}{requests:>12}")
@@ -0,0 +1,264 @@
+"""
+Gönderici hesapların tarayıcılarını sürekli açık ve giriş yapılmış halde tutan yerel servis.
+main.py ve diğer araçlar Chrome'u sıfırdan açmak yerine bu tarayıcılara remote debugging
+adresi üzerinden bağlanır; açılış ve oturum kontrolü beklemesi ortadan kalkar.
+Tarayıcılar düzenli aralıklarla yoklanır, yanıt vermeyen tarayıcı yeniden açılır.
+
+    python driver_daemon.py --workers 2    # servisi başlat (ilk açılışta giriş yapın)
+    python driver_daemon.py --status
+    python driver_daemon.py --restart hesap1
+    python driver_daemon.py --stop
+"""
+import json
+import socket
+import socketserver
+import threading
+import time
+import urllib.request
+from typing import Dict, List, Optional
+from selenium import webdriver
+import config
+from linkedin_automation import chrome_options
+from logger_utils import setup_logger
+
+logger = setup_logger(__name__)
+
+# Adreste bunlardan biri varsa LinkedIn oturumu kapanmış demektir
+LOGGED_OUT_URL_MARKERS = ["login", "authwall", "checkpoint"]
+
+
+def request(command: Dict, timeout: float = 2.0) -> Optional[Dict]:
+    # Servise tek bir komut gönderir; servis çalışmıyorsa None döner.
+    try:
+        with socket.create_connection(("127.0.0.1", config.DRIVER_DAEMON_PORT), timeout=timeout) as sock:
+            sock.sendall((json.dumps(command) + "\n").encode("utf-8"))
+            with sock.makefile("r", encoding="utf-8") as f:
+                line = f.readline()
+        return json.loads(line) if line else None
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def browser_status(account: str) -> Optional[Dict]:
+    """
+    Servis bu hesabın tarayıcısını sağlıklı tutuyorsa durumu (debugger_address, logged_in, ...),
+    aksi halde None (tarayıcı sıfırdan açılmalı).
+    """
+    reply = request({"cmd": "status"})
+    browser = ((reply or {}).get("browsers") or {}).get(account)
+    if browser and browser.get("healthy"):
+        return browser
+    return None
+
+
+def debugger_address(account: str) -> Optional[str]:
+    # Bağlanılacak adres ("127.0.0.1:9223") ya da servis yoksa None.
+    browser = browser_status(account)
+    return browser["debugger_address"] if browser else None
+
+
+class WarmBrowser:
+    """
+    Bir gönderici hesabın açık tutulan tarayıcısı.
+
+    Args:
+        account: SENDER_ACCOUNTS girdisi (name, profile_path, debug_port)
+    """
+
+    def __init__(self, account: Dict):
+        self.name = account["name"]
+        self.profile_path = account["profile_path"]
+        self.debug_port = account["debug_port"]
+        self.driver = None
+        self.started: Optional[float] = None
+        self.logged_in = False
+        self.restarts = 0
+        self.failures = 0
+        self._lock = threading.Lock()
+
+    @property
+    def debugger_address(self) -> str:
+        return f"127.0.0.1:{self.debug_port}"
+
+    def start(self):
+        self.driver = webdriver.Chrome(options=chrome_options(self.profile_path, self.debug_port))
+        self.driver.set_page_load_timeout(config.PAGE_LOAD_TIMEOUT)
+        # Oturum ve sayfa önbelleği ilk bağlanan istemciden önce ısınsın
+        try:
+            self.driver.get("https://www.linkedin.com/feed/")
+            self.refresh_login()
+        except Exception as e:
+            logger.warning("%s: akış sayfası açılamadı: %s", self.name, e)
+        if not self.logged_in:
+            logger.warning("⚠️ %s: oturum açık değil, tarayıcıda giriş yapın", self.name)
+        self.started = time.time()
+        self.failures = 0
+
+    def refresh_login(self):
+        # Sayfa değiştirilmeden sadece açık sekmenin adresine bakılır; oturum düşmüşse
+        # LinkedIn her sayfayı giriş/authwall adresine yönlendirir
+        url = self.driver.current_url
+        self.logged_in = not any(marker in url for marker in LOGGED_OUT_URL_MARKERS)
+
+    def healthy(self) -> bool:
+        # Sadece DevTools uç noktası yoklanır; sayfaya dokunulmadığı için bağlı istemciyi etkilemez
+        try:
+            with urllib.request.urlopen(f"http://{self.debugger_address}/json/version", timeout=2) as resp:
+                return resp.status == 200
+        except OSError:
+            return False
+
+    def stop(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass  # Tarayıcı zaten kapanmış olabilir
+            self.driver = None
+
+    def restart(self):
+        with self._lock:
+            self.stop()
+            self.start()
+            self.restarts += 1
+
+    def status(self) -> Dict:
+        return {
+            "debugger_address": self.debugger_address,
+            "healthy": self.driver is not None and self.healthy(),
+            "logged_in": self.logged_in,
+            "uptime": round(time.time() - self.started, 1) if self.started else 0.0,
+            "restarts": self.restarts,
+        }
+
+
+class DriverDaemon:
+    """
+    Tarayıcıları açar, sağlık kontrolü yapar ve 127.0.0.1 üzerinde JSON satırlarıyla
+    komut kabul eder: status, restart (account), stop.
+
+    Args:
+        accounts: Açık tutulacak gönderici hesaplar
+        port: Kontrol soketi (varsayılan: config.DRIVER_DAEMON_PORT)
+        health_interval: Sağlık kontrolü aralığı (sn)
+    """
+
+    def __init__(self, accounts: List[Dict], port: Optional[int] = None, health_interval: Optional[float] = None):
+        self.browsers = {account["name"]: WarmBrowser(account) for account in accounts}
+        self.port = port or config.DRIVER_DAEMON_PORT
+        self.health_interval = health_interval or config.DRIVER_HEALTH_INTERVAL
+        self._stopping = threading.Event()
+        self._server: Optional[socketserver.ThreadingTCPServer] = None
+
+    def serve_forever(self):
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                try:
+                    command = json.loads(self.rfile.readline() or b"{}")
+                    reply = daemon.handle(command)
+                except Exception as e:
+                    reply = {"ok": False, "error": str(e)}
+                self.wfile.write((json.dumps(reply, ensure_ascii=False) + "\n").encode("utf-8"))
+
+        # Soket tarayıcılardan önce açılır: port doluysa tarayıcı açmadan hata verilir
+        self._server = socketserver.ThreadingTCPServer(("127.0.0.1", self.port), Handler)
+        self._server.daemon_threads = True
+
+        for browser in self.browsers.values():
+            browser.start()
+            logger.info("♨️ %s hazır (%s)", browser.name, browser.debugger_address)
+        threading.Thread(target=self._watch, name="driver-health", daemon=True).start()
+
+        logger.info("Tarayıcı servisi 127.0.0.1:%s üzerinde dinliyor", self.port)
+        try:
+            self._server.serve_forever()
+        finally:
+            self._stopping.set()
+            self._server.server_close()
+            for browser in self.browsers.values():
+                browser.stop()
+
+    def _watch(self):
+        while not self._stopping.wait(self.health_interval):
+            for browser in self.browsers.values():
+                if browser.healthy():
+                    browser.failures = 0
+                    was_logged_in = browser.logged_in
+                    try:
+                        browser.refresh_login()
+                    except Exception as e:
+                        logger.debug("%s: oturum durumu okunamadı: %s", browser.name, e)
+                    if was_logged_in and not browser.logged_in:
+                        logger.warning("⚠️ %s: oturum kapanmış, tarayıcıda tekrar giriş yapın", browser.name)
+                    continue
+                browser.failures += 1
+                if browser.failures < config.DRIVER_RESTART_AFTER:
+                    continue
+                logger.warning("🔁 %s yanıt vermiyor, yeniden açılıyor", browser.name)
+                try:
+                    browser.restart()
+                except Exception as e:
+                    logger.error("%s yeniden açılamadı: %s", browser.name, e)
+
+    def handle(self, command: Dict) -> Dict:
+        cmd = command.get("cmd")
+        if cmd == "status":
+            return {"ok": True, "browsers": {name: b.status() for name, b in self.browsers.items()}}
+        if cmd == "restart":
+            browser = self.browsers.get(command.get("account"))
+            if browser is None:
+                return {"ok": False, "error": f"Bilinmeyen hesap: {command.get('account')}"}
+            browser.restart()
+            return {"ok": True, "browsers": {browser.name: browser.status()}}
+        if cmd == "stop":
+            # Yanıt gönderildikten sonra kapanır
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+            return {"ok": True}
+        return {"ok": False, "error": f"Bilinmeyen komut: {cmd}"}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Giriş yapılmış tarayıcıları açık tutan servis")
+    parser.add_argument("--workers", type=int, default=1, help="Açık tutulacak gönderici hesap sayısı")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--status", action="store_true", help="Çalışan servisin durumu")
+    group.add_argument("--restart", metavar="HESAP", help="Hesabın tarayıcısını yeniden aç")
+    group.add_argument("--stop", action="store_true", help="Servisi ve tarayıcıları kapat")
+    args = parser.parse_args()
+
+    if args.status or args.restart or args.stop:
+        if args.status:
+            command = {"cmd": "status"}
+        elif args.restart:
+            command = {"cmd": "restart", "account": args.restart}
+        else:
+            command = {"cmd": "stop"}
+        reply = request(command, timeout=config.PAGE_LOAD_TIMEOUT)
+        if reply is None:
+            print("Servis çalışmıyor.")
+            raise SystemExit(1)
+        if not reply.get("ok"):
+            print(f"❌ {reply.get('error')}")
+            raise SystemExit(1)
+        for name, browser in (reply.get("browsers") or {}).items():
+            state = "✅" if browser["healthy"] else "❌"
+            login = "giriş yapılmış" if browser["logged_in"] else "giriş yok"
+            print(
+                f"{state} {name:<10}{browser['debugger_address']:<18}{login:<16}"
+                f"{browser['uptime']:>8.0f} sn  yeniden açılma: {browser['restarts']}"
+            )
+        raise SystemExit(0)
+
+    from campaign_runner import sender_accounts
+
+    if request({"cmd": "status"}) is not None:
+        print(f"Servis zaten çalışıyor (127.0.0.1:{config.DRIVER_DAEMON_PORT}).")
+        raise SystemExit(1)
+    try:
+        DriverDaemon(sender_accounts(args.workers)).serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,197 @@
+"""
+Google Sheets API'nin bellek içi taklidi (ağ bağlantısı olmadan test ve ölçüm için).
+GoogleSheetsReader'ın kullandığı gspread alt kümesini uygular.
+"""
+import csv
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+import gspread
+import config
+
+_A1_RE = re.compile(r"^([A-Z]*)(\d*)$")
+
+
+def _parse_a1(cell: str) -> Tuple[Optional[int], Optional[int]]:
+    # "B12" -> (12, 2); "B" -> (None, 2); "12" -> (12, None)
+    match = _A1_RE.match(cell.strip().upper())
+    if not match:
+        raise ValueError(f"Geçersiz A1 hücresi: {cell}")
+    letters, digits = match.groups()
+    col = 0
+    for ch in letters:
+        col = col * 26 + ord(ch) - 64
+    return (int(digits) if digits else None), (col or None)
+
+
+def sample_rows(count: int) -> List[List[str]]:
+    # COLUMN_MAPPING sırasına göre örnek mezun satırları üretir.
+    companies = ["Google", "Aselsan", "Turkcell", "Havelsan", "Trendyol", ""]
+    positions = ["Yazılım Mühendisi", "Proje Yöneticisi", "Ar-Ge Mühendisi", ""]
+    templates = {
+        "name": lambda i: f"Mezun {i}",
+        "linkedin_url": lambda i: f"https://www.linkedin.com/in/mezun-{i}",
+        "graduation_year": lambda i: str(2005 + i % 18),
+        "company": lambda i: companies[i % len(companies)],
+        "position": lambda i: positions[i % len(positions)],
+    }
+    return [
+        [templates.get(key, lambda i: "")(i) for key in config.COLUMN_MAPPING]
+        for i in range(count)
+    ]
+
+
+class FakeWorksheet:
+    """Tek bir çalışma sayfası; değerler satır listeleri olarak tutulur."""
+
+    def __init__(self, client: "FakeSheetsClient", title: str, values: List[List[str]]):
+        self.client = client
+        self.title = title
+        self.values = [list(row) for row in values]
+
+    @property
+    def row_count(self) -> int:
+        return max(len(self.values), 1000)
+
+    @property
+    def col_count(self) -> int:
+        return max((len(row) for row in self.values), default=26)
+
+    def _range(self, a1: str) -> List[List[str]]:
+        start, _, end = a1.partition(":")
+        row1, col1 = _parse_a1(start)
+        row2, col2 = _parse_a1(end or start)
+        row1, col1 = row1 or 1, col1 or 1
+        row2, col2 = row2 or self.row_count, col2 or self.col_count
+
+        result = [
+            [str(v) for v in row[col1 - 1:col2]]
+            for row in self.values[row1 - 1:row2]
+        ]
+        # Gerçek API gibi sondaki boş hücre ve satırları kırp
+        for row in result:
+            while row and row[-1] == "":
+                row.pop()
+        while result and not result[-1]:
+            result.pop()
+        return result
+
+    def row_values(self, row: int) -> List[str]:
+        self.client._request()
+        rows = self._range(f"A{row}:{row}")
+        return rows[0] if rows else []
+
+    def get(self, range_name: str) -> List[List[str]]:
+        self.client._request()
+        return self._range(range_name)
+
+    def batch_get(self, ranges: List[str]) -> List[List[List[str]]]:
+        self.client._request()
+        return [self._range(r) for r in ranges]
+
+    def get_all_values(self) -> List[List[str]]:
+        self.client._request()
+        return self._range(f"A1:{len(self.values)}")
+
+    def batch_update(self, data: List[Dict], **kwargs):
+        self.client._request()
+        with self.client.lock:
+            for item in data:
+                row1, col1 = _parse_a1(item["range"].partition(":")[0])
+                for r, row_values in enumerate(item["values"]):
+                    for c, value in enumerate(row_values):
+                        self._set(row1 + r, col1 + c, value)
+            self.client._touch()
+
+    def update_cell(self, row: int, col: int, value):
+        self.client._request()
+        with self.client.lock:
+            self._set(row, col, value)
+            self.client._touch()
+
+    def _set(self, row: int, col: int, value):
+        while len(self.values) < row:
+            self.values.append([])
+        cells = self.values[row - 1]
+        cells.extend([""] * (col - len(cells)))
+        cells[col - 1] = "" if value is None else str(value)
+
+
+class FakeSpreadsheet:
+    def __init__(self, client: "FakeSheetsClient", title: str):
+        self.client = client
+        self.title = title
+        self.id = f"fake-{title}"
+        self.worksheets: Dict[str, FakeWorksheet] = {}
+
+    def worksheet(self, title: str) -> FakeWorksheet:
+        self.client._request()
+        if title not in self.worksheets:
+            raise gspread.WorksheetNotFound(title)
+        return self.worksheets[title]
+
+
+class _FakeResponse:
+    def __init__(self, payload: Dict):
+        self._payload = payload
+
+    def json(self) -> Dict:
+        return self._payload
+
+
+class FakeSheetsClient:
+    """
+    gspread.Client yerine geçer. İstek sayısını tutar ve istenirse her isteğe gecikme ekler.
+    """
+
+    def __init__(
+        self,
+        headers: Optional[List[str]] = None,
+        rows: Optional[List[List[str]]] = None,
+        latency: float = 0.0
+    ):
+        self.latency = latency
+        self.request_count = 0
+        self.lock = threading.Lock()
+        self._version = 0
+        # Her sahte istemci farklı bir başlangıç zamanı kullanır; aksi halde diskteki
+        # anlık görüntü başka bir sahte e-tablonun verisini güncel sanabilir
+        self._created = datetime.now(timezone.utc)
+
+        spreadsheet = FakeSpreadsheet(self, config.SPREADSHEET_NAME)
+        values = [headers or list(config.COLUMN_MAPPING.values())] + (rows or [])
+        spreadsheet.worksheets[config.WORKSHEET_NAME] = FakeWorksheet(
+            self, config.WORKSHEET_NAME, values
+        )
+        self.spreadsheets: Dict[str, FakeSpreadsheet] = {spreadsheet.title: spreadsheet}
+
+    @classmethod
+    def from_csv(cls, path, latency: float = 0.0) -> "FakeSheetsClient":
+        # İlk satırı başlık olan bir CSV dosyasıyla doldurulmuş sahte e-tablo oluşturur.
+        with open(path, mode="r", newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            headers = next(reader, [])
+            return cls(headers, list(reader), latency=latency)
+
+    def _request(self):
+        with self.lock:
+            self.request_count += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _touch(self):
+        self._version += 1
+
+    def open(self, title: str) -> FakeSpreadsheet:
+        self._request()
+        if title not in self.spreadsheets:
+            raise gspread.SpreadsheetNotFound(title)
+        return self.spreadsheets[title]
+
+    def request(self, method: str, endpoint: str, params: Optional[Dict] = None, **kwargs):
+        # Sadece Drive 'modifiedTime' sorgusu desteklenir
+        self._request()
+        modified = self._created + timedelta(microseconds=self._version)
+        return _FakeResponse({"modifiedTime": modified.isoformat().replace("+00:00", "Z")})
@@ -0,0 +1,217 @@
+"""
+Kampanyanın çökmeye dayanıklı, sadece sona eklenen (append-only) günlüğü.
+Her mezun için önce 'attempted', gönderimden sonra 'sent'/'failed', durum e-tabloya
+ulaştığında 'written' kaydı düşülür. Açılışta günlük okunarak e-tabloya yazılamamış
+durumlar tekrar gönderilir ve daha önce mesaj atılmış kişiler atlanır.
+
+Durum için:
+    python journal.py
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+import config
+from linkedin_urls import normalize_linkedin_url
+from logger_utils import setup_logger
+
+logger = setup_logger(__name__)
+
+# fsync gerektiren olaylar ('critical' politikasında)
+_CRITICAL_EVENTS = {"attempted", "sent", "failed"}
+
+
+class JournalState:
+    """
+    Günlüğün okunmuş hali (anahtar: normalize edilmiş LinkedIn URL'si).
+
+    handled: Mesaj gönderilmiş ya da sonucu belirsiz kişiler (tekrar gönderilmez)
+    unwritten: Sonucu belli ama e-tabloya yazıldığı doğrulanmamış kişiler -> (satır, durum)
+    uncertain: Denenmiş ama sonucu kaydedilmemiş kişiler (gönderim sırasında çökme) -> satır
+    """
+
+    def __init__(self):
+        self.handled = set()
+        self.unwritten: Dict[str, Tuple[int, str]] = {}
+        self.uncertain: Dict[str, int] = {}
+
+    def is_handled(self, linkedin_url: str) -> bool:
+        return normalize_linkedin_url(linkedin_url) in self.handled
+
+
+class CampaignJournal:
+    """
+    JSONL günlük dosyası. Farklı iş parçacıklarından yazılabilir.
+
+    Args:
+        path: Günlük dosyası (varsayılan: config.JOURNAL_PATH)
+        fsync_policy: 'always' | 'critical' | 'never' (varsayılan: config.JOURNAL_FSYNC)
+    """
+
+    def __init__(self, path: Optional[Path] = None, fsync_policy: Optional[str] = None):
+        self.path = Path(path or config.JOURNAL_PATH)
+        self.fsync_policy = fsync_policy or config.JOURNAL_FSYNC
+        self._lock = threading.Lock()
+        self._file = None
+
+    def _append(self, event: str, person, **fields):
+        entry = {
+            "ts": round(time.time(), 3),
+            "event": event,
+            "url": normalize_linkedin_url(person.linkedin_url),
+            "row": person.row_num,
+            **fields
+        }
+        line = json.dumps(entry, ensure_ascii=False)
+
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, mode="a", encoding="utf-8")
+            self._file.write(line + "\n")
+            self._file.flush()
+            # 'critical': mesajın gönderilip gönderilmediğini gösteren kayıtlar diske inmeden devam edilmez.
+            # 'written' kaydı kaybolursa en kötü ihtimalle durum bir kez daha yazılır.
+            if self.fsync_policy == "always" or (
+                self.fsync_policy == "critical" and event in _CRITICAL_EVENTS
+            ):
+                os.fsync(self._file.fileno())
+
+    def attempted(self, person, worker: str = ""):
+        # Tarayıcıda gönderime başlamadan hemen önce çağrılır.
+        self._append("attempted", person, worker=worker)
+
+    def finished(self, person, sent: bool, status: str, worker: str = ""):
+        # Gönderim sonucu ve e-tabloya yazılacak durum.
+        self._append("sent" if sent else "failed", person, status=status, worker=worker)
+
+    def written(self, people: Iterable):
+        # Durumları e-tabloya ulaştığı doğrulanan kişiler.
+        for person in people:
+            self._append("written", person)
+
+    def replay(self) -> JournalState:
+        # Günlüğü baştan sona okuyup her kişinin son durumunu çıkarır.
+        state = JournalState()
+        if not self.path.exists():
+            return state
+
+        with open(self.path, mode="r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Çökme anında yarım kalmış son satır
+                url, row, event = entry.get("url", ""), entry.get("row"), entry.get("event")
+
+                if event == "attempted":
+                    state.handled.add(url)
+                    state.uncertain[url] = row
+                elif event in ("sent", "failed"):
+                    # Başarısız gönderimler tekrar kuyruğuna (retry_queue.py) kalır, atlanmaz
+                    if event == "sent":
+                        state.handled.add(url)
+                    else:
+                        state.handled.discard(url)
+                    state.uncertain.pop(url, None)
+                    state.unwritten[url] = (row, entry.get("status", ""))
+                elif event == "written":
+                    state.unwritten.pop(url, None)
+        return state
+
+    def recover(self, source) -> JournalState:
+        """
+        Açılışta çağrılır: e-tabloya ulaşmamış durumları tek toplu yazımla gönderir,
+        yazıldığı doğrulananları işaretler ve günlüğü sadece açık kayıtlarla yeniden yazar.
+
+        Args:
+            source: AlumniSource
+
+        Returns:
+            JournalState (atlanacak kişiler için is_handled kullanılır)
+        """
+        state = self.replay()
+        for url, row in state.uncertain.items():
+            logger.warning(
+                "⚠️ %s (%d. satır): gönderim sırasında kesildi, mesaj gitmiş olabilir; tekrar gönderilmeyecek",
+                url, row + 2
+            )
+
+        if state.unwritten:
+            # Çökmeden sonra satırlar eklenmiş, silinmiş ya da sıralanmış olabilir: kayıtlı satır
+            # numarasına değil, URL'nin e-tablodaki güncel satırına yazılır
+            current = source.find_rows(list(state.unwritten), refresh=True)
+            queued = {}
+            for url, (row, status) in list(state.unwritten.items()):
+                new_row = current.get(url)
+                if new_row is None:
+                    logger.warning(
+                        "⚠️ %s (%d. satır) e-tabloda bulunamadı; '%s' durumu yazılmadı", url, row + 2, status
+                    )
+                    continue
+                if new_row != row:
+                    logger.info("%s %d. satırdan %d. satıra taşınmış", url, row + 2, new_row + 2)
+                    state.unwritten[url] = (new_row, status)
+                if source.update_status(new_row, status):
+                    queued[url] = (new_row, status)
+            source.flush_updates()
+            pending = source.pending_rows()
+            written = {url: entry for url, entry in queued.items() if entry[0] not in pending}
+            for url in written:
+                del state.unwritten[url]
+            logger.info("📒 Günlükten %d durum e-tabloya yazıldı", len(written))
+
+        self.compact(state)
+        return state
+
+    def compact(self, state: JournalState):
+        # Durumu e-tabloya ulaşmış kişilerin kayıtlarına artık gerek yok; açık olanlar korunur.
+        now = round(time.time(), 3)
+        entries = [
+            {"ts": now, "event": "attempted", "url": url, "row": row}
+            for url, row in state.uncertain.items()
+        ] + [
+            {"ts": now, "event": "sent" if status == config.STATUS_SENT else "failed",
+             "url": url, "row": row, "status": status}
+            for url, (row, status) in state.unwritten.items()
+        ]
+
+        with self._lock:
+            self._close_file()
+            # Yarım yazılmış dosya kalmasın diye önce geçici dosyaya yazılır
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, mode="w", encoding="utf-8") as f:
+                for entry in entries:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def close(self):
+        with self._lock:
+            self._close_file()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Kampanya günlüğünün durumu")
+    parser.add_argument("--file", type=Path, default=None, help="Günlük dosyası")
+    args = parser.parse_args()
+
+    state = CampaignJournal(args.file).replay()
+    print(f"Gönderilmiş / sonucu belirsiz kişi: {len(state.handled)}")
+    print(f"E-tabloya yazılmayı bekleyen durum: {len(state.unwritten)}")
+    for url, (row, status) in state.unwritten.items():
+        print(f"  {row + 2}. satır  {status:<12} {url}")
+    print(f"Sonucu belirsiz (gönderim sırasında kesilmiş): {len(state.uncertain)}")
+    for url, row in state.uncertain.items():
+        print(f"  {row + 2}. satır  {url}")
+    if state.uncertain:
+        print("Bu kişilere tekrar mesaj atılması için günlükteki satırlarını silin.")
@@ -5,12 +5,15 @@ import time
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException, WebDriverException
 import config
+import outcomes
 from logger_utils import setup_logger
+from metrics import get_recorder, span, timed
+from selector_engine import SelectorEngine
+from wait_engine import AdaptiveWaiter, element_enabled, element_text_empty, is_focused, url_contains_any
 
 logger = setup_logger(__name__)
 
@@ -53,188 +56,301 @@ SELECTORS = {
     ]
 }
 
+# Profil kaldırılmış/bulunamamışsa LinkedIn bu adreslere yönlendirir
+PROFILE_MISSING_URL_MARKERS = ["/404", "/in/unavailable", "/pub/dir/"]
+
+def chrome_options(profile_path, debug_port, load_profile=None) -> Options:
+    # Bot ve sürekli açık tarayıcı servisi (driver_daemon.py) Chrome'u aynı ayarlarla açar
+    options = Options()
+    _apply_load_strategy(options, load_profile)
+    if profile_path:
+        options.add_argument(f"user-data-dir={profile_path}")
+        if config.CHROME_PROFILE_NAME:
+            options.add_argument(f"profile-directory={config.CHROME_PROFILE_NAME}")
+    
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("--disable-infobars")
+    options.add_argument(f"--remote-debugging-port={debug_port}")
+    options.add_argument(f"--window-size={config.BROWSER_WIDTH},{config.BROWSER_HEIGHT}")
+    if config.HEADLESS_MODE:
+        options.add_argument("--headless=new")
+    return options
+
+
+def _apply_load_strategy(options: Options, load_profile=None):
+    # 'light': driver.get DOMContentLoaded'da döner; görsel ve betiklerin bitmesi beklenmez
+    if (load_profile or config.PAGE_LOAD_PROFILE) == "light":
+        options.page_load_strategy = "eager"
+
+
 class LinkedInAutomation:
-    def __init__(self):
-        self.profile_path = config.CHROME_PROFILE_PATH
+    def __init__(
+        self, profile_path=None, debug_port=None, selector_stats=None, debugger_address=None, load_profile=None
+    ):
+        # Paralel çalışmada her tarayıcı kendi profil klasörünü ve portunu kullanır
+        self.profile_path = profile_path or config.CHROME_PROFILE_PATH
+        self.debug_port = debug_port or config.CHROME_DEBUG_PORT
+        self.selector_stats = selector_stats
+        # Verilirse yeni Chrome açılmaz, driver_daemon.py'nin açık tuttuğu tarayıcıya bağlanılır ("127.0.0.1:9223")
+        self.debugger_address = debugger_address
+        # 'full' | 'light' (config.PAGE_LOAD_PROFILE)
+        self.load_profile = load_profile or config.PAGE_LOAD_PROFILE
         self._setup_browser()
     
     def _setup_browser(self):
-        options = Options()
-        if self.profile_path:
-            options.add_argument(f"user-data-dir={self.profile_path}")
-            if config.CHROME_PROFILE_NAME:
-                options.add_argument(f"profile-directory={config.CHROME_PROFILE_NAME}")
-        
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("--disable-infobars")
-        options.add_argument("--remote-debugging-port=9223") 
-        options.add_argument(f"--window-size={config.BROWSER_WIDTH},{config.BROWSER_HEIGHT}")
+        if self.debugger_address:
+            options = Options()
+            options.add_experimental_option("debuggerAddress", self.debugger_address)
+            _apply_load_strategy(options, self.load_profile)
+        else:
+            options = chrome_options(self.profile_path, self.debug_port, self.load_profile)
         
         self.driver = webdriver.Chrome(options=options)
-        self.wait = WebDriverWait(self.driver, 8)
+        if self.load_profile == "light":
+            self._block_heavy_resources()
+        self.driver.set_page_load_timeout(config.PAGE_LOAD_TIMEOUT)
+        self.waiter = AdaptiveWaiter(self.driver)
+        # Seçici grupları tek execute_script çağrısıyla çözülür
+        self.selectors = SelectorEngine(self.driver, SELECTORS, self.selector_stats)
+
+    def _block_heavy_resources(self):
+        # Engelleme bu sürücünün DevTools oturumuna bağlıdır; açık tarayıcıya bağlanınca da yeniden kurulur
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": config.LIGHT_LOAD_BLOCKED_URLS})
+        except Exception as e:
+            logger.warning("Kaynak engelleme kurulamadı, sayfalar tam yüklenecek: %s", e)
 
     def check_login_status(self):
         try:
             self.driver.get("https://www.linkedin.com/feed/")
-            time.sleep(3)
-            return "login" not in self.driver.current_url
+            # Sabit bekleme yerine: akışa ya da giriş sayfasına yönlendirilene kadar
+            landed = self.waiter.until(
+                "login_check", url_contains_any(["login", "authwall", "checkpoint", "/feed"])
+            )
+            if landed is None:
+                return "login" not in self.driver.current_url
+            return landed == "/feed"
         except: return False
 
     def safe_click(self, element):
         try:
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-            time.sleep(0.3)
+            # Animasyonsuz kaydırma: tıklamadan önce beklemeye gerek kalmaz
+            self.driver.execute_script(
+                "arguments[0].scrollIntoView({block: 'center', behavior: 'instant'});", element
+            )
             element.click()
         except:
             try:
                 self.driver.execute_script("arguments[0].click();", element)
             except: pass
 
+    @timed("send.nuke_chats")
     def nuke_all_chats(self):
         """
         Ekranda ne kadar sohbet penceresi varsa hepsini kapatır.
+        Her turda tüm görünür kapatma butonları tek istekte bulunup tıklanır.
         """
         logger.info("🧹 Temizlik başlıyor: Tüm sohbetler kapatılıyor...")
         max_attempts = 5 # Sonsuz döngüye girmesin
         for _ in range(max_attempts):
-            found_any = False
-            for xpath in SELECTORS["chat_close_buttons"]:
-                try:
-                    buttons = self.driver.find_elements(By.XPATH, xpath)
-                    for btn in buttons:
-                        if btn.is_displayed():
-                            self.safe_click(btn)
-                            found_any = True
-                            time.sleep(0.3) # Animasyon bekle
-                except: pass
+            try:
+                clicked = self.selectors.click_all("chat_close_buttons")
+            except:
+                clicked = 0
             
-            if not found_any:
+            if not clicked:
                 break # Hiç buton kalmadıysa döngüyü kır
-        
-        time.sleep(1) # Emin olmak için bekle
+            
+            # Animasyonun bitmesini (butonların kaybolmasını) bekle
+            self.waiter.until("chats_closed", self.selectors.none_visible("chat_close_buttons"))
 
+    @timed("send.popups")
     def handle_popups(self):
         try:
-            for xpath in SELECTORS["popup_close_buttons"]:
-                elements = self.driver.find_elements(By.XPATH, xpath)
-                for el in elements:
-                    if el.is_displayed():
-                        self.safe_click(el)
-                        time.sleep(0.5)
+            if self.selectors.click_all("popup_close_buttons"):
+                self.waiter.until("popup_closed", self.selectors.none_visible("popup_close_buttons"))
         except: pass
 
     def get_first_name(self):
         """Profildeki H1 başlığından ilk ismi alır."""
         try:
-            for xpath in SELECTORS["profile_name_h1"]:
-                elements = self.driver.find_elements(By.XPATH, xpath)
-                if elements:
-                    full_name = elements[0].text.strip()
-                    return full_name.split()[0] 
+            match = self.selectors.first("profile_name_h1")
+            if match and match.text:
+                return match.text.split()[0]
             return None
         except: return None
 
+    def _find_bubble_textbox(self, target_name):
+        # Başlığında hedefin ismi geçen kutu önce denenir; genel kutu araması aynı istekte yedek aday olur.
+        # Kutu açılana kadar beklenir.
+        candidates = ["div[role='textbox']"]
+        if target_name:
+            # Başlığında isim geçen pencerenin içindeki textbox
+            target_xpath = f"//div[contains(@class, 'msg-overlay-conversation-bubble') and .//h2[contains(., '{target_name}')]]//div[@role='textbox']"
+            candidates.insert(0, target_xpath)
+        
+        match = self.waiter.until("message_bubble", self.selectors.visible("message_bubble", candidates))
+        if not match:
+            return None
+        
+        if target_name and match.index == 0:
+            logger.info("🎯 %s için doğru kutu bulundu.", target_name)
+        elif target_name:
+            # LinkedIn yeni pencereyi genelde ilk sıraya (sola) koyar
+            logger.warning("⚠️ İsimle bulunamadı, ilk sıradaki kutu seçildi.")
+        return match.element
+
     def send_message_fast(self, url, message):
+        # Toplam süre sonuçla birlikte kaydedilir; adımlar ayrı ayrı ölçülür
+        started = time.perf_counter()
+        result = self._send_message_steps(url, message)
+        get_recorder().record(
+            "send.total", time.perf_counter() - started, outcome=result.status, reason=result.reason
+        )
+        return result
+
+    def _missing_profile_reason(self, heading):
+        # Başlık varsa profil açılmıştır; yoksa LinkedIn'in "profil yok" sayfasına mı yönlendirildik?
+        if heading:
+            return outcomes.NO_MESSAGE_BUTTON
+        try:
+            current = self.driver.current_url
+        except WebDriverException:
+            return outcomes.PROFILE_NOT_LOADED
+        if any(marker in current for marker in PROFILE_MISSING_URL_MARKERS):
+            return outcomes.PROFILE_NOT_FOUND
+        return outcomes.PROFILE_NOT_LOADED
+
+    def _send_message_steps(self, url, message):
         try:
             # ADIM 0: ÖNCEKİ PİSLİKLERİ TEMİZLE
             self.nuke_all_chats()
 
-            logger.info(f"Profil açılıyor: {url}")
-            self.driver.get(url)
-            time.sleep(5)
+            logger.info("Profil açılıyor: %s", url)
+            with span("send.navigate"):
+                self.driver.get(url)
+                self.selectors.set_page(url)
+                # Sabit bekleme yerine profil başlığı görünene kadar bekle
+                heading = self.waiter.until("profile_load", self.selectors.visible("profile_name_h1"))
             
             # ADIM 0.5: SAYFA YÜKLENİNCE TEKRAR TEMİZLE (Otomatik açılan varsa)
             self.handle_popups()
             self.nuke_all_chats()
 
-            # Profil ismini al (Doğrulama için)
-            target_name = self.get_first_name()
-            logger.info(f"Hedef Kişi: {target_name}")
-
-            # ADIM 1: MESAJ BUTONUNA TIKLA
-            msg_btn = None
-            for xpath in SELECTORS["primary_message_button"]:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, xpath)
-                    for el in elements:
-                        if el.is_displayed():
-                            msg_btn = el
-                            break
-                    if msg_btn: break
-                except: continue
+            # Profil ismini al (Doğrulama için) - başlık metni bekleme sırasında zaten alındı
+            if heading and heading.text:
+                target_name = heading.text.split()[0]
+            else:
+                target_name = self.get_first_name()
+            logger.info("Hedef Kişi: %s", target_name)
+
+            # ADIM 1: MESAJ BUTONUNA TIKLA (görünür olana kadar yokla)
+            with span("send.find_button"):
+                msg_btn = self.waiter.until(
+                    "message_button", self.selectors.visible("primary_message_button")
+                )
             
             if msg_btn:
                 logger.info("✅ Profildeki Mesaj butonuna tıklanıyor...")
-                self.safe_click(msg_btn)
-                time.sleep(3) 
+                self.safe_click(msg_btn.element)
             else:
-                logger.error("❌ Mesaj butonu bulunamadı.")
-                return 'error'
+                reason = self._missing_profile_reason(heading)
+                logger.error("❌ Mesaj butonu bulunamadı (%s).", reason)
+                return outcomes.failed(reason)
 
             # ADIM 2: DOĞRU KUTUYU BUL (İSİM EŞLEŞTİRME)
-            # Sadece başlığında hedefin ismi geçen kutuyu arıyoruz
-            textbox = None
-            try:
-                if target_name:
-                    # Başlığında isim geçen pencerenin içindeki textbox
-                    target_xpath = f"//div[contains(@class, 'msg-overlay-conversation-bubble') and .//h2[contains(., '{target_name}')]]//div[@role='textbox']"
-                    textbox = self.driver.find_element(By.XPATH, target_xpath)
-                    logger.info(f"🎯 {target_name} için doğru kutu bulundu.")
-                else:
-                    # İsim alamazsak aktif elementi dene
-                    textbox = self.driver.switch_to.active_element
-            except:
-                # Bulamazsa genel arama yap ve sonuncuyu (en yeniyi) al
-                try:
-                    all_boxes = self.driver.find_elements(By.CSS_SELECTOR, "div[role='textbox']")
-                    visible_boxes = [b for b in all_boxes if b.is_displayed()]
-                    if visible_boxes:
-                        textbox = visible_boxes[0] # LinkedIn yeni pencereyi genelde ilk sıraya (sola) koyar umarım yani??
-                        logger.warning("⚠️ İsimle bulunamadı, ilk sıradaki kutu seçildi.")
-                except: pass
+            with span("send.open_bubble"):
+                textbox = self._find_bubble_textbox(target_name)
 
             if not textbox:
                 logger.error("❌ Sohbet kutusu bulunamadı/açılmadı.")
-                return 'error'
-
-            # Kutuya tıkla
-            self.safe_click(textbox)
-            time.sleep(0.5)
-
-            # ADIM 3: YAZ VE TETİKLE
-            logger.info("Mesaj yazılıyor...")
-            textbox.clear()
-            textbox.send_keys(message)
-            time.sleep(0.5)
-            # Tetikleyici (Trigger)
-            textbox.send_keys(" ") 
-            textbox.send_keys(Keys.BACKSPACE)
-            time.sleep(1)
+                return outcomes.failed(outcomes.BUBBLE_NOT_OPENED)
+
+            with span("send.type"):
+                # Kutuya tıkla ve odaklanmasını bekle
+                self.safe_click(textbox)
+                self.waiter.until("textbox_focus", is_focused(textbox))
+
+                # ADIM 3: YAZ VE TETİKLE
+                logger.info("Mesaj yazılıyor...")
+                textbox.clear()
+                textbox.send_keys(message)
+                # Tetikleyici (Trigger)
+                textbox.send_keys(" ") 
+                textbox.send_keys(Keys.BACKSPACE)
 
             # ADIM 4: GÖNDER (FORM İÇİ BUTON)
             # Textbox'ın bağlı olduğu formu bul, onun butonuna bas
             try:
                 parent_form = textbox.find_element(By.XPATH, "./ancestor::form")
                 send_btn = parent_form.find_element(By.XPATH, ".//button[@type='submit']")
+            except WebDriverException:
+                logger.error("❌ Form butonu bulunamadı.")
+                return outcomes.failed(outcomes.FORM_NOT_FOUND)
                 
-                if send_btn and send_btn.is_enabled():
+            # Buton, LinkedIn metni işleyip aktif edene kadar beklenir
+            with span("send.submit"):
+                enabled = self.waiter.until("send_enabled", element_enabled(send_btn))
+                if enabled:
                     logger.info("📤 Gönderiliyor...")
                     self.safe_click(send_btn)
-                    time.sleep(2)
-                    
-                    # İŞLEM BİTİNCE KAPAT (Temizlik)
-                    self.nuke_all_chats()
-                    return 'sent'
-                else:
-                    logger.error("❌ Gönder butonu aktif değil.")
-                    return 'error'
-            except:
-                logger.error("❌ Form butonu bulunamadı.")
-                return 'error'
+                    # Mesaj kutusu boşalınca gönderim tamamlanmış demektir
+                    self.waiter.until("send_done", element_text_empty(textbox))
+            
+            if not enabled:
+                logger.error("❌ Gönder butonu aktif değil.")
+                return outcomes.failed(outcomes.SEND_DISABLED)
+            
+            # İŞLEM BİTİNCE KAPAT (Temizlik) - mesaj gitti; temizlikteki hata sonucu değiştirmez
+            try:
+                self.nuke_all_chats()
+            except WebDriverException:
+                pass
+            return outcomes.sent()
 
+        except TimeoutException as e:
+            logger.error("Zaman aşımı: %s", e.msg)
+            return outcomes.failed(outcomes.TIMEOUT, e.msg or "")
+        except WebDriverException as e:
+            logger.error("Tarayıcı hatası: %s", e.msg)
+            return outcomes.failed(outcomes.DRIVER_ERROR, e.msg or "")
         except Exception as e:
-            logger.error(f"Hata: {e}")
-            return 'error'
+            logger.error("Hata: %s", e)
+            return outcomes.failed(outcomes.UNKNOWN, str(e))
+
+    def close(self):
+        self.selectors.close()
+        if not self.driver:
+            return
+        if self.debugger_address:
+            # Tarayıcı driver_daemon.py'ye ait: quit() onu da kapatırdı, sadece chromedriver durdurulur
+            try:
+                self.driver.service.stop()
+            except Exception:
+                pass
+            self.driver = None
+            return
+        self.driver.quit()
+
+
+class DryRunAutomation:
+    """
+    Tarayıcı açmadan LinkedInAutomation arayüzünü taklit eder (main.py --dry-run).
+    Mesajlar sadece loglanır; yerel veri kaynaklarıyla uçtan uca deneme için kullanılır.
+    """
+
+    def __init__(
+        self, profile_path=None, debug_port=None, selector_stats=None, debugger_address=None, load_profile=None
+    ):
+        pass
+
+    def check_login_status(self):
+        return True
+
+    def send_message_fast(self, url, message):
+        logger.info("[DRY-RUN] %s adresine %d karakterlik mesaj gönderilmiş sayıldı", url, len(message))
+        return outcomes.sent()
 
     def close(self):
-        if self.driver: self.driver.quit()
\ No newline at end of file
+        pass
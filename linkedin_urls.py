@@ -0,0 +1,18 @@
+"""
+LinkedIn profil adreslerinin kanonik biçimi.
+Günlük, kampanya logu, tekrar kuyruğu ve e-tablo dizini aynı anahtarı kullanır;
+bu modül gspread'e bağımlı olmadığı için her yerden içe aktarılabilir.
+"""
+import re
+
+# "https://tr.linkedin.com/in/ad-soyad/?trk=..." -> "linkedin.com/in/ad-soyad"
+URL_SCHEME_RE = re.compile(r"^[a-z][a-z0-9+.-]*://")
+LINKEDIN_HOST_RE = re.compile(r"^(?:[a-z]{2,3}\.|www\.|m\.)?linkedin\.com(?=/|$)")
+
+
+def normalize_linkedin_url(url: str) -> str:
+    # URL'yi karşılaştırma için kanonik biçime getirir (şema, alt alan adı, sorgu ve sondaki / atılır).
+    url = str(url or "").strip().lower()
+    url = URL_SCHEME_RE.sub("", url)
+    url = url.split("?", 1)[0].split("#", 1)[0].rstrip("/")
+    return LINKEDIN_HOST_RE.sub("linkedin.com", url)
@@ -0,0 +1,181 @@
+"""
+Log dosyalarının boyut ve gün bazında döndürülmesi (rotation) ve eski parçaların sıkıştırılması.
+Okuyucular döndürülmüş ve sıkıştırılmış parçalar dahil tüm geçmişi tek akış olarak okuyabilir.
+
+Kampanya özeti için:
+    python log_rotation.py
+"""
+import csv
+import gzip
+import logging
+import os
+import re
+import shutil
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
+import config
+
+
+def _extension() -> str:
+    return ".zst" if config.LOG_ARCHIVE_COMPRESSION == "zstd" else ".gz"
+
+
+def should_rotate(path: Path, size: Optional[int] = None) -> bool:
+    """
+    Dosya LOG_ROTATE_MAX_BYTES'ı aştıysa ya da (LOG_ROTATE_DAILY ise) son yazımı bugünden
+    önceyse True döner.
+
+    Args:
+        path: Aktif log dosyası
+        size: Bilinen güncel boyut (açık dosyanın tell() değeri); verilmezse stat ile okunur
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return False
+    size = stat.st_size if size is None else size
+    if config.LOG_ROTATE_MAX_BYTES and size >= config.LOG_ROTATE_MAX_BYTES:
+        return True
+    if config.LOG_ROTATE_DAILY and size:
+        return date.fromtimestamp(stat.st_mtime) < date.today()
+    return False
+
+
+def rotate(path: Path) -> Path:
+    """
+    Aktif dosyayı son yazım zamanını taşıyan bir parçaya taşır ve sıkıştırır.
+    Örn. campaign_log.csv -> campaign_log.20261016-235959.csv.gz
+
+    Returns:
+        Arşivlenmiş parçanın yolu
+    """
+    stamp = datetime.fromtimestamp(path.stat().st_mtime).strftime("%Y%m%d-%H%M%S")
+    target = path.with_name(f"{path.stem}.{stamp}{path.suffix}")
+    counter = 1
+    while target.exists() or Path(str(target) + _extension()).exists():
+        target = path.with_name(f"{path.stem}.{stamp}-{counter}{path.suffix}")
+        counter += 1
+
+    os.replace(path, target)
+    return compress(target)
+
+
+def compress(path: Path) -> Path:
+    # Parçayı sıkıştırıp asıl dosyayı siler; zstd seçiliyse zstandard paketi gerekir.
+    archive = Path(str(path) + _extension())
+    tmp_path = Path(str(archive) + ".tmp")
+    with open(path, mode="rb") as src:
+        if config.LOG_ARCHIVE_COMPRESSION == "zstd":
+            import zstandard
+
+            with open(tmp_path, mode="wb") as dst:
+                zstandard.ZstdCompressor().copy_stream(src, dst)
+        else:
+            with gzip.open(tmp_path, mode="wb") as dst:
+                shutil.copyfileobj(src, dst)
+    os.replace(tmp_path, archive)
+    os.remove(path)
+    return archive
+
+
+def _segment_key(path: Path) -> Tuple[str, int]:
+    # "stem.20261016-235959-2.csv.gz" -> ("20261016-235959", 2); aynı saniyedeki parçalar sırayla
+    match = re.search(r"\.(\d{8}-\d{6})(?:-(\d+))?\.", path.name)
+    if not match:
+        return path.name, 0
+    return match.group(1), int(match.group(2) or 0)
+
+
+def segments(path: Path) -> List[Path]:
+    # Eskiden yeniye tüm parçalar; aktif dosya (varsa) en sonda.
+    path = Path(path)
+    archived = sorted(
+        (p for p in path.parent.glob(f"{path.stem}.*{path.suffix}*")
+         if p != path and not p.name.endswith(".tmp")),
+        key=_segment_key
+    )
+    return archived + ([path] if path.exists() else [])
+
+
+def open_segment(path: Path) -> TextIO:
+    # Parçayı sıkıştırma türüne göre metin olarak açar.
+    name = str(path)
+    if name.endswith(".gz"):
+        return gzip.open(path, mode="rt", encoding="utf-8", newline="")
+    if name.endswith(".zst"):
+        import io
+        import zstandard
+
+        reader = zstandard.ZstdDecompressor().stream_reader(open(path, mode="rb"), closefd=True)
+        return io.TextIOWrapper(reader, encoding="utf-8", newline="")
+    return open(path, mode="r", encoding="utf-8", newline="")
+
+
+def iter_lines(path: Path) -> Iterator[str]:
+    # Tüm parçalardaki satırları sırayla üretir (dosyalar belleğe alınmaz).
+    for segment in segments(path):
+        with open_segment(segment) as f:
+            yield from f
+
+
+def iter_csv_rows(path: Path) -> Iterator[Dict[str, str]]:
+    # Tüm CSV parçalarını satır satır sözlük olarak üretir; her parçanın kendi başlığı okunur.
+    for segment in segments(path):
+        with open_segment(segment) as f:
+            yield from csv.DictReader(f)
+
+
+class RotatingLogFileHandler(logging.FileHandler):
+    """
+    Boyut ve gün eşiğinde dosyayı döndürüp eski parçayı sıkıştıran FileHandler.
+    Süreç genelinde tek bir örnek kullanılmalıdır (aynı dosyayı iki işleyici döndüremez).
+    """
+
+    def __init__(self, filename: Path):
+        super().__init__(filename, mode="a", encoding="utf-8", delay=True)
+        self._day = date.today()
+
+    def _due(self) -> bool:
+        if config.LOG_ROTATE_MAX_BYTES and self.stream is not None:
+            if self.stream.tell() >= config.LOG_ROTATE_MAX_BYTES:
+                return True
+        # Tarih değişimi her kayıtta stat yapmadan yakalanır
+        return config.LOG_ROTATE_DAILY and date.today() != self._day
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            if self.stream is None:
+                # İlk yazımdan önce önceki günlerden kalmış dosya varsa döndür
+                if should_rotate(Path(self.baseFilename)):
+                    rotate(Path(self.baseFilename))
+            elif self._due():
+                # emit işleyici kilidi altında çağrılır; akış kapatılıp bir sonraki yazımda yeniden açılır
+                self.stream.close()
+                self.stream = None
+                rotate(Path(self.baseFilename))
+            self._day = date.today()
+        except Exception:
+            self.handleError(record)
+        super().emit(record)
+
+
+if __name__ == "__main__":
+    import argparse
+    from collections import Counter
+
+    parser = argparse.ArgumentParser(description="Tüm kampanya logu parçalarının özeti")
+    parser.add_argument("--file", type=Path, default=None, help="Aktif kampanya logu")
+    args = parser.parse_args()
+
+    path = Path(args.file or config.CAMPAIGN_LOG_PATH)
+    started = time.perf_counter()
+    counts = Counter(row.get("durum", "") for row in iter_csv_rows(path))
+    elapsed = time.perf_counter() - started
+
+    for segment in segments(path):
+        print(f"  {segment.name:<48}{segment.stat().st_size / 1024:>10.1f} KB")
+    for status, count in counts.most_common():
+        print(f"{status or '-':<16}{count:>8}")
+    print(f"{sum(counts.values())} kayıt {elapsed:.2f} sn içinde okundu")
@@ -1,67 +1,133 @@
-import logging
+import atexit
 import csv
+import io
+import logging
+import queue
+import sqlite3
+import threading
+import time
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, List, Optional, Tuple
 import config
+from linkedin_urls import normalize_linkedin_url
+from log_rotation import RotatingLogFileHandler, open_segment, rotate, segments, should_rotate
 
 
-def setup_logger(name: str = "mudek_survey") -> logging.Logger:
-    logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, config.LOG_LEVEL))
+class _RecordQueueHandler(QueueHandler):
+    """
+    Kaydı biçimlendirmeden kuyruğa atar; mesaj ve zaman damgası yazıcı iş parçacığında
+    biçimlendirilir. Kayıtlar aynı süreç içinde kaldığı için kopyalamaya gerek yoktur.
+    """
     
-    # Mevcut işleyicileri temizle
-    logger.handlers.clear()
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _start_listener() -> QueueHandler:
+    # Konsol ve dosya işleyicileri süreç başına bir kez kurulur ve tek bir arka plan
+    # iş parçacığından yazılır; modüller sadece kuyruğa kayıt bırakır.
+    global _queue_handler, _listener
     
-    # Log formatı
     formatter = logging.Formatter(
         fmt="%(asctime)s | %(levelname)-8s | %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S"
     )
-    
-    # Konsol
+    handlers = []
     if config.CONSOLE_OUTPUT:
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
-    
-    # Dosya
+        handlers.append(logging.StreamHandler())
     if config.FILE_LOGGING:
-        log_file = config.LOGS_DIR / f"survey_{datetime.now().strftime('%Y%m%d')}.log"
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        # Aynı dosyayı iki işleyici döndüremez; tek dosya tanıtıcısı bütün modüllerce paylaşılır
+        handlers.append(RotatingLogFileHandler(config.LOG_FILE_PATH))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, *handlers)
+    _listener.start()
+    # Çıkışta kuyrukta kalan kayıtlar yazılır
+    atexit.register(_listener.stop)
+    
+    _queue_handler = _RecordQueueHandler(log_queue)
+    return _queue_handler
+
+
+def setup_logger(name: str = "mudek_survey") -> logging.Logger:
+    """
+    Modül logger'ını paylaşılan kuyruğa bağlar. Tekrar çağrılırsa aynı logger döner;
+    başka kodun eklediği işleyicilere dokunulmaz.
+    
+    Sıcak döngülerde mesajı %-biçimiyle verin (logger.info("Profil: %s", url));
+    biçimlendirme, kayıt seviye filtresini geçerse yazıcı iş parçacığında yapılır.
+    """
+    logger = logging.getLogger(name)
+    logger.setLevel(getattr(logging, config.LOG_LEVEL))
+    
+    handler = _queue_handler or _start_listener()
+    if handler not in logger.handlers:
+        logger.addHandler(handler)
+    # Kök logger'a da işleyici eklenmişse kayıtlar iki kez yazılmasın
+    logger.propagate = False
     
     return logger
 
 
+_queue_handler: Optional[QueueHandler] = None
+_listener: Optional[QueueListener] = None
+
+
 class CampaignLogger:
-    """Takip ve raporlama amacıyla kampanya eylemlerini bir CSV dosyasına kaydeder."""
+    """
+    Takip ve raporlama amacıyla kampanya eylemlerini bir CSV dosyasına kaydeder.
+    Dosya açık tutulur ve belirli aralıklarla diske boşaltılır; gönderilmiş URL'ler yan bir
+    SQLite dizininde satırın bayt konumuyla tutulur, böylece sadece yeni satırlar okunur.
+    """
+    
+    HEADER = [
+        "zaman_damgasi",
+        "mezun_adi",
+        "linkedin_url",
+        "mezuniyet_yili",
+        "sirket",
+        "pozisyon",
+        "eylem",
+        "durum",
+        "notlar"
+    ]
     
-    def __init__(self, log_path: Optional[Path] = None):
-        self.log_path = log_path or config.CAMPAIGN_LOG_PATH
+    def __init__(self, log_path: Optional[Path] = None, index_path: Optional[Path] = None):
+        self.log_path = Path(log_path or config.CAMPAIGN_LOG_PATH)
+        self.index_path = Path(index_path or config.CAMPAIGN_LOG_INDEX_PATH)
+        self._lock = threading.Lock()
+        self._file = None
+        self._writer = None
+        self._last_flush = time.monotonic()
+        self._index = None
+        self._synced_size = -1
+        self._day = datetime.now().date()
         self._initialize_csv()
+        atexit.register(self.close)
     
     def _initialize_csv(self):
         if not self.log_path.exists():
             with open(self.log_path, mode="w", newline="", encoding="utf-8") as f:
                 writer = csv.writer(f)
-                writer.writerow([
-                    "zaman_damgasi",
-                    "mezun_adi",
-                    "linkedin_url",
-                    "mezuniyet_yili",
-                    "sirket",
-                    "pozisyon",
-                    "eylem",
-                    "durum",
-                    "notlar"
-                ])
+                writer.writerow(self.HEADER)
     
     def log_action(self, alumni_data: dict, action: str, status: str, notes: str = ""):
-        with open(self.log_path, mode="a", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow([
+        with self._lock:
+            if self._file is None:
+                # Önceki günden kalmış ya da eşiği aşmış dosya önce arşivlenir
+                if should_rotate(self.log_path):
+                    self._rotate()
+                self._file = open(self.log_path, mode="a", newline="", encoding="utf-8")
+                self._writer = csv.writer(self._file)
+            elif self._rotation_due():
+                self._rotate()
+                self._file = open(self.log_path, mode="a", newline="", encoding="utf-8")
+                self._writer = csv.writer(self._file)
+            self._writer.writerow([
                 datetime.now().isoformat(),
                 alumni_data.get("name", "Bilinmiyor"),
                 alumni_data.get("linkedin_url", ""),
@@ -72,16 +138,158 @@ class CampaignLogger:
                 status,
                 notes
             ])
+            # Her satırda değil, belirli aralıklarla diske boşalt
+            if time.monotonic() - self._last_flush >= config.CAMPAIGN_LOG_FLUSH_INTERVAL:
+                self._flush()
+    
+    def _rotation_due(self) -> bool:
+        if config.LOG_ROTATE_MAX_BYTES and self._file.tell() >= config.LOG_ROTATE_MAX_BYTES:
+            return True
+        return config.LOG_ROTATE_DAILY and datetime.now().date() != self._day
+    
+    def _rotate(self):
+        # Arşivlenecek satırlar önce dizine işlenir; arşiv parçaları bir daha okunmaz
+        self._sync_index()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+        rotate(self.log_path)
+        self._initialize_csv()
+        
+        conn = self._open_index()
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('offset', '0')")
+        self._synced_size = -1
+        self._day = datetime.now().date()
+    
+    def _flush(self):
+        if self._file is not None:
+            self._file.flush()
+        self._last_flush = time.monotonic()
+    
+    def flush(self):
+        with self._lock:
+            self._flush()
+    
+    # ---------- GÖNDERİLMİŞ URL DİZİNİ ----------
+    
+    def _open_index(self) -> sqlite3.Connection:
+        if self._index is None:
+            # Kampanya sırasında log farklı iş parçacıklarından yazılır; erişim kilitle sıralanır
+            self._index = sqlite3.connect(str(self.index_path), check_same_thread=False)
+            self._index.executescript("""
+                CREATE TABLE IF NOT EXISTS meta (
+                    key   TEXT PRIMARY KEY,
+                    value TEXT
+                );
+                CREATE TABLE IF NOT EXISTS sent (
+                    url_key TEXT PRIMARY KEY,
+                    url     TEXT NOT NULL,
+                    offset  INTEGER NOT NULL
+                );
+            """)
+        return self._index
+    
+    def _sync_index(self):
+        """
+        CSV dosyasının dizinde kayıtlı bayt konumundan sonrasını okuyup gönderilmiş URL'leri ekler.
+        Dosya küçüldüyse (silinmiş/değiştirilmiş) dizin baştan kurulur.
+        """
+        
+        self._flush()
+        size = self.log_path.stat().st_size if self.log_path.exists() else 0
+        if size == self._synced_size:
+            return # Son okumadan beri yeni satır yok
+        
+        conn = self._open_index()
+        row = conn.execute("SELECT value FROM meta WHERE key = 'offset'").fetchone()
+        offset = int(row[0]) if row else 0
+        rebuild = row is None
+        if offset > size:
+            conn.execute("DELETE FROM sent")
+            offset, rebuild = 0, True
+        
+        found = []
+        if rebuild:
+            # Dizin yeni kuruluyor: arşivlenmiş parçalar da bir kez okunur (konum: -1)
+            for segment in segments(self.log_path):
+                if segment == self.log_path:
+                    continue
+                with open_segment(segment) as f:
+                    for values in csv.DictReader(f):
+                        url = values.get("linkedin_url") or ""
+                        if values.get("durum") == config.STATUS_SENT:
+                            found.append((normalize_linkedin_url(url) or url, url, -1))
+        
+        with open(self.log_path, mode="rb") as f:
+            header = next(csv.reader([f.readline().decode("utf-8")]), [])
+            offset = max(offset, f.tell())
+            url_col = header.index("linkedin_url") if "linkedin_url" in header else 2
+            status_col = header.index("durum") if "durum" in header else 7
+            
+            for start, values, end in _iter_csv_records(f, offset):
+                if len(values) > max(url_col, status_col) and values[status_col] == config.STATUS_SENT:
+                    url = values[url_col]
+                    found.append((normalize_linkedin_url(url) or url, url, start))
+                offset = end
+        
+        with conn:
+            conn.executemany("INSERT OR IGNORE INTO sent (url_key, url, offset) VALUES (?, ?, ?)", found)
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('offset', ?)", (str(offset),))
+        self._synced_size = size
     
     def get_processed_urls(self) -> set:
-        processed = set()
-        if self.log_path.exists():
-            with open(self.log_path, mode="r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row.get("durum") == "Gönderildi": # Status success/gönderildi uyumu
-                        processed.add(row.get("linkedin_url", ""))
-        return processed
+        # Başarıyla gönderilmiş tüm URL'ler (sadece dizine henüz girmemiş satırlar okunur).
+        with self._lock:
+            self._sync_index()
+            return {url for (url,) in self._open_index().execute("SELECT url FROM sent")}
+    
+    def sent_keys(self) -> set:
+        # Gönderilmiş URL'lerin normalize edilmiş anahtarları (toplu karşılaştırma için).
+        with self._lock:
+            self._sync_index()
+            return {key for (key,) in self._open_index().execute("SELECT url_key FROM sent")}
+    
+    def is_processed(self, linkedin_url: str) -> bool:
+        # Bu URL'ye daha önce mesaj gönderildi mi? (biçim farkları önemsizdir)
+        
+        key = normalize_linkedin_url(linkedin_url) or linkedin_url
+        with self._lock:
+            self._sync_index()
+            return self._open_index().execute(
+                "SELECT 1 FROM sent WHERE url_key = ?", (key,)
+            ).fetchone() is not None
+    
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                self._writer = None
+            if self._index is not None:
+                self._index.close()
+                self._index = None
+        atexit.unregister(self.close)
+
+
+def _iter_csv_records(f, offset: int) -> Iterator[Tuple[int, List[str], int]]:
+    """
+    İkili modda açılmış CSV dosyasını `offset`ten itibaren okur.
+    (kayıt başı konumu, değerler, kayıt sonu konumu) üretir; tırnak içinde satır sonu geçen
+    kayıtlar birleştirilir, yarım yazılmış son kayıt atlanır.
+    """
+    f.seek(offset)
+    start, pending = offset, b""
+    for line in f:
+        pending += line
+        # Tek sayıda tırnak: alan içinde satır sonu var, kayıt devam ediyor
+        if pending.count(b'"') % 2 or not pending.endswith(b"\n"):
+            continue
+        end = start + len(pending)
+        values = next(csv.reader(io.StringIO(pending.decode("utf-8"), newline="")), [])
+        yield start, values, end
+        start, pending = end, b""
 
 
 def print_banner():
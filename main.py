@@ -1,64 +1,152 @@
-import time
+import argparse
+import asyncio
+import tempfile
+from pathlib import Path
 import config
-from sheets_reader import GoogleSheetsReader
-from linkedin_automation import LinkedInAutomation
+from data_sources import ReadOnlySource, open_source
+from driver_daemon import browser_status
+from linkedin_automation import DryRunAutomation, LinkedInAutomation
+from message_generator import MessageGenerator
+from prevalidate import prevalidate
+from priority_scheduler import PriorityScheduler, scan_records
+from retry_queue import RetryQueue
+from metrics import format_summary, get_recorder
+from selector_engine import SelectorStats
+from campaign_runner import CampaignRunner, sender_accounts
+from scheduler import RateScheduler
+from journal import CampaignJournal
+from logger_utils import CampaignLogger
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="MÜDEK mezun anketi otomatik mesaj gönderimi")
+    parser.add_argument(
+        "--source", default="sheets",
+        help="Veri kaynağı: sheets | csv:<yol> | parquet:<yol> | sqlite:<yol>[#tablo] | fake-sheets[:<csv>]"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true",
+        help="Tarayıcı açmadan çalış, mesajları sadece logla"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="Paralel tarayıcı sayısı; her biri ayrı gönderici hesap (config.SENDER_ACCOUNTS)"
+    )
+    return parser.parse_args()
 
 def main():
+    args = parse_args()
     print("\n🚀 OTOMATİK MOD BAŞLATILIYOR...")
     
-    # 1. Excel'i Oku
-    sheets = GoogleSheetsReader()
-    pending_list = sheets.get_pending_alumni()
-    print(f"📄 Listede {len(pending_list)} kişi var.")
+    # 1. Excel'i Oku (parça parça; ilk kayıtlar gelir gelmez işe başlanır)
+    sheets = open_source(args.source)
 
-    if not pending_list:
-        print("🎉 Yapılacak iş yok.")
-        return
+    # --dry-run'da mesaj gerçekten gitmediği için günlük, kampanya logu, kota durumu ve tekrar kuyruğu
+    # geçici bir klasöre yazılır; aksi halde sonraki gerçek çalıştırma bu kişileri 'gönderilmiş' sayardı
+    # Kaynak da salt okunur açılır: simüle edilen gönderimler gerçek satırlara 'Gönderildi' yazmaz
+    state_dir = Path(tempfile.mkdtemp(prefix="mudek_dry_run_")) if args.dry_run else None
+    if state_dir:
+        sheets = ReadOnlySource(sheets)
+        print(f"🧪 Deneme modu: kaynağa yazılmıyor, çalışma durumu {state_dir} klasörüne yazılıyor")
 
-    # 2. Botu Aç
-    bot = LinkedInAutomation()
-    if not bot.check_login_status():
-        print("❌ Önce giriş yapmalısın! Tarayıcıda giriş yap ve Enter'a bas.")
-        input()
-    
-    # 3. Seri Gönderim Döngüsü
-    count = 0
-    for person in pending_list:
-        if count >= config.MAX_PROFILES_PER_SESSION:
-            print("🛑 Günlük limit doldu.")
-            break
+    def state_path(default: Path):
+        return state_dir / default.name if state_dir else None
 
-        name = person.get('name', '')
-        url = person.get('linkedin_url', '')
-        if not url.startswith("http"): url = "https://" + url
-        row_num = person.get('_row_num')
-        
-        print(f"[{count+1}] {name}...", end=" ")
+    # Önceki çalıştırma yarıda kaldıysa: e-tabloya ulaşmamış durumları yaz, mesaj atılmış kişileri atla
+    journal = CampaignJournal(state_path(config.JOURNAL_PATH))
+    journal_state = journal.recover(sheets)
+    # Kampanya logunda 'Gönderildi' olanlar da atlanır (dizin sadece yeni log satırlarını okur)
+    campaign_log = CampaignLogger(
+        state_path(config.CAMPAIGN_LOG_PATH), state_path(config.CAMPAIGN_LOG_INDEX_PATH)
+    )
+    recorder = get_recorder()
 
-        # Mesajı Hazırla
-        first_name = name.split()[0] if name else "Mezunumuz"
-        msg = (
-            f"Merhaba {first_name}, nasılsın?\n\n"
-            f"{person.get('graduation_year', '')} mezunlarımız için MÜDEK kapsamında anket yapıyoruz. "
-            f"Katkın çok değerli: {config.SURVEY_URL}\n\n"
-            f"Sevgiler, Özge"
-        )
+    # 'Hata' durumundaki kişiler, tekrar kuyruğundaki bekleme süreleri dolduysa yeniden denenir
+    # Aynı geçişte mezuniyet yılı başına gönderim sayaçları da çıkarılır (öncelik sırası için);
+    # aday olmayan satırlar bellekte tutulmaz
+    retries = RetryQueue(state_path(config.RETRY_QUEUE_PATH))
+    candidates, cohorts, sheet_sent = scan_records(sheets.iter_alumni(), retries)
 
-        # GÖNDER 
-        status = bot.send_message_fast(url, msg)
+    # Tarayıcıdan önce: URL'ler toplu kontrol edilir, geçersiz ve tekrar eden satırlar 'Atlandı',
+    # daha önce gönderilmiş olanlar 'Gönderildi' yazılır
+    with recorder.span("main.prevalidate"):
+        uncertain = set(journal_state.uncertain)
+        # Geçmiş: günlük, kampanya logu ve e-tabloda zaten 'Gönderildi' olan satırlar
+        history = (journal_state.handled - uncertain) | campaign_log.sent_keys() | sheet_sent
+        checked = prevalidate(candidates, history, uncertain)
+        checked.write_statuses(sheets)
+    print(f"🔎 Ön kontrol: {checked.summary()}")
 
-        if status == 'sent':
-            sheets.update_status(row_num, "Gönderildi")
-            print("✅ GÖNDERİLDİ")
-        else:
-            sheets.update_status(row_num, "Hata")
-            print("❌ HATA")
+    if not checked.viable:
+        print("🎉 Yapılacak iş yok.")
+        sheets.close()
+        journal.close()
+        campaign_log.close()
+        return
+    # Kota önce MÜDEK hedefinin gerisinde kalan mezuniyet yıllarına harcanır
+    pending_list = PriorityScheduler(checked.viable, cohorts, retries)
+    print(f"🎯 Öncelik: {pending_list.summary()}")
+
+    generator = MessageGenerator(config.MESSAGE_TEMPLATE)
 
+    count = 0
+    def report(result):
+        nonlocal count
         count += 1
-        # Her kişi arası 5 saniye bekle (Ban yememek için umduğum minimum süre)
-        time.sleep(5) 
+        pending_list.finished(result.job.person, result.sheet_status)
+        if result.outcome.sent:
+            outcome = "✅ GÖNDERİLDİ"
+        elif result.sheet_status == config.STATUS_SKIPPED:
+            outcome = f"⏭️ ATLANDI: {result.notes}"
+        else:
+            outcome = f"❌ HATA: {result.notes}"
+        print(f"[{count}] {result.job.person.name} ({result.worker}) {outcome}")
+
+    # 2. Botları Aç (her gönderici hesap için ayrı tarayıcı)
+    bots = {}
+    try:
+        selector_stats = SelectorStats()
+        for account in sender_accounts(args.workers):
+            warm = None
+            if args.dry_run:
+                bot = DryRunAutomation()
+            else:
+                # driver_daemon.py çalışıyorsa açık tarayıcıya bağlan, yoksa Chrome'u aç
+                warm = browser_status(account["name"])
+                address = warm["debugger_address"] if warm else None
+                if address:
+                    print(f"♨️ {account['name']}: açık tarayıcıya bağlanılıyor ({address})")
+                bot = LinkedInAutomation(
+                    account["profile_path"], account["debug_port"], selector_stats, debugger_address=address
+                )
+            bots[account["name"]] = bot
+
+            # Servisteki tarayıcının oturumu servis tarafından izlenir; akış sayfası tekrar açılmaz
+            logged_in = warm["logged_in"] if warm else bot.check_login_status()
+            if not logged_in:
+                print(f"❌ {account['name']}: Önce giriş yapmalısın! Tarayıcıda giriş yap ve Enter'a bas.")
+                input()
+        
+        # 3. Gönderim: tarayıcılar çalışırken e-tablo yazımı, log ve sıradaki mesaj arka planda
+        runner = CampaignRunner(
+            sheets, bots, generator, campaign_log, on_result=report, journal=journal,
+            scheduler=RateScheduler(bots, path=state_path(config.QUOTA_STATE_PATH)), retries=retries
+        )
+        asyncio.run(runner.run(pending_list))
+        if runner.limit_reached:
+            print("🛑 Gönderim kotası doldu (durum: python scheduler.py).")
+    finally:
+        # Tamponda kalan durum güncellemelerini kaybetme
+        sheets.close()
+        journal.close()
+        campaign_log.close()
+        for bot in bots.values():
+            bot.close()
 
-    bot.close()
+    cache = generator.cache.stats()
+    print(f"🧠 Mesaj önbelleği: {cache['hits']} isabet / {cache['misses']} ıskalama")
+    print(f"\n⏱️ Adım süreleri (çalıştırma {recorder.run_id}):")
+    print(format_summary(recorder.summary()))
+    recorder.close()
     print("🏁 İşlem Tamamlandı.")
 
 if __name__ == "__main__":
@@ -1,6 +1,9 @@
-from typing import Dict, Optional
-from string import Template
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+from string import Formatter
 import config
+from alumni_record import AlumniRecord
 from logger_utils import setup_logger
 
 logger = setup_logger(__name__)
@@ -64,25 +67,139 @@ Best regards,
 {contact_email}"""
 
 
+# Türkçe samimi kısa şablon (LinkedIn sohbet kutusu için)
+TEMPLATE_TR_CASUAL = """Merhaba {first_name}, nasılsın?
+
+{graduation_year} mezunlarımız için MÜDEK kapsamında anket yapıyoruz. Katkın çok değerli: {survey_url}
+
+Sevgiler, {sender_name}"""
+
+
 # Şablon eşleşmeleri
 TEMPLATES = {
+    "tr_casual": TEMPLATE_TR_CASUAL,
     "tr_formal": TEMPLATE_TR_FORMAL,
     "tr_semiformal": TEMPLATE_TR_SEMIFORMAL,
     "en_formal": TEMPLATE_EN_FORMAL
 }
 
 
+class CompiledTemplate:
+    """
+    str.format şablonunu bir kez ayrıştırır. Sabit yer tutucular (üniversite, anket linki...)
+    derleme sırasında metne gömülür; render sadece kişiye özel alanları yerleştirip birleştirir.
+    """
+    
+    __slots__ = ("source", "fields", "_parts", "_slots")
+    
+    def __init__(self, template: str, constants: Dict[str, str]):
+        parts: List[Optional[str]] = []
+        slots: List[Tuple[int, str, Optional[str], str]] = []
+        fields: List[str] = []
+        
+        def add_literal(text: str):
+            # Art arda gelen sabit parçaları tek string'de birleştir
+            if parts and parts[-1] is not None:
+                parts[-1] += text
+            elif text:
+                parts.append(text)
+        
+        for literal, field_name, format_spec, conversion in Formatter().parse(template):
+            add_literal(literal)
+            if field_name is None:
+                continue
+            if field_name in constants:
+                value = constants[field_name]
+                if conversion:
+                    value = repr(value) if conversion == "r" else str(value)
+                add_literal(format(value, format_spec or ""))
+                continue
+            slots.append((len(parts), field_name, conversion, format_spec or ""))
+            parts.append(None)
+            if field_name not in fields:
+                fields.append(field_name)
+        
+        self.source = template
+        self.fields = tuple(fields)
+        self._parts = parts
+        self._slots = tuple(slots)
+    
+    def render(self, values: Dict[str, str]) -> str:
+        """
+        Kişiye özel değerleri yerleştirip mesajı üretir.
+        
+        Raises:
+            KeyError: Şablonda olup values içinde olmayan yer tutucu varsa
+        """
+        buffer = self._parts.copy()
+        for position, name, conversion, format_spec in self._slots:
+            value = values[name]
+            if conversion or format_spec:
+                if conversion:
+                    value = repr(value) if conversion == "r" else str(value)
+                value = format(value, format_spec)
+            buffer[position] = value
+        return "".join(buffer)
+
+
+class RenderCache:
+    """
+    Üretilmiş mesajlar için boyut sınırlı LRU önbellek.
+    Anahtar: derlenmiş şablon + şablonun gerçekten kullandığı yer tutucu değerleri.
+    """
+    
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items: "OrderedDict[Hashable, str]" = OrderedDict()
+    
+    def get_or_render(self, key: Hashable, render: Callable[[], str]) -> str:
+        message = self._items.get(key)
+        if message is not None:
+            self.hits += 1
+            self._items.move_to_end(key)
+            return message
+        
+        self.misses += 1
+        message = render()
+        if self.maxsize > 0:
+            self._items[key] = message
+            if len(self._items) > self.maxsize:
+                self._items.popitem(last=False)  # En uzun süredir kullanılmayanı at
+        return message
+    
+    def __len__(self) -> int:
+        return len(self._items)
+    
+    def stats(self) -> Dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._items),
+            "hit_rate": self.hits / total if total else 0.0
+        }
+
+
+@lru_cache(maxsize=64)
+def compile_template(template: str, constants: Tuple[Tuple[str, str], ...]) -> CompiledTemplate:
+    # Aynı şablon + sabitler için derlenmiş nesneyi tekrar kullanır.
+    return CompiledTemplate(template, dict(constants))
+
+
 class MessageGenerator:
     """
     Mezun iletişimi için kişiselleştirilmiş mesajlar oluşturur.
     """
     
-    def __init__(self, template_key: str = "tr_formal"):
+    def __init__(self, template_key: str = "tr_formal", cache_size: Optional[int] = None):
         """
         Mesaj oluşturucuyu başlatır.
         
         Args:
             template_key: Kullanılacak şablon anahtarı (örn: 'tr_formal')
+            cache_size: Mesaj önbelleği boyutu (varsayılan: config.MESSAGE_CACHE_SIZE, 0: kapalı)
         """
         self.template_key = template_key
         self.base_template = TEMPLATES.get(template_key, TEMPLATE_TR_FORMAL)
@@ -94,54 +211,94 @@ class MessageGenerator:
             "department": config.DEPARTMENT_NAME,
             "survey_url": config.SURVEY_URL,
             "contact_email": config.CONTACT_EMAIL,
-            "contact_phone": config.CONTACT_PHONE
+            "contact_phone": config.CONTACT_PHONE,
+            "sender_name": config.SENDER_NAME
         }
+        self._constants = tuple(sorted(self.defaults.items()))
+        self.compiled = compile_template(self.base_template, self._constants)
+        self.cache = RenderCache(
+            config.MESSAGE_CACHE_SIZE if cache_size is None else cache_size
+        )
+    
+    @staticmethod
+    def _personal_values(alumni: AlumniRecord, values: Dict[str, str]) -> Dict[str, str]:
+        # Mezuna özel yer tutucuları doldurur.
+        # Boş veriler için mantıklı varsayılanlar atanır (Cümle akışını bozmamak için)
+        values["name"] = alumni.name or "Değerli Mezunumuz"
+        values["first_name"] = alumni.name.split()[0] if alumni.name.strip() else "Mezunumuz"
+        values["graduation_year"] = alumni.graduation_year or "geçmiş"
+        values["company"] = alumni.company or "mevcut şirketiniz"
+        values["position"] = alumni.position or "mevcut pozisyonunuz"
+        return values
+    
+    def _render(self, compiled: CompiledTemplate, values: Dict[str, str]) -> str:
+        # Şablonun kullanmadığı alanlar anahtara girmez; (ad, yıl) gibi tekrarlar önbellekten gelir.
+        key = (compiled, tuple([values[name] for name in compiled.fields]))
+        return self.cache.get_or_render(key, lambda: compiled.render(values))
     
-    def generate(self, alumni: Dict, custom_template: Optional[str] = None) -> str:
+    def generate(self, alumni: AlumniRecord, custom_template: Optional[str] = None) -> str:
         """
         Bir mezun için kişiselleştirilmiş mesaj metni üretir.
         
         Args:
-            alumni: Mezun verilerini içeren sözlük
+            alumni: Mezun kaydı
             custom_template: (İsteğe bağlı) Özel şablon metni
             
         Returns:
             Kişiselleştirilmiş mesaj metni (str)
         """
-        template = custom_template or self.base_template
+        compiled = self.compiled
+        if custom_template:
+            compiled = compile_template(custom_template, self._constants)
         
-        # Varsayılanları kopyala
-        placeholders = {**self.defaults}
+        try:
+            message = self._render(compiled, self._personal_values(alumni, {}))
+            logger.debug("Mesaj oluşturuldu: %s", alumni.name or "Bilinmiyor")
+            return message
+            
+        except KeyError as e:
+            logger.error("Şablonda eksik yer tutucu (placeholder): %s", e)
+            raise
+    
+    def generate_many(
+        self,
+        records: Iterable[AlumniRecord],
+        custom_template: Optional[str] = None
+    ) -> List[str]:
+        """
+        Bütün bir mezun grubunun mesajlarını tek seferde üretir.
+        Tek bir yer tutucu sözlüğü tüm kayıtlar için tekrar kullanılır.
         
-        # Mezuna özel verileri ekle
-        placeholders["name"] = alumni.get("name", "Değerli Mezunumuz")
-        placeholders["graduation_year"] = alumni.get("graduation_year", "")
-        placeholders["company"] = alumni.get("company", "şirketiniz")
-        placeholders["position"] = alumni.get("position", "pozisyonunuz")
+        Args:
+            records: Mezun kayıtları
+            custom_template: (İsteğe bağlı) Özel şablon metni
+            
+        Returns:
+            Kayıtlarla aynı sırada mesaj metinleri
+        """
+        compiled = self.compiled
+        if custom_template:
+            compiled = compile_template(custom_template, self._constants)
         
-        # Boş veriler için mantıklı varsayılanlar ata (Cümle akışını bozmamak için)
-        if not placeholders["company"]:
-            placeholders["company"] = "mevcut şirketiniz"
-        if not placeholders["position"]:
-            placeholders["position"] = "mevcut pozisyonunuz"
-        if not placeholders["graduation_year"]:
-            placeholders["graduation_year"] = "geçmiş"
+        render = self._render
+        fill = self._personal_values
+        values: Dict[str, str] = {}
         
         try:
-            message = template.format(**placeholders)
-            logger.debug(f"Mesaj oluşturuldu: {alumni.get('name', 'Bilinmiyor')}")
-            return message
-            
+            messages = [render(compiled, fill(alumni, values)) for alumni in records]
         except KeyError as e:
-            logger.error(f"Şablonda eksik yer tutucu (placeholder): {e}")
+            logger.error("Şablonda eksik yer tutucu (placeholder): %s", e)
             raise
+        
+        logger.debug("%d mesaj oluşturuldu", len(messages))
+        return messages
     
-    def preview(self, alumni: Dict) -> str:
+    def preview(self, alumni: AlumniRecord) -> str:
         """
         Mesajın önizlemesini formatlı bir şekilde oluşturur.
         
         Args:
-            alumni: Mezun verilerini içeren sözlük
+            alumni: Mezun kaydı
             
         Returns:
             Formatlanmış önizleme metni
@@ -152,7 +309,7 @@ class MessageGenerator:
 {'='*60}
 📧 MESAJ ÖNİZLEME
 {'='*60}
-Kime: {alumni.get('name', 'Bilinmiyor')} ({alumni.get('linkedin_url', 'URL Yok')})
+Kime: {alumni.name or 'Bilinmiyor'} ({alumni.linkedin_url or 'URL Yok'})
 {'='*60}
 
 {message}
@@ -170,6 +327,7 @@ Kime: {alumni.get('name', 'Bilinmiyor')} ({alumni.get('linkedin_url', 'URL Yok')
             Şablon anahtarları ve açıklamaları sözlüğü
         """
         return {
+            "tr_casual": "Türkçe - Kısa ve samimi (LinkedIn sohbeti)",
             "tr_formal": "Türkçe - Resmi üslup (Varsayılan)",
             "tr_semiformal": "Türkçe - Yarı resmi / Samimi",
             "en_formal": "İngilizce - Resmi üslup"
@@ -177,7 +335,7 @@ Kime: {alumni.get('name', 'Bilinmiyor')} ({alumni.get('linkedin_url', 'URL Yok')
 
 
 def generate_personalized_message(
-    alumni: Dict,
+    alumni: AlumniRecord,
     template_key: str = "tr_formal",
     custom_template: Optional[str] = None
 ) -> str:
@@ -185,14 +343,14 @@ def generate_personalized_message(
     Kişiselleştirilmiş mesaj oluşturmak için yardımcı (wrapper) fonksiyon.
     
     Args:
-        alumni: Mezun verisi
+        alumni: Mezun kaydı
         template_key: Kullanılacak şablon
         custom_template: Özel şablon
         
     Returns:
         Hazır mesaj metni
     """
-    generator = MessageGenerator(template_key)
+    generator = _get_generator(template_key)
     
     if custom_template:
         return generator.generate(alumni, custom_template)
@@ -200,6 +358,12 @@ def generate_personalized_message(
     return generator.generate(alumni)
 
 
+@lru_cache(maxsize=None)
+def _get_generator(template_key: str) -> MessageGenerator:
+    # Her çağrıda yeni MessageGenerator (ve şablon derlemesi) yapılmasını önler.
+    return MessageGenerator(template_key)
+
+
 
 # ---------- BAĞIMSIZ TEST  ----------
 
@@ -208,13 +372,13 @@ if __name__ == "__main__":
     print("-" * 50)
     
     # Örnek mezun verisi
-    test_alumni = {
-        "name": "Ahmet Yılmaz",
-        "linkedin_url": "https://linkedin.com/in/ahmetyilmaz",
-        "graduation_year": "2018",
-        "company": "Google",
-        "position": "Senior Software Engineer"
-    }
+    test_alumni = AlumniRecord(
+        name="Ahmet Yılmaz",
+        linkedin_url="https://linkedin.com/in/ahmetyilmaz",
+        graduation_year="2018",
+        company="Google",
+        position="Senior Software Engineer"
+    )
     
     generator = MessageGenerator("tr_formal")
     
@@ -222,4 +386,34 @@ if __name__ == "__main__":
     for key, desc in MessageGenerator.list_templates().items():
         print(f"  - {key}: {desc}")
     
-    print(generator.preview(test_alumni))
\ No newline at end of file
+    print(generator.preview(test_alumni))
+    
+    # Mikro ölçüm: str.format ile her seferinde ayrıştırma vs derlenmiş şablon
+    import time
+    from fake_sheets import sample_rows
+    from alumni_record import field_indexes_for
+    
+    headers = list(config.COLUMN_MAPPING.values())
+    indexes = field_indexes_for(headers)
+    cohort = [
+        AlumniRecord.from_row(headers, row, i, indexes)
+        for i, row in enumerate(sample_rows(50_000))
+    ]
+    
+    for key in TEMPLATES:
+        bench_generator = MessageGenerator(key)
+        
+        started = time.perf_counter()
+        for alumni in cohort:
+            placeholders = {**bench_generator.defaults}
+            bench_generator._personal_values(alumni, placeholders)
+            bench_generator.base_template.format(**placeholders)
+        naive_rate = len(cohort) / (time.perf_counter() - started)
+        
+        started = time.perf_counter()
+        bench_generator.generate_many(cohort)
+        compiled_rate = len(cohort) / (time.perf_counter() - started)
+        
+        hit_rate = bench_generator.cache.stats()["hit_rate"]
+        print(f"{key:<14} str.format: {naive_rate:>10,.0f} mesaj/s | "
+              f"generate_many: {compiled_rate:>10,.0f} mesaj/s (önbellek isabeti %{hit_rate * 100:.0f})")
\ No newline at end of file
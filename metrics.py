@@ -0,0 +1,183 @@
+"""
+Adım bazında süre ölçümü: tarayıcı otomasyonu, Sheets okuyucu ve ana döngü aynı kaydediciye raporlar.
+Ölçümler çalıştırma başına JSONL dosyasına yazılır (campaign_log.csv ile aynı klasör).
+
+Özet için:
+    python metrics.py              # son çalıştırma
+    python metrics.py --all        # tüm çalıştırmalar
+"""
+import json
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+import config
+
+
+def percentile(values: List[float], q: float) -> float:
+    # Doğrusal ara değerlemeli yüzdelik (q: 0-100).
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(samples: Dict[str, List[float]]) -> Dict[str, Dict[str, float]]:
+    # Adım -> {count, p50, p95, max} (milisaniye).
+    return {
+        step: {
+            "count": len(values),
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "max": max(values)
+        }
+        for step, values in sorted(samples.items()) if values
+    }
+
+
+def format_summary(summary: Dict[str, Dict[str, float]]) -> str:
+    lines = [f"{'adım':<28}{'adet':>7}{'p50 ms':>11}{'p95 ms':>11}{'max ms':>11}"]
+    for step, stats in summary.items():
+        lines.append(
+            f"{step:<28}{stats['count']:>7}{stats['p50']:>11.1f}"
+            f"{stats['p95']:>11.1f}{stats['max']:>11.1f}"
+        )
+    return "\n".join(lines)
+
+
+class MetricsRecorder:
+    """
+    Süre örneklerini bellekte toplar ve her birini JSONL satırı olarak dosyaya ekler.
+    """
+
+    def __init__(self, path: Optional[Path] = None, run_id: Optional[str] = None, enabled: bool = True):
+        self.path = Path(path or config.METRICS_LOG_PATH)
+        self.run_id = run_id or datetime.now().strftime("%Y%m%d-%H%M%S")
+        self.enabled = enabled
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+        self._lock = threading.Lock()
+        self._file = None
+
+    def record(self, step: str, seconds: float, **tags):
+        if not self.enabled:
+            return
+        ms = seconds * 1000
+        entry = {"run": self.run_id, "ts": round(time.time(), 3), "step": step, "ms": round(ms, 3)}
+        if tags:
+            entry.update(tags)
+        line = json.dumps(entry, ensure_ascii=False)
+
+        with self._lock:
+            self.samples[step].append(ms)
+            if self._file is None:
+                self._file = open(self.path, mode="a", encoding="utf-8", buffering=1)
+            self._file.write(line + "\n")
+
+    @contextmanager
+    def span(self, step: str, **tags) -> Iterator[None]:
+        # 'with recorder.span("send.navigate"):' bloğunun süresini kaydeder (hata olsa da).
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(step, time.perf_counter() - started, **tags)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return summarize(self.samples)
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+_recorder: Optional[MetricsRecorder] = None
+_recorder_lock = threading.Lock()
+
+
+def get_recorder() -> MetricsRecorder:
+    # Süreç genelinde paylaşılan kaydedici.
+    global _recorder
+    if _recorder is None:
+        with _recorder_lock:
+            if _recorder is None:
+                _recorder = MetricsRecorder(enabled=config.METRICS_ENABLED)
+    return _recorder
+
+
+def set_recorder(recorder: MetricsRecorder) -> Optional[MetricsRecorder]:
+    # Paylaşılan kaydediciyi değiştirir (örn. benchmark.py kendi dosyasına yazar); öncekini döndürür.
+    global _recorder
+    with _recorder_lock:
+        previous, _recorder = _recorder, recorder
+    return previous
+
+
+def span(step: str, **tags):
+    return get_recorder().span(step, **tags)
+
+
+def timed(step: str):
+    # Modül/sınıf tanımında kullanılabilen dekoratör; kaydedici çağrı anında alınır.
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with get_recorder().span(step):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def load_samples(path: Optional[Path] = None, run_id: Optional[str] = None) -> Dict[str, List[float]]:
+    """
+    JSONL ölçüm dosyasını okur.
+
+    Args:
+        path: Dosya yolu (varsayılan: config.METRICS_LOG_PATH)
+        run_id: Verilirse sadece o çalıştırma; 'all' ise hepsi; None ise son çalıştırma
+    """
+    path = Path(path or config.METRICS_LOG_PATH)
+    entries = []
+    with open(path, mode="r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue  # Yarım yazılmış son satır
+
+    if run_id is None and entries:
+        run_id = entries[-1]["run"]
+
+    samples: Dict[str, List[float]] = defaultdict(list)
+    for entry in entries:
+        if run_id == "all" or entry.get("run") == run_id:
+            samples[entry["step"]].append(entry["ms"])
+    return samples
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Adım sürelerinin p50/p95/max özeti")
+    parser.add_argument("--file", type=Path, default=None, help="JSONL ölçüm dosyası")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--run", default=None, help="Çalıştırma kimliği (varsayılan: son)")
+    group.add_argument("--all", action="store_true", help="Tüm çalıştırmaları birleştir")
+    args = parser.parse_args()
+
+    try:
+        samples = load_samples(args.file, "all" if args.all else args.run)
+    except FileNotFoundError as e:
+        print(f"❌ Ölçüm dosyası bulunamadı: {e.filename}")
+        raise SystemExit(1)
+
+    print(format_summary(summarize(samples)))
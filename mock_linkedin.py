@@ -0,0 +1,352 @@
+"""
+LinkedIn'in SELECTORS tablosunun hedeflediği sayfa parçalarının yerel taklidi (hız ölçümü için).
+Profil başlığı, Mesaj butonu, sohbet kutusu ve popup'lar gerçek sınıf/aria adlarıyla sunulur;
+ağ gecikmesi, sayfa çizim süresi ve sohbet kutusunun açılma süresi ayarlanabilir.
+
+Elle denemek için:
+    python mock_linkedin.py --port 8765 --latency 0.2 --popup-rate 0.3
+    (tarayıcıda http://127.0.0.1:8765/in/mezun-1/)
+"""
+import json
+import random
+import re
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+_FIRST_NAMES = ["Ayşe", "Mehmet", "Zeynep", "Can", "Elif", "Burak", "Deniz", "Emre", "Selin", "Kerem"]
+_LAST_NAMES = ["Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Aydın", "Öztürk", "Arslan"]
+
+_PROFILE_RE = re.compile(r"^/in/([A-Za-z0-9_-]+)/?$")
+
+# Profil sayfası; __CONFIG__ sunucuda sayfa ayarlarıyla (JSON) değiştirilir
+_PROFILE_HTML = """<!DOCTYPE html>
+<html lang="tr">
+<head>
+<meta charset="utf-8">
+<title>LinkedIn (taklit)</title>
+<style>
+  body { font-family: "MockSans", sans-serif; margin: 0; }
+  .artdeco-modal-overlay { position: fixed; inset: 0; background: rgba(0,0,0,.4); }
+  .artdeco-modal { background: #fff; width: 400px; margin: 120px auto; padding: 16px; }
+  #msg-overlay { position: fixed; right: 0; bottom: 0; display: flex; gap: 8px; }
+  .msg-overlay-conversation-bubble { width: 320px; background: #fff; border: 1px solid #ccc; }
+  .msg-form__contenteditable { min-height: 60px; border: 1px solid #999; padding: 4px; }
+</style>
+</head>
+<body>
+<!-- Gerçek profildeki ağır kaynaklar: fotoğraflar, yazı tipi, video ve izleme betiği -->
+<link rel="stylesheet" href="/static/fonts.css">
+<img class="profile-background-image" src="/media/cover-__SLUG__.jpg" width="800" height="200" alt="">
+<img class="pv-top-card-profile-picture__image" src="/media/photo-__SLUG__.jpg" width="200" height="200" alt="">
+<video src="/media/intro-__SLUG__.mp4" preload="auto" muted></video>
+<script async src="/li/track/tag.js"></script>
+<main id="main"><p>Yükleniyor...</p></main>
+<aside id="msg-overlay"></aside>
+<script>
+const cfg = __CONFIG__;
+
+function el(tag, attrs, text) {
+  const node = document.createElement(tag);
+  for (const key in (attrs || {})) node.setAttribute(key, attrs[key]);
+  if (text) node.textContent = text;
+  return node;
+}
+
+function openBubble() {
+  const bubble = el("div", {"class": "msg-overlay-conversation-bubble"});
+  const header = el("header", {"class": "msg-overlay-bubble-header"});
+  header.appendChild(el("h2", {}, cfg.name));
+  const close = el("button", {
+    "class": "msg-overlay-bubble-header__control--close-btn", "aria-label": "Konuşmayı kapat"
+  }, "×");
+  close.addEventListener("click", () => bubble.remove());
+  header.appendChild(close);
+
+  const form = el("form", {"class": "msg-form"});
+  const textbox = el("div", {
+    "class": "msg-form__contenteditable", "role": "textbox", "contenteditable": "true"
+  });
+  const send = el("button", {"type": "submit", "class": "msg-form__send-button"}, "Gönder");
+  send.disabled = true;
+  textbox.addEventListener("input", () => { send.disabled = !textbox.textContent.trim(); });
+  form.addEventListener("submit", (event) => {
+    event.preventDefault();
+    const text = textbox.textContent;
+    fetch("/api/sent", {
+      method: "POST",
+      headers: {"Content-Type": "application/json"},
+      body: JSON.stringify({slug: cfg.slug, text: text})
+    }).then(() => setTimeout(() => {
+      textbox.textContent = "";
+      send.disabled = true;
+    }, cfg.send_delay * 1000));
+  });
+  form.appendChild(textbox);
+  form.appendChild(send);
+
+  bubble.appendChild(header);
+  bubble.appendChild(form);
+  // LinkedIn yeni pencereyi en sola koyar
+  const overlay = document.getElementById("msg-overlay");
+  overlay.insertBefore(bubble, overlay.firstChild);
+}
+
+function render() {
+  const main = document.getElementById("main");
+  main.textContent = "";
+  const card = el("div", {"class": "ph5"});
+  card.appendChild(el("h1", {"class": "text-heading-xlarge"}, cfg.name));
+  card.appendChild(el("div", {"class": "text-body-medium"}, cfg.headline));
+  if (cfg.has_button) {
+    const button = el("button", {"class": "message-anywhere-button artdeco-button"});
+    button.appendChild(el("span", {}, "Mesaj"));
+    button.addEventListener("click", () => setTimeout(openBubble, cfg.bubble_delay * 1000));
+    card.appendChild(button);
+  } else {
+    card.appendChild(el("button", {"class": "artdeco-button"}, "Bağlantı kur"));
+  }
+  main.appendChild(card);
+
+  if (cfg.popup) {
+    const overlay = el("div", {"class": "artdeco-modal-overlay"});
+    const modal = el("div", {"class": "artdeco-modal", "role": "dialog"});
+    const dismiss = el("button", {"class": "artdeco-modal__dismiss", "aria-label": "Dismiss"}, "×");
+    dismiss.addEventListener("click", () => overlay.remove());
+    modal.appendChild(dismiss);
+    modal.appendChild(el("p", {}, "LinkedIn Premium'u deneyin"));
+    overlay.appendChild(modal);
+    document.body.appendChild(overlay);
+  }
+}
+
+// Profil içeriği, gerçek sitedeki gibi sayfa yüklendikten sonra betikle çizilir
+setTimeout(render, cfg.render_delay * 1000);
+</script>
+</body>
+</html>
+"""
+
+_FONTS_CSS = """@font-face { font-family: "MockSans"; src: url("/static/mock-sans.woff2") format("woff2"); }
+"""
+
+# Uzantıya göre ağır kaynakların içerik türü
+_ASSET_TYPES = {
+    ".jpg": "image/jpeg",
+    ".mp4": "video/mp4",
+    ".woff2": "font/woff2",
+    ".js": "application/javascript",
+}
+
+_FEED_HTML = """<!DOCTYPE html>
+<html lang="tr"><head><meta charset="utf-8"><title>Akış (taklit)</title></head>
+<body><main><h1>Akış</h1></main></body></html>
+"""
+
+
+class MockLinkedInServer:
+    """
+    Arka planda çalışan taklit sunucu. Aynı profil adresi her seferinde aynı sayfayı üretir
+    (isim, popup ve Mesaj butonu seçimi profil adından türetilir), böylece ölçümler tekrarlanabilir.
+
+    Args:
+        host, port: Dinlenecek adres (port=0: boş bir port seçilir)
+        latency: Her yanıttan önceki ağ gecikmesi (sn)
+        jitter: Gecikmeye eklenen rastgele süre üst sınırı (sn)
+        render_delay: Sayfa yüklendikten sonra profil içeriğinin çizilme süresi (sn)
+        bubble_delay: Mesaj butonuna tıklandıktan sonra sohbet kutusunun açılma süresi (sn)
+        send_delay: Gönderimden sonra mesaj kutusunun boşalma süresi (sn)
+        popup_rate: Açılışta popup gösterilen profillerin oranı (0-1)
+        no_button_rate: Mesaj butonu olmayan (1. derece bağlantı olmayan) profillerin oranı (0-1)
+        asset_kb: Her ağır kaynağın (fotoğraf, video, yazı tipi, izleme betiği) boyutu (KB)
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        render_delay: float = 0.0,
+        bubble_delay: float = 0.0,
+        send_delay: float = 0.0,
+        popup_rate: float = 0.0,
+        no_button_rate: float = 0.0,
+        asset_kb: int = 150
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.render_delay = render_delay
+        self.bubble_delay = bubble_delay
+        self.send_delay = send_delay
+        self.popup_rate = popup_rate
+        self.no_button_rate = no_button_rate
+        self.asset_kb = asset_kb
+        # Gönderilen mesajlar: {"slug", "text", "ts"}
+        self.sent: List[Dict[str, object]] = []
+        self.requests = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def profile_url(self, slug: str) -> str:
+        return f"{self.base_url}/in/{slug}/"
+
+    def start(self) -> "MockLinkedInServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="mock-linkedin", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        # Ön planda çalıştırır (komut satırı kullanımı)
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "MockLinkedInServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def page_config(self, slug: str) -> Dict[str, object]:
+        # Profil adından türetilen sabit sayfa özellikleri
+        seed = zlib.crc32(slug.encode("utf-8"))
+        rng = random.Random(seed)
+        return {
+            "slug": slug,
+            "name": f"{_FIRST_NAMES[seed % len(_FIRST_NAMES)]} {_LAST_NAMES[seed // 7 % len(_LAST_NAMES)]}",
+            "headline": "Mühendis",
+            "popup": rng.random() < self.popup_rate,
+            "has_button": rng.random() >= self.no_button_rate,
+            "render_delay": self.render_delay,
+            "bubble_delay": self.bubble_delay,
+            "send_delay": self.send_delay,
+        }
+
+    def asset_body(self, content_type: str) -> bytes:
+        # İçeriği önemsiz, boyutu asset_kb olan yanıt (betikse çalıştırılabilir bir yorum satırı)
+        size = self.asset_kb * 1024
+        if content_type == "application/javascript":
+            return b"//" + b"x" * max(0, size - 2)
+        return b"\0" * size
+
+    def _delay(self):
+        wait = self.latency + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if wait > 0:
+            time.sleep(wait)
+
+    def _record(self, nbytes: int):
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += nbytes
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _reply(
+                self, code: int, body: bytes, content_type: str = "text/html; charset=utf-8", cache: bool = False
+            ):
+                self.send_response(code)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                # Yazı tipi ve stil dosyası gerçek sitedeki gibi önbelleğe alınır; geri kalanı her seferinde iner
+                self.send_header("Cache-Control", "max-age=3600" if cache else "no-store")
+                self.end_headers()
+                self.wfile.write(body)
+                server._record(len(body))
+
+            def do_GET(self):
+                server._delay()
+                path = self.path.split("?", 1)[0]
+                match = _PROFILE_RE.match(path)
+                if match:
+                    slug = match.group(1)
+                    config_json = json.dumps(server.page_config(slug), ensure_ascii=False)
+                    html = _PROFILE_HTML.replace("__CONFIG__", config_json).replace("__SLUG__", slug)
+                    self._reply(200, html.encode("utf-8"))
+                elif path == "/static/fonts.css":
+                    self._reply(200, _FONTS_CSS.encode("utf-8"), "text/css", cache=True)
+                elif path.startswith(("/media/", "/static/", "/li/track/")):
+                    content_type = _ASSET_TYPES.get(path[path.rfind("."):])
+                    if content_type is None:
+                        self._reply(404, b"Not found", "text/plain")
+                    else:
+                        self._reply(
+                            200, server.asset_body(content_type), content_type, cache=path.startswith("/static/")
+                        )
+                elif path.rstrip("/") == "/feed":
+                    self._reply(200, _FEED_HTML.encode("utf-8"))
+                elif path == "/api/sent":
+                    with server._lock:
+                        body = json.dumps(server.sent, ensure_ascii=False)
+                    self._reply(200, body.encode("utf-8"), "application/json")
+                else:
+                    self._reply(404, b"Not found", "text/plain")
+
+            def do_POST(self):
+                server._delay()
+                if self.path != "/api/sent":
+                    self._reply(404, b"Not found", "text/plain")
+                    return
+                length = int(self.headers.get("Content-Length") or 0)
+                try:
+                    entry = json.loads(self.rfile.read(length) or b"{}")
+                except json.JSONDecodeError:
+                    self._reply(400, b"Bad request", "text/plain")
+                    return
+                entry["ts"] = round(time.time(), 3)
+                with server._lock:
+                    server.sent.append(entry)
+                self._reply(204, b"")
+
+            def log_message(self, format, *args):
+                pass  # İstek başına konsol çıktısı ölçümü bozmasın
+
+        return Handler
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Yerel taklit LinkedIn sunucusu")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Yanıt başına gecikme (sn)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Rastgele ek gecikme üst sınırı (sn)")
+    parser.add_argument("--render-delay", type=float, default=0.0, help="Profil içeriğinin çizilme süresi (sn)")
+    parser.add_argument("--bubble-delay", type=float, default=0.0, help="Sohbet kutusunun açılma süresi (sn)")
+    parser.add_argument("--send-delay", type=float, default=0.0, help="Gönderimden sonra kutunun boşalma süresi (sn)")
+    parser.add_argument("--popup-rate", type=float, default=0.0, help="Popup gösterilen profil oranı")
+    parser.add_argument("--no-button-rate", type=float, default=0.0, help="Mesaj butonu olmayan profil oranı")
+    parser.add_argument("--asset-kb", type=int, default=150, help="Ağır kaynak (fotoğraf, video vb.) boyutu (KB)")
+    args = parser.parse_args()
+
+    server = MockLinkedInServer(
+        args.host, args.port, latency=args.latency, jitter=args.jitter,
+        render_delay=args.render_delay, bubble_delay=args.bubble_delay, send_delay=args.send_delay,
+        popup_rate=args.popup_rate, no_button_rate=args.no_button_rate, asset_kb=args.asset_kb
+    )
+    print(f"Taklit LinkedIn: {server.profile_url('mezun-1')}  (Ctrl-C ile durdurun)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,65 @@
+"""
+Gönderim sonucunun yapılandırılmış hali: başarısız gönderimler nedenleriyle sınıflandırılır.
+Kalıcı nedenler (ör. 1. derece bağlantı olmadığı için Mesaj butonu yok) tekrar denenmez;
+geçici nedenler (zaman aşımı, açılmayan sohbet kutusu...) tekrar kuyruğuna alınır.
+"""
+from collections import namedtuple
+
+# --- NEDENLER ---
+# Kalıcı
+NO_MESSAGE_BUTTON = "no_message_button"    # Profil açıldı ama Mesaj butonu yok (1. derece bağlantı değil)
+PROFILE_NOT_FOUND = "profile_not_found"    # Profil sayfası yok / kaldırılmış
+# Geçici
+PROFILE_NOT_LOADED = "profile_not_loaded"  # Profil başlığı zamanında görünmedi
+BUBBLE_NOT_OPENED = "bubble_not_opened"    # Sohbet kutusu açılmadı
+FORM_NOT_FOUND = "form_not_found"          # Mesaj formu / Gönder butonu bulunamadı
+SEND_DISABLED = "send_disabled"            # Gönder butonu aktif olmadı
+TIMEOUT = "timeout"                        # Sayfa yükleme zaman aşımı
+DRIVER_ERROR = "driver_error"              # Tarayıcı/WebDriver hatası
+UNKNOWN = "unknown"                        # Sınıflandırılamayan hata
+
+PERMANENT_REASONS = {NO_MESSAGE_BUTTON, PROFILE_NOT_FOUND}
+
+# E-tablodaki Notlar sütununa yazılan açıklamalar
+REASON_TEXT = {
+    NO_MESSAGE_BUTTON: "Mesaj butonu yok (1. derece bağlantı değil)",
+    PROFILE_NOT_FOUND: "Profil bulunamadı",
+    PROFILE_NOT_LOADED: "Profil sayfası yüklenmedi",
+    BUBBLE_NOT_OPENED: "Sohbet kutusu açılmadı",
+    FORM_NOT_FOUND: "Mesaj formu bulunamadı",
+    SEND_DISABLED: "Gönder butonu aktif olmadı",
+    TIMEOUT: "Sayfa yükleme zaman aşımı",
+    DRIVER_ERROR: "Tarayıcı hatası",
+    UNKNOWN: "Bilinmeyen hata",
+}
+
+
+class SendOutcome(namedtuple("SendOutcome", ["status", "reason", "detail"])):
+    """
+    send_message_fast sonucu.
+
+    status: 'sent' | 'error'
+    reason: Başarısızlık nedeni (yukarıdaki sabitlerden biri; başarıda boş)
+    detail: Hata mesajı gibi ek bilgi
+    """
+
+    __slots__ = ()
+
+    @property
+    def sent(self) -> bool:
+        return self.status == "sent"
+
+    @property
+    def permanent(self) -> bool:
+        return self.reason in PERMANENT_REASONS
+
+    def describe(self) -> str:
+        return REASON_TEXT.get(self.reason, self.reason)
+
+
+def sent() -> SendOutcome:
+    return SendOutcome("sent", "", "")
+
+
+def failed(reason: str, detail: str = "") -> SendOutcome:
+    return SendOutcome("error", reason, detail)
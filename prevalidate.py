@@ -0,0 +1,176 @@
+"""
+Tarayıcıya gitmeden önce bekleyen kayıtların toplu (pandas) ön kontrolü.
+LinkedIn URL'leri tek seferde kanonik biçime getirilir; geçersiz adresler, satırlar arası
+tekrarlar ve daha önce mesaj gönderilmiş kişiler ayıklanır. Geçersiz ve tekrar eden satırlar
+STATUS_SKIPPED, günlüğe/kampanya loguna göre zaten gönderilmiş olanlar STATUS_SENT olarak tek
+toplu yazımla işaretlenir; tarayıcı sadece geçerli hedeflere gider.
+
+Rapor için (e-tabloya yazmaz):
+    python prevalidate.py --source csv:mezunlar.csv
+"""
+from typing import Iterable, List, Set, Tuple
+import config
+from alumni_record import AlumniRecord
+from linkedin_urls import LINKEDIN_HOST_RE, URL_SCHEME_RE
+from logger_utils import setup_logger
+
+logger = setup_logger(__name__)
+
+# Kanonik profil anahtarı: "linkedin.com/in/ad-soyad" (eski "/pub/" adresleri de geçerli)
+_PROFILE_KEY_RE = r"^linkedin\.com/(?:in|pub)/[^/\s]+(?:/[^/\s]+)*$"
+
+# Atlanma nedenleri (e-tablodaki Notlar sütununa yazılır)
+REASON_EMPTY = "LinkedIn adresi boş"
+REASON_MALFORMED = "Geçersiz LinkedIn profil adresi"
+REASON_DUPLICATE = "Aynı profil {row}. satırda da var"
+
+
+class ValidationResult:
+    """
+    Ön kontrol sonucu.
+
+    viable: Mesaj gönderilecek kayıtlar (sayfa sırasıyla; URL'leri kanonik https adresi)
+    skipped: (kayıt, neden) - e-tabloya STATUS_SKIPPED olarak yazılacaklar
+    already_sent: Geçmişte mesaj gönderilmiş kayıtlar - e-tabloya STATUS_SENT olarak yazılacaklar
+    uncertain: Gönderimi yarıda kesilmiş kayıt sayısı (mesaj gitmiş olabilir; durumuna dokunulmaz)
+    """
+
+    def __init__(self):
+        self.viable: List[AlumniRecord] = []
+        self.skipped: List[Tuple[AlumniRecord, str]] = []
+        self.already_sent: List[AlumniRecord] = []
+        self.uncertain = 0
+
+    def count(self, reason: str) -> int:
+        # Tekrar nedenleri satır numarası içerdiği için önekle sayılır
+        prefix = reason.split("{", 1)[0]
+        return sum(1 for _, r in self.skipped if r.startswith(prefix))
+
+    def write_statuses(self, source) -> int:
+        """
+        Atlanan satırları STATUS_SKIPPED ve nedeniyle, daha önce gönderilmiş olanları STATUS_SENT
+        olarak tek toplu yazımla işaretler; bu satırlar sonraki çalıştırmalarda tekrar okunmaz.
+
+        Returns:
+            Tampona alınabilen satır sayısı
+        """
+        skipped = sum(
+            1 for person, reason in self.skipped
+            if source.update_status(person.row_num, config.STATUS_SKIPPED, reason)
+        )
+        sent = sum(1 for person in self.already_sent if source.update_status(person.row_num, config.STATUS_SENT))
+        if self.skipped or self.already_sent:
+            source.flush_updates()
+            logger.info(
+                "🧹 %d satır '%s', %d satır '%s' olarak işaretlendi",
+                skipped, config.STATUS_SKIPPED, sent, config.STATUS_SENT
+            )
+        return skipped + sent
+
+    def summary(self) -> str:
+        return (
+            f"{len(self.viable)} geçerli, {self.count(REASON_EMPTY)} boş, "
+            f"{self.count(REASON_MALFORMED)} geçersiz, {self.count(REASON_DUPLICATE)} tekrar, "
+            f"{len(self.already_sent)} daha önce gönderilmiş, {self.uncertain} sonucu belirsiz"
+        )
+
+
+def canonical_keys(urls):
+    """
+    normalize_linkedin_url'in vektörel karşılığı (pandas Series -> Series).
+    Aynı düzenli ifadeler kullanılır; anahtarlar günlük ve kampanya logu dizinindekilerle aynıdır.
+    """
+    return (
+        urls.fillna("").astype(str).str.strip().str.lower()
+        .str.replace(URL_SCHEME_RE.pattern, "", regex=True)
+        .str.replace(r"[?#].*$", "", regex=True)
+        .str.rstrip("/")
+        .str.replace(LINKEDIN_HOST_RE.pattern, "linkedin.com", regex=True)
+    )
+
+
+def prevalidate(
+    records: Iterable[AlumniRecord],
+    history: Set[str],
+    uncertain: Set[str] = frozenset()
+) -> ValidationResult:
+    """
+    Bekleyen kayıtların tamamını tek seferde kontrol eder.
+
+    Args:
+        records: Bekleyen mezun kayıtları
+        history: Daha önce mesaj gönderilmiş kişilerin normalize edilmiş URL anahtarları
+            (CampaignJournal durumu ve CampaignLogger.sent_keys)
+        uncertain: Gönderimi yarıda kesilmiş kişilerin anahtarları (atlanır, durumu yazılmaz)
+
+    Returns:
+        ValidationResult
+    """
+    import pandas as pd
+
+    records = list(records)
+    result = ValidationResult()
+    if not records:
+        return result
+
+    frame = pd.DataFrame({
+        "row": [person.row_num for person in records],
+        "url": [person.linkedin_url for person in records],
+    })
+    frame["key"] = canonical_keys(frame["url"])
+    empty = frame["key"] == ""
+    valid = frame["key"].str.match(_PROFILE_KEY_RE)
+    sent = valid & frame["key"].isin(history)
+    interrupted = valid & ~sent & frame["key"].isin(uncertain)
+    # Tekrarlardan sayfada ilk geçen satır kalır
+    candidates = valid & ~sent & ~interrupted
+    duplicate = candidates & frame["key"].where(candidates).duplicated(keep="first")
+    first_rows = frame[candidates & ~duplicate].set_index("key")["row"]
+
+    result.uncertain = int(interrupted.sum())
+    for i, person in enumerate(records):
+        if empty.iat[i]:
+            result.skipped.append((person, REASON_EMPTY))
+        elif not valid.iat[i]:
+            result.skipped.append((person, REASON_MALFORMED))
+        elif sent.iat[i]:
+            result.already_sent.append(person)
+        elif interrupted.iat[i]:
+            continue
+        elif duplicate.iat[i]:
+            result.skipped.append((person, REASON_DUPLICATE.format(row=first_rows[frame["key"].iat[i]] + 2)))
+        else:
+            # Tarayıcı doğrudan gidebileceği tam adresi alır
+            person.linkedin_url = f"https://www.{frame['key'].iat[i]}/"
+            result.viable.append(person)
+    return result
+
+
+if __name__ == "__main__":
+    import argparse
+    from data_sources import open_source
+    from journal import CampaignJournal
+    from logger_utils import CampaignLogger
+
+    parser = argparse.ArgumentParser(description="Bekleyen kayıtların ön kontrol raporu")
+    parser.add_argument("--source", default="sheets", help="Veri kaynağı (main.py ile aynı biçim)")
+    parser.add_argument("--write", action="store_true", help="Atlanan/gönderilmiş satırları e-tabloya da yaz")
+    args = parser.parse_args()
+
+    source = open_source(args.source)
+    campaign_log = CampaignLogger()
+    try:
+        state = CampaignJournal().replay()
+        uncertain = set(state.uncertain)
+        history = (state.handled - uncertain) | campaign_log.sent_keys()
+        checked = prevalidate(source.iter_pending_alumni(), history, uncertain)
+        print(checked.summary())
+        for person, reason in checked.skipped:
+            print(f"  {person.row_num + 2}. satır  {person.linkedin_url or '-':<48} {reason}")
+        for person in checked.already_sent:
+            print(f"  {person.row_num + 2}. satır  {person.linkedin_url:<48} daha önce gönderilmiş")
+        if args.write:
+            checked.write_statuses(source)
+    finally:
+        source.close()
+        campaign_log.close()
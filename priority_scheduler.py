@@ -0,0 +1,221 @@
+"""
+Bekleyen kişilerin öncelik sırası (heap tabanlı).
+Günlük gönderim kotası sayfa sırasıyla ilk N satıra değil, MÜDEK hedef oranının en gerisinde
+kalan mezuniyet yıllarına harcanır. Aynı yıl içinde hiç denenmemiş kişiler önce, daha önce
+hata alanlar (az denenmiş ve en uzun süredir denenmemiş olan önce) sonra gelir.
+
+İki katmanlı heap: her mezuniyet yılının kendi kişi heap'i, yılların da bir heap'i vardır.
+Bir gönderimin sonucu sadece o yılın anahtarını değiştirir; yeniden sıralama O(log n)'dir.
+
+Sıralamayı görmek için (e-tabloya yazmaz):
+    python priority_scheduler.py --source csv:mezunlar.csv
+"""
+import heapq
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import config
+from alumni_record import AlumniRecord
+from linkedin_urls import normalize_linkedin_url
+from logger_utils import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def scan_records(
+    records: Iterable[AlumniRecord],
+    retries=None
+) -> Tuple[List[AlumniRecord], Dict[str, Tuple[int, int]], Set[str]]:
+    """
+    Kayıtları tek geçişte okur: gönderilecek adayları ayırır, mezuniyet yılı başına
+    (toplam, gönderilmiş) sayaçlarını ve 'Gönderildi' satırlarının URL'lerini çıkarır.
+    Aday olmayan kayıtlar bellekte tutulmaz.
+
+    Args:
+        records: Kaynaktaki tüm kayıtlar (AlumniSource.iter_alumni)
+        retries: Verilirse 'Hata' durumundakiler bekleme süresi dolduysa aday sayılır (RetryQueue)
+
+    Returns:
+        (adaylar, yıl -> (toplam, gönderilmiş), gönderilmiş satırların normalize URL'leri)
+    """
+    candidates = []
+    counts: Dict[str, List[int]] = {}
+    sent_keys: Set[str] = set()
+    for person in records:
+        status = person.status.strip()
+        tally = counts.setdefault(person.graduation_year.strip(), [0, 0])
+        tally[0] += 1
+        if status == config.STATUS_SENT:
+            tally[1] += 1
+            # Kampanya logundan önceki gönderimler sadece e-tablodaki durumdan bilinir
+            key = normalize_linkedin_url(person.linkedin_url)
+            if key:
+                sent_keys.add(key)
+        elif status in ("", config.STATUS_PENDING) or (
+            status == config.STATUS_ERROR and (retries is None or retries.is_due(person.linkedin_url))
+        ):
+            candidates.append(person)
+    return candidates, {year: (total, sent) for year, (total, sent) in counts.items()}, sent_keys
+
+
+class _Cohort:
+    """Bir mezuniyet yılının sayaçları ve bekleyen kişileri."""
+
+    __slots__ = ("year", "total", "sent", "in_flight", "members", "version")
+
+    def __init__(self, year: str):
+        self.year = year
+        self.total = 0
+        self.sent = 0
+        self.in_flight = 0   # Sıradan alınmış, sonucu henüz gelmemiş kişiler
+        # (deneme sayısı, son deneme zamanı, satır, kayıt)
+        self.members: List[Tuple[int, float, int, AlumniRecord]] = []
+        self.version = 0     # Yıllar heap'indeki güncel kaydı ayırt eder (eskiler atlanır)
+
+    def coverage(self) -> float:
+        # Gönderilmiş + yolda olanların yıl içindeki oranı
+        return (self.sent + self.in_flight) / self.total if self.total else 1.0
+
+
+class PriorityScheduler:
+    """
+    Bekleyen kişileri öncelik sırasıyla veren iterator (CampaignRunner'a `pending` olarak verilir).
+
+    Sıralama (küçük önce):
+        1. Yılın hedefe ulaşıp ulaşmadığı (config.MUDEK_TARGET_RATE)
+        2. Kişinin başarısız deneme sayısı (tekrar kuyruğundan)
+        3. Yılın kapsama oranı
+        4. Kişinin son deneme zamanı (en uzun süredir denenmemiş önce)
+
+    Args:
+        pending: Gönderilecek kayıtlar (ön kontrolden geçmiş)
+        cohorts: Mezuniyet yılı -> (toplam, gönderilmiş) sayaçları (bkz. scan_records)
+        retries: Verilirse deneme sayısı ve son deneme zamanı buradan okunur (RetryQueue)
+        target: Yıl başına hedef oran (varsayılan: config.MUDEK_TARGET_RATE)
+    """
+
+    def __init__(
+        self,
+        pending: Iterable[AlumniRecord],
+        cohorts: Dict[str, Tuple[int, int]],
+        retries=None,
+        target: Optional[float] = None
+    ):
+        self.target = config.MUDEK_TARGET_RATE if target is None else target
+        self._lock = threading.Lock()
+        self._cohorts: Dict[str, _Cohort] = {}
+        self._heap: List[Tuple[tuple, int, str]] = []
+
+        for year, (total, sent) in cohorts.items():
+            cohort = self._cohorts[year] = _Cohort(year)
+            cohort.total, cohort.sent = total, sent
+
+        for person in pending:
+            entry = retries.get(person.linkedin_url) if retries is not None else None
+            attempts, last_at = (entry["attempts"], entry.get("last_at", 0.0)) if entry else (0, 0.0)
+            # Satır numarası tekildir; kayıtlar hiçbir zaman karşılaştırılmaz
+            self._cohort(person).members.append((attempts, last_at, person.row_num, person))
+
+        for cohort in self._cohorts.values():
+            heapq.heapify(cohort.members)
+            self._push(cohort)
+
+    def _cohort(self, person: AlumniRecord) -> _Cohort:
+        year = person.graduation_year.strip()
+        cohort = self._cohorts.get(year)
+        if cohort is None:
+            # Yılı boş olanlar kendi grubunda toplanır ('' anahtarı)
+            cohort = self._cohorts[year] = _Cohort(year)
+        return cohort
+
+    def _key(self, cohort: _Cohort) -> tuple:
+        attempts, last_at, _, _ = cohort.members[0]
+        coverage = cohort.coverage()
+        return (coverage >= self.target, attempts, coverage, last_at, cohort.year)
+
+    def _push(self, cohort: _Cohort):
+        # Anahtar değişince yeni kayıt eklenir; eski kayıt sürüm tutmadığı için pop sırasında atlanır
+        if not cohort.members:
+            return
+        cohort.version += 1
+        heapq.heappush(self._heap, (self._key(cohort), cohort.version, cohort.year))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> AlumniRecord:
+        with self._lock:
+            while self._heap:
+                _, version, year = heapq.heappop(self._heap)
+                cohort = self._cohorts[year]
+                if version != cohort.version or not cohort.members:
+                    continue
+                person = heapq.heappop(cohort.members)[3]
+                cohort.in_flight += 1
+                self._push(cohort)
+                return person
+        raise StopIteration
+
+    def __len__(self) -> int:
+        return sum(len(cohort.members) for cohort in self._cohorts.values())
+
+    def finished(self, person: AlumniRecord, status: str):
+        """
+        Gönderim sonucu geldiğinde çağrılır; sadece kişinin yılının sırası güncellenir.
+
+        Args:
+            person: Sıradan alınmış kayıt
+            status: E-tabloya yazılan durum (STATUS_SENT ise yılın kapsaması artar)
+        """
+        with self._lock:
+            cohort = self._cohorts.get(person.graduation_year.strip())
+            if cohort is None:
+                return
+            cohort.in_flight = max(0, cohort.in_flight - 1)
+            if status == config.STATUS_SENT:
+                cohort.sent += 1
+            self._push(cohort)
+
+    def cohorts(self) -> List[Tuple[str, int, int, int, float]]:
+        # (yıl, toplam, gönderilmiş, bekleyen, kapsama) - en geride kalan yıl önce
+        with self._lock:
+            rows = [
+                (c.year, c.total, c.sent, len(c.members), c.sent / c.total if c.total else 1.0)
+                for c in self._cohorts.values()
+            ]
+        return sorted(rows, key=lambda row: (row[4], row[0]))
+
+    def summary(self) -> str:
+        behind = [row for row in self.cohorts() if row[3] and row[4] < self.target]
+        return (
+            f"{len(self)} kişi, {len(behind)} mezuniyet yılı %{self.target * 100:.0f} hedefinin altında"
+        )
+
+
+if __name__ == "__main__":
+    import argparse
+    from itertools import islice
+    from data_sources import open_source
+    from prevalidate import prevalidate
+    from retry_queue import RetryQueue
+
+    parser = argparse.ArgumentParser(description="Bekleyen kişilerin öncelik sırası")
+    parser.add_argument("--source", default="sheets", help="Veri kaynağı (main.py ile aynı biçim)")
+    parser.add_argument("--limit", type=int, default=50, help="Gösterilecek kişi sayısı")
+    args = parser.parse_args()
+
+    source = open_source(args.source)
+    try:
+        retries = RetryQueue()
+        candidates, counts, sent_keys = scan_records(source.iter_alumni(), retries)
+        schedule = PriorityScheduler(prevalidate(candidates, sent_keys).viable, counts, retries)
+    finally:
+        source.close()
+
+    print(schedule.summary())
+    for year, total, sent, waiting, coverage in schedule.cohorts():
+        mark = "⚠️" if waiting and coverage < schedule.target else "  "
+        print(f"{mark} {year or '-':<6} {sent:>5}/{total:<5} %{coverage * 100:5.1f}  bekleyen: {waiting}")
+    print()
+    for n, person in enumerate(islice(schedule, args.limit), 1):
+        attempts = retries.attempts(person.linkedin_url)
+        print(f"{n:>4}. {person.row_num + 2:>5}. satır  {person.graduation_year or '-':<6} {attempts} deneme  {person.name}")
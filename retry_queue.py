@@ -0,0 +1,149 @@
+"""
+Başarısız gönderimlerin kalıcı tekrar kuyruğu.
+Geçici hatalar (zaman aşımı, açılmayan sohbet kutusu...) e-tabloya 'Hata' yazılır ve üstel
+artan bekleme süresinden sonra tekrar denenir. Kalıcı hatalar (Mesaj butonu yok, profil yok)
+ve deneme hakkı biten kişiler 'Atlandı' olarak işaretlenir; sonraki çalıştırmalar onlara
+tarayıcı açmaz.
+
+Durum için:
+    python retry_queue.py
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import config
+from linkedin_urls import normalize_linkedin_url
+from logger_utils import setup_logger
+from outcomes import REASON_TEXT, SendOutcome
+
+logger = setup_logger(__name__)
+
+
+class RetryQueue:
+    """
+    Normalize edilmiş LinkedIn URL'si -> {row, attempts, next_at, reason} kayıtları.
+    Farklı iş parçacıklarından güncellenebilir; her değişiklikten sonra dosyaya yazılır.
+
+    Args:
+        path: JSON dosyası (varsayılan: config.RETRY_QUEUE_PATH)
+        max_attempts: Bu kadar başarısız denemeden sonra kişi atlanır
+        base_delay: İlk tekrar için bekleme (sn); her denemede iki katına çıkar
+        max_delay: Bekleme süresinin üst sınırı (sn)
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_attempts: Optional[int] = None,
+        base_delay: Optional[float] = None,
+        max_delay: Optional[float] = None
+    ):
+        self.path = Path(path or config.RETRY_QUEUE_PATH)
+        self.max_attempts = max_attempts or config.RETRY_MAX_ATTEMPTS
+        self.base_delay = base_delay or config.RETRY_BASE_DELAY
+        self.max_delay = max_delay or config.RETRY_MAX_DELAY
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, mode="r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("Tekrar kuyruğu okunamadı, boş kabul ediliyor: %s", e)
+            return {}
+
+    def save(self):
+        # Yarım yazılmış dosya kalmasın diye önce geçici dosyaya yazılır
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        try:
+            with open(tmp_path, mode="w", encoding="utf-8") as f:
+                json.dump(self.entries, f, ensure_ascii=False, indent=1)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.error("Tekrar kuyruğu yazılamadı: %s", e)
+
+    def backoff(self, attempts: int) -> float:
+        # 1. hatadan sonra base_delay, sonra 2x, 4x ... (max_delay ile sınırlı)
+        return min(self.max_delay, self.base_delay * 2 ** (attempts - 1))
+
+    def record(self, person, outcome: SendOutcome, now: Optional[float] = None) -> Tuple[str, str]:
+        """
+        Gönderim sonucunu kuyruğa işler.
+
+        Args:
+            person: AlumniRecord
+            outcome: send_message_fast sonucu
+
+        Returns:
+            (e-tabloya yazılacak durum, notlar)
+        """
+        key = normalize_linkedin_url(person.linkedin_url)
+        if outcome.sent:
+            with self._lock:
+                if self.entries.pop(key, None) is not None:
+                    self.save()
+            return config.STATUS_SENT, ""
+
+        now = time.time() if now is None else now
+        reason_text = outcome.describe()
+        with self._lock:
+            entry = self.entries.get(key) or {"row": person.row_num, "attempts": 0}
+            entry["attempts"] += 1
+            entry["row"] = person.row_num
+            entry["reason"] = outcome.reason
+            entry["last_at"] = round(now, 3)
+
+            if outcome.permanent or entry["attempts"] >= self.max_attempts:
+                # Atlanan kişi artık okunmayacağı için kuyrukta tutulmaz
+                self.entries.pop(key, None)
+                self.save()
+                if outcome.permanent:
+                    return config.STATUS_SKIPPED, reason_text
+                return config.STATUS_SKIPPED, f"{reason_text} ({entry['attempts']} deneme)"
+
+            entry["next_at"] = round(now + self.backoff(entry["attempts"]), 3)
+            self.entries[key] = entry
+            self.save()
+        retry_at = time.strftime("%d.%m %H:%M", time.localtime(entry["next_at"]))
+        return config.STATUS_ERROR, f"{reason_text} ({entry['attempts']}/{self.max_attempts}, tekrar: {retry_at})"
+
+    def is_due(self, linkedin_url: str, now: Optional[float] = None) -> bool:
+        # Kuyrukta olmayan (ör. eski sürümden kalma 'Hata') kişiler hemen denenebilir
+        entry = self.get(linkedin_url)
+        if entry is None:
+            return True
+        return entry.get("next_at", 0) <= (time.time() if now is None else now)
+
+    def get(self, linkedin_url: str) -> Optional[Dict]:
+        return self.entries.get(normalize_linkedin_url(linkedin_url))
+
+    def attempts(self, linkedin_url: str) -> int:
+        entry = self.get(linkedin_url)
+        return entry["attempts"] if entry else 0
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Tekrar kuyruğunun durumu")
+    parser.add_argument("--file", type=Path, default=None, help="Kuyruk dosyası")
+    args = parser.parse_args()
+
+    queue = RetryQueue(args.file)
+    now = time.time()
+    due = sum(1 for url in queue.entries if queue.is_due(url, now))
+    print(f"Kuyruktaki kişi: {len(queue.entries)} (şimdi denenebilir: {due})")
+    for url, entry in sorted(queue.entries.items(), key=lambda item: item[1].get("next_at", 0)):
+        wait = entry.get("next_at", 0) - now
+        when = "şimdi" if wait <= 0 else f"{wait / 60:.0f} dk sonra"
+        reason = REASON_TEXT.get(entry.get("reason"), entry.get("reason", ""))
+        print(
+            f"  {entry['row'] + 2:>5}. satır  {entry['attempts']}/{queue.max_attempts}  "
+            f"{when:<14} {reason:<36} {url}"
+        )
@@ -0,0 +1,232 @@
+"""
+Gönderim kotaları: saatlik ve günlük üst sınırlar kayan pencereyle (son gönderim zamanları),
+aynı hesabın iki gönderimi arasındaki aralık token bucket ile uygulanır.
+Gönderim zamanları dosyada saklanır; program yeniden başlatılınca kota sıfırlanmaz.
+
+Durum için:
+    python scheduler.py
+"""
+import json
+import os
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import config
+from logger_utils import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class TokenBucket:
+    """
+    `capacity` adet hak; haklar `period` saniyede tamamen dolacak hızla sürekli yenilenir.
+    """
+
+    __slots__ = ("capacity", "period", "tokens", "updated")
+
+    def __init__(self, capacity: int, period: float, tokens: Optional[float] = None, updated: Optional[float] = None):
+        self.capacity = capacity
+        self.period = period
+        self.tokens = capacity if tokens is None else min(tokens, capacity)
+        self.updated = time.time() if updated is None else updated
+
+    @property
+    def rate(self) -> float:
+        return self.capacity / self.period
+
+    def refill(self, now: float):
+        elapsed = max(0.0, now - self.updated)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated = now
+
+    def wait_time(self, now: float) -> float:
+        # Bir hak için kaç saniye beklenmeli (0: hemen)
+        self.refill(now)
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def take(self, now: float):
+        self.refill(now)
+        self.tokens -= 1
+
+    def remaining(self, now: float) -> float:
+        self.refill(now)
+        return self.tokens
+
+    def to_dict(self) -> Dict[str, float]:
+        return {"tokens": round(self.tokens, 6), "updated": self.updated}
+
+
+class SlidingWindow:
+    """
+    Son `period` saniyedeki gönderim sayısı hiçbir anda `capacity`'yi geçmez.
+    Token bucket'ın aksine başlangıç bakiyesi + yenilenme toplamı sınırı aşamaz.
+    """
+
+    __slots__ = ("capacity", "period", "sends")
+
+    def __init__(self, capacity: int, period: float, sends: Iterable[float] = ()):
+        self.capacity = capacity
+        self.period = period
+        self.sends = deque(sorted(sends))
+
+    def _expire(self, now: float):
+        while self.sends and self.sends[0] <= now - self.period:
+            self.sends.popleft()
+
+    def wait_time(self, now: float) -> float:
+        # Pencereden yeterince eski gönderim çıkana kadar beklenir (0: hemen)
+        self._expire(now)
+        excess = len(self.sends) - self.capacity
+        if excess < 0:
+            return 0.0
+        return self.sends[excess] + self.period - now
+
+    def take(self, now: float):
+        self._expire(now)
+        self.sends.append(now)
+
+    def remaining(self, now: float) -> float:
+        self._expire(now)
+        return self.capacity - len(self.sends)
+
+    def to_dict(self) -> Dict[str, List[float]]:
+        return {"sends": [round(t, 3) for t in self.sends]}
+
+
+Limiter = Union[TokenBucket, SlidingWindow]
+
+
+def is_smoothing(name: str) -> bool:
+    # '_gap' ile biten kotalar üst sınır değil, gönderimler arası aralıktır (token bucket)
+    return name.endswith("_gap")
+
+
+class RateScheduler:
+    """
+    Bir gönderimin yapılabilmesi için hem genel hem de hesaba ait tüm sınırlarda hak olmalıdır.
+
+    Args:
+        accounts: Gönderici hesap adları
+        limits: Kova adı -> (adet, süre sn); varsayılan config.RATE_LIMITS
+        path: Kalan hakların saklandığı JSON dosyası
+    """
+
+    def __init__(
+        self,
+        accounts: Iterable[str],
+        limits: Optional[Dict[str, Tuple[int, float]]] = None,
+        path: Optional[Path] = None
+    ):
+        self.limits = limits or config.RATE_LIMITS
+        self.path = Path(path or config.QUOTA_STATE_PATH)
+        self.accounts = list(accounts)
+        saved = self._load()
+        # Dosya okunamadıysa kotalar dosyanın son yazıldığı anda dolmuş sayılır: gönderim geçmişi
+        # bilinmediği için her pencere kendi süresi dolana kadar hak vermez
+        filled_at = None
+        if saved is None:
+            filled_at, saved = self._last_written(), {}
+
+        self.buckets: Dict[str, Limiter] = {}
+        for name, (capacity, period) in self.limits.items():
+            keys = [name] if name.startswith("global_") else [f"{name}:{a}" for a in self.accounts]
+            for key in keys:
+                state = saved.get(key, {})
+                if is_smoothing(name):
+                    if filled_at is not None:
+                        state = {"tokens": 0.0, "updated": filled_at}
+                    self.buckets[key] = TokenBucket(
+                        capacity, period, state.get("tokens"), state.get("updated")
+                    )
+                else:
+                    sends = [filled_at] * capacity if filled_at is not None else state.get("sends", ())
+                    self.buckets[key] = SlidingWindow(capacity, period, sends)
+        # Dosyadaki diğer hesapların kotaları da korunur
+        self._other = {k: v for k, v in saved.items() if k not in self.buckets}
+
+    def _load(self) -> Optional[Dict[str, Dict]]:
+        # Dosya yoksa boş durum, okunamıyorsa None döner
+        try:
+            with open(self.path, mode="r", encoding="utf-8") as f:
+                saved = json.load(f)
+            if not isinstance(saved, dict):
+                raise ValueError("beklenmeyen biçim")
+            return saved
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("Kota durumu okunamadı, kotalar dolu kabul ediliyor: %s", e)
+            return None
+
+    def _last_written(self) -> float:
+        try:
+            return min(self.path.stat().st_mtime, time.time())
+        except OSError:
+            return time.time()
+
+    def save(self):
+        data = {**self._other, **{key: b.to_dict() for key, b in self.buckets.items()}}
+        # Yarım yazılmış dosya kalmasın diye önce geçici dosyaya yazılır
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        try:
+            with open(tmp_path, mode="w", encoding="utf-8") as f:
+                json.dump(data, f, indent=1)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.error("Kota durumu yazılamadı: %s", e)
+
+    def _buckets_for(self, account: str) -> List[Limiter]:
+        return [
+            bucket for key, bucket in self.buckets.items()
+            if key.startswith("global_") or key.endswith(f":{account}")
+        ]
+
+    def wait_time(self, account: str, now: Optional[float] = None) -> float:
+        # Bu hesabın bir sonraki gönderimi için beklenmesi gereken süre (saniye)
+        now = time.time() if now is None else now
+        return max((b.wait_time(now) for b in self._buckets_for(account)), default=0.0)
+
+    def try_acquire(self, account: str) -> bool:
+        """
+        Tüm ilgili sınırlarda hak varsa gönderim hepsine işlenir ve durum kaydedilir.
+        Hak gönderimden önce düşülür: program gönderim sırasında çökse bile kota aşılmaz.
+        """
+        now = time.time()
+        if self.wait_time(account, now) > 0:
+            return False
+        for bucket in self._buckets_for(account):
+            bucket.take(now)
+        self.save()
+        return True
+
+    def status(self) -> List[Tuple[str, float, int, float]]:
+        # (kova, kalan hak, kapasite, sıradaki hakka kalan sn)
+        now = time.time()
+        return [
+            (key, bucket.remaining(now), bucket.capacity, bucket.wait_time(now))
+            for key, bucket in sorted(self.buckets.items())
+        ]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Gönderim kotalarının durumu")
+    parser.add_argument("--file", type=Path, default=None, help="Kota durum dosyası")
+    args = parser.parse_args()
+
+    from campaign_runner import sender_accounts
+
+    path = Path(args.file or config.QUOTA_STATE_PATH)
+    accounts = [a["name"] for a in sender_accounts(len(config.SENDER_ACCOUNTS))]
+    if path.exists():
+        with open(path, mode="r", encoding="utf-8") as f:
+            accounts += [k.split(":", 1)[1] for k in json.load(f) if ":" in k]
+
+    scheduler = RateScheduler(dict.fromkeys(accounts), path=path)
+    print(f"{'kova':<28}{'kalan':>9}{'kapasite':>10}{'sıradaki hak':>15}")
+    for key, tokens, capacity, wait in scheduler.status():
+        print(f"{key:<28}{tokens:>9.2f}{capacity:>10}{wait:>13.0f} s")
@@ -0,0 +1,376 @@
+"""
+Seçici grupları tek bir execute_script çağrısıyla sayfada çözülür.
+Her XPath/CSS adayı için ayrı find_elements + is_displayed yapmak yerine tüm liste sayfaya
+gönderilir ve her grup için ilk görünür eşleşme tek WebDriver isteğinde geri alınır.
+
+Her seçicinin isabet/ıska sayısı ve süresi çalıştırmalar arasında saklanır; sıralama buna göre yapılır.
+Rapor için:
+    python selector_engine.py
+"""
+import atexit
+import json
+import os
+import threading
+from collections import namedtuple
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+import config
+from logger_utils import setup_logger
+
+logger = setup_logger(__name__)
+
+# element: WebElement, text: görünür metin, index: SELECTORS listesindeki sıra, selector: kazanan seçici
+Match = namedtuple("Match", ["element", "text", "index", "selector"])
+
+_RESOLVE_JS = r"""
+const groups = arguments[0];
+const isVisible = (el) => {
+    if (!el || !el.isConnected) return false;
+    const style = window.getComputedStyle(el);
+    if (style.visibility === 'hidden' || style.display === 'none') return false;
+    return !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+};
+const query = (candidate) => {
+    try {
+        if (candidate.xpath) {
+            const snap = document.evaluate(candidate.q, document, null,
+                XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            const nodes = [];
+            for (let i = 0; i < snap.snapshotLength; i++) nodes.push(snap.snapshotItem(i));
+            return nodes;
+        }
+        return Array.from(document.querySelectorAll(candidate.q));
+    } catch (e) {
+        return [];
+    }
+};
+const result = {};
+for (const group of groups) {
+    const found = {index: -1, elements: [], text: '', tried: []};
+    const seen = new Set();
+    for (let i = 0; i < group.candidates.length; i++) {
+        const started = performance.now();
+        const visible = query(group.candidates[i]).filter(isVisible);
+        found.tried.push({hit: visible.length > 0, ms: performance.now() - started});
+        if (!visible.length) continue;
+        if (found.index < 0) {
+            found.index = i;
+            found.text = (visible[0].innerText || visible[0].textContent || '').trim();
+        }
+        if (group.mode === 'first') {
+            found.elements = [visible[0]];
+            break;
+        }
+        for (const el of visible) {
+            if (!seen.has(el)) { seen.add(el); found.elements.push(el); }
+        }
+    }
+    if (group.mode === 'click') {
+        for (const el of found.elements) {
+            try { el.click(); } catch (e) {}
+        }
+        found.clicked = found.elements.length;
+        found.elements = [];
+    }
+    result[group.name] = found;
+}
+return result;
+"""
+
+
+def page_type_for(url: str) -> str:
+    # LinkedIn URL'sini sayfa türüne çevirir; kazanan seçiciler sayfa türü başına hatırlanır.
+    path = urlparse(url or "").path
+    if path.startswith("/in/"):
+        return "profile"
+    if path.startswith("/feed"):
+        return "feed"
+    if path.startswith("/messaging"):
+        return "messaging"
+    return "other"
+
+
+class SelectorStats:
+    """
+    Grup -> seçici -> {hits, misses, hit_ms, miss_ms} istatistiklerini JSON dosyasında tutar.
+    """
+
+    def __init__(self, path: Optional[Path] = None, dead_after: Optional[int] = None):
+        self.path = Path(path or config.SELECTOR_STATS_PATH)
+        self.dead_after = dead_after or config.SELECTOR_DEAD_AFTER
+        self.data: Dict[str, Dict[str, Dict[str, float]]] = self._load()
+        self._dirty = False
+        # Paralel çalışmada tüm tarayıcılar aynı istatistik nesnesini paylaşır
+        self._lock = threading.Lock()
+        # Program nasıl kapanırsa kapansın sayaçlar kaybolmasın
+        atexit.register(self.save)
+
+    def _load(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        try:
+            with open(self.path, mode="r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("Seçici istatistikleri okunamadı, sıfırdan başlanıyor: %s", e)
+            return {}
+
+    def record(self, group: str, selector: str, hit: bool, ms: float):
+        with self._lock:
+            self._record(group, selector, hit, ms)
+
+    def _record(self, group: str, selector: str, hit: bool, ms: float):
+        entry = self.data.setdefault(group, {}).setdefault(
+            selector, {"hits": 0, "misses": 0, "hit_ms": 0.0, "miss_ms": 0.0}
+        )
+        if hit:
+            entry["hits"] += 1
+            entry["hit_ms"] += ms
+        else:
+            entry["misses"] += 1
+            entry["miss_ms"] += ms
+        self._dirty = True
+
+    def group_hits(self, group: str) -> int:
+        return sum(entry["hits"] for entry in self.data.get(group, {}).values())
+
+    def is_dead(self, group: str, selector: str) -> bool:
+        # Grup dead_after kez çözüldüğü halde bu seçici denendiği her seferde ıskaladıysa ölüdür
+        entry = self.data.get(group, {}).get(selector)
+        return (
+            entry is not None and entry["misses"] > 0 and entry["hits"] == 0
+            and self.group_hits(group) >= self.dead_after
+        )
+
+    def is_untried(self, group: str, selector: str) -> bool:
+        # Grup dead_after kez çözüldüğü halde sıra bu seçiciye hiç gelmedi (önceki adaylar hep buldu).
+        # İşe yarayıp yaramadığı bilinmez; ölü sayılmaz, raporda ayrıca gösterilir.
+        entry = self.data.get(group, {}).get(selector)
+        return (
+            (entry is None or entry["hits"] + entry["misses"] == 0)
+            and self.group_hits(group) >= self.dead_after
+        )
+
+    def _cost(self, entry: Optional[Dict[str, float]]) -> Optional[float]:
+        # Bir isabet için beklenen süre (ms): ortalama deneme süresi / isabet oranı
+        if not entry or not entry["hits"]:
+            return None
+        return (entry["hit_ms"] + entry["miss_ms"]) / entry["hits"]
+
+    def ordered(self, group: str, candidates: List[str]) -> List[str]:
+        """
+        Adayları geçmişe göre sıralar: önce isabet etmiş seçiciler (en ucuzdan pahalıya),
+        sonra henüz isabet etmemiş olanlar, en sonda ölü seçiciler. Eşitlikte SELECTORS sırası korunur.
+        """
+        entries = self.data.get(group, {})
+
+        def key(item):
+            position, selector = item
+            cost = self._cost(entries.get(selector))
+            if cost is not None:
+                return (0, cost, position)
+            if self.is_dead(group, selector):
+                return (2, 0.0, position)
+            return (1, 0.0, position)
+
+        with self._lock:
+            return [selector for _, selector in sorted(enumerate(candidates), key=key)]
+
+    def dead_selectors(self, selectors: Dict[str, List[str]]) -> List[tuple]:
+        return [
+            (group, selector)
+            for group, candidates in selectors.items()
+            for selector in candidates if self.is_dead(group, selector)
+        ]
+
+    def untried_selectors(self, selectors: Dict[str, List[str]]) -> List[tuple]:
+        return [
+            (group, selector)
+            for group, candidates in selectors.items()
+            for selector in candidates if self.is_untried(group, selector)
+        ]
+
+    def report(self, selectors: Dict[str, List[str]]) -> str:
+        # Grup bazında isabet oranı, ortalama süre ve ölü seçiciler; sıralama çözücünün deneme sırasıdır.
+        lines = []
+        for group in sorted(set(selectors) | set(self.data)):
+            entries = self.data.get(group, {})
+            candidates = list(selectors.get(group, []))
+            candidates += [q for q in entries if q not in candidates]
+            lines.append(f"[{group}]")
+            for selector in self.ordered(group, candidates):
+                entry = entries.get(selector, {"hits": 0, "misses": 0, "hit_ms": 0.0, "miss_ms": 0.0})
+                attempts = entry["hits"] + entry["misses"]
+                rate = entry["hits"] / attempts if attempts else 0.0
+                avg_ms = (entry["hit_ms"] + entry["miss_ms"]) / attempts if attempts else 0.0
+                if selector not in selectors.get(group, []):
+                    flag = "YOK"  # Artık SELECTORS tablosunda değil
+                elif self.is_dead(group, selector):
+                    flag = "ÖLÜ"
+                elif self.is_untried(group, selector):
+                    flag = "DENENMEDİ"
+                else:
+                    flag = ""
+                lines.append(
+                    f"  {flag:<10}{entry['hits']:>6} isabet {entry['misses']:>6} ıska "
+                    f"%{rate * 100:>5.1f} {avg_ms:>8.2f} ms  {selector}"
+                )
+        return "\n".join(lines)
+
+    def save(self):
+        if not self._dirty:
+            return
+        # Yarım yazılmış dosya kalmasın diye önce geçici dosyaya yazılır
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        try:
+            with self._lock:
+                with open(tmp_path, mode="w", encoding="utf-8") as f:
+                    json.dump(self.data, f, ensure_ascii=False, indent=1)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+        except OSError as e:
+            logger.error("Seçici istatistikleri yazılamadı: %s", e)
+
+
+class SelectorEngine:
+    """
+    SELECTORS tablosundaki grupları tek istekte çözer. Adaylar kalıcı isabet istatistiklerine
+    göre sıralanır; ayrıca sayfa türü başına bu oturumda kazanan seçici önce denenir.
+    """
+
+    def __init__(self, driver, selectors: Dict[str, List[str]], stats: Optional[SelectorStats] = None):
+        self.driver = driver
+        self.selectors = selectors
+        self.stats = stats or SelectorStats()
+        self.page_type = "other"
+        self.round_trips = 0
+        self._winners: Dict[tuple, str] = {}
+
+    def set_page(self, url: str):
+        # Navigasyondan sonra çağrılır; ek bir WebDriver isteği gerektirmez.
+        self.page_type = page_type_for(url)
+
+    def _ordered(self, group: str, candidates: List[str], tracked: bool) -> List[str]:
+        # Dinamik gruplarda (ör. kişinin adıyla eşleşen sohbet kutusu) sıra çağıranındır: bir kez
+        # isabet eden genel yedek seçici öne alınırsa sonraki kişilerde başkasının kutusu bulunabilir
+        if not tracked:
+            return list(candidates)
+        candidates = self.stats.ordered(group, candidates)
+        winner = self._winners.get((self.page_type, group))
+        if winner in candidates:
+            return [winner] + [c for c in candidates if c != winner]
+        return list(candidates)
+
+    def resolve(
+        self,
+        groups: Iterable[str],
+        mode: str = "first",
+        candidates: Optional[Dict[str, List[str]]] = None
+    ) -> Dict[str, object]:
+        """
+        Birden çok seçici grubunu tek bir execute_script çağrısıyla çözer.
+
+        Args:
+            groups: SELECTORS anahtarları (veya candidates içinde tanımlı geçici gruplar)
+            mode: 'first' (ilk görünür eleman), 'all' (tüm görünürler) ya da 'click' (hepsine tıkla)
+            candidates: Grup adı -> seçici listesi; SELECTORS'ta olmayan dinamik gruplar için
+
+        Returns:
+            'first' için grup -> Match/None, 'all' için grup -> List[WebElement],
+            'click' için grup -> tıklanan eleman sayısı
+        """
+        candidates = candidates or {}
+        payload = []
+        ordered_lists = {}
+        for group in groups:
+            # Kişiye özel (dinamik) aday listeleri istatistiğe yazılmaz
+            tracked = group not in candidates
+            ordered = self._ordered(group, candidates.get(group) or self.selectors[group], tracked)
+            ordered_lists[group] = ordered
+            payload.append({
+                "name": group,
+                "mode": mode,
+                "candidates": [
+                    {"q": q, "xpath": q.startswith(("/", "(", "./"))} for q in ordered
+                ]
+            })
+
+        self.round_trips += 1
+        raw = self.driver.execute_script(_RESOLVE_JS, payload) or {}
+
+        results = {}
+        for group, ordered in ordered_lists.items():
+            found = raw.get(group) or {}
+            index = found.get("index", -1)
+            selector = ordered[index] if index >= 0 else None
+            if selector is not None and group not in candidates:
+                self._winners[(self.page_type, group)] = selector
+                # Sadece çözülen denemeler sayılır; sayfa henüz yüklenmemişken yapılan yoklamalar
+                # ve 'all' modundaki kaybolma kontrolleri seçicinin başarısını göstermez
+                if mode != "all":
+                    for q, attempt in zip(ordered, found.get("tried") or []):
+                        self.stats.record(group, q, attempt["hit"], attempt["ms"])
+
+            if mode == "click":
+                results[group] = found.get("clicked", 0)
+            elif mode == "all":
+                results[group] = found.get("elements") or []
+            elif selector is not None and found.get("elements"):
+                original = candidates.get(group) or self.selectors[group]
+                results[group] = Match(
+                    found["elements"][0], found.get("text", ""), original.index(selector), selector
+                )
+            else:
+                results[group] = None
+        return results
+
+    def close(self):
+        self.stats.save()
+
+    def first(self, group: str, candidates: Optional[List[str]] = None) -> Optional[Match]:
+        extra = {group: candidates} if candidates else None
+        return self.resolve([group], "first", extra)[group]
+
+    def click_all(self, group: str) -> int:
+        # Gruptaki tüm görünür elemanlara tek istekte (JS ile) tıklar.
+        return self.resolve([group], "click")[group]
+
+    # --- AdaptiveWaiter koşulları (her yoklama tek WebDriver isteği) ---
+
+    def visible(self, group: str, candidates: Optional[List[str]] = None) -> Callable:
+        def condition(driver):
+            return self.first(group, candidates)
+        return condition
+
+    def none_visible(self, group: str) -> Callable:
+        def condition(driver):
+            return not self.resolve([group], "all")[group]
+        return condition
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Seçici isabet istatistikleri ve ölü seçiciler")
+    parser.add_argument("--file", type=Path, default=None, help="İstatistik dosyası")
+    args = parser.parse_args()
+
+    from linkedin_automation import SELECTORS
+
+    stats = SelectorStats(args.file)
+    if not stats.data:
+        print(f"Henüz istatistik yok: {stats.path}")
+        raise SystemExit(0)
+
+    print(stats.report(SELECTORS))
+    dead = stats.dead_selectors(SELECTORS)
+    if dead:
+        print(f"\n⚠️ {len(dead)} ölü seçici ({stats.dead_after}+ çözümde hiç isabet yok):")
+        for group, selector in dead:
+            print(f"  {group}: {selector}")
+    untried = stats.untried_selectors(SELECTORS)
+    if untried:
+        print(f"\nℹ️ {len(untried)} seçici hiç denenmedi (önceki adaylar hep isabet etti; yedek olarak kalabilir):")
+        for group, selector in untried:
+            print(f"  {group}: {selector}")
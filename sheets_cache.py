@@ -0,0 +1,225 @@
+"""
+Google E-Tablolar çalışma sayfasının yerel SQLite anlık görüntüsü (snapshot).
+"""
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+import config
+from logger_utils import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def row_hash(values: List[str]) -> str:
+    # Satır içeriğinin kısa özetini üretir; değişen satırları bulmak için kullanılır.
+    payload = json.dumps(values, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def key_hash(cells: List[str]) -> str:
+    # Kayda giren sütunların (COLUMN_MAPPING) kırpılmış değerlerinin özeti; uzak sayfanın
+    # sadece bu sütunları çekilerek değişen satırlar bulunur.
+    return row_hash([str(cell).strip() for cell in cells])
+
+
+class SheetSnapshot:
+    """
+    Normalize edilmemiş satır değerlerini satır başına içerik özetiyle birlikte saklar.
+    E-tablo değişmediyse tüm okumalar ağa çıkmadan buradan yapılır.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or config.SHEETS_CACHE_PATH
+        # Kampanya çalışırken okuma/yazımlar tek bir G/Ç iş parçacığından yapılır;
+        # bağlantının açıldığı iş parçacığı o olmayabilir
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._initialize_db()
+
+    def _initialize_db(self):
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (
+                key   TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS rows (
+                row_num INTEGER PRIMARY KEY,
+                hash    TEXT NOT NULL,
+                status  TEXT NOT NULL,
+                data    TEXT NOT NULL,
+                keys    TEXT NOT NULL DEFAULT ''
+            );
+            CREATE INDEX IF NOT EXISTS idx_rows_status ON rows(status);
+        """)
+        # Eski sürümün dosyasında anahtar özeti yoktur; satırlar bir kez baştan indirilir
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(rows)")}
+        if "keys" not in columns:
+            self.conn.execute("ALTER TABLE rows ADD COLUMN keys TEXT NOT NULL DEFAULT ''")
+            self.conn.execute("DELETE FROM rows")
+            self.conn.execute("DELETE FROM meta WHERE key = 'modified_time'")
+        self.conn.commit()
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str):
+        self.conn.execute(
+            "INSERT INTO meta(key, value) VALUES(?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value)
+        )
+
+    def is_fresh(self, source_key: str, modified_time: Optional[str]) -> bool:
+        # Anlık görüntü aynı kaynaktan ve aynı değişiklik zamanından alındıysa True döner.
+        if not modified_time:
+            return False
+        return (
+            self._get_meta("source") == source_key
+            and self._get_meta("modified_time") == modified_time
+            and self._get_meta("headers") is not None
+        )
+
+    def headers(self) -> List[str]:
+        raw = self._get_meta("headers")
+        return json.loads(raw) if raw else []
+
+    def can_diff(self, source_key: str, headers: List[str]) -> bool:
+        # Aynı sayfanın aynı sütun düzeniyle alınmış bir anlık görüntüsü varsa sadece farklar çekilebilir.
+        return (
+            self._get_meta("source") == source_key
+            and self.headers() == headers
+            and self.conn.execute("SELECT 1 FROM rows LIMIT 1").fetchone() is not None
+        )
+
+    def key_hashes(self) -> Dict[int, str]:
+        # Satır -> anahtar sütunlarının özeti (key_hash); uzak sayfayla karşılaştırmak için.
+        return dict(self.conn.execute("SELECT row_num, keys FROM rows"))
+
+    def begin_sync(self, source_key: str, headers: List[str]):
+        """
+        Sayfa sayfa eşitlemeyi başlatır. finish_sync çağrılana kadar anlık görüntü güncel sayılmaz.
+        """
+        if self._get_meta("source") != source_key or self.headers() != headers:
+            # Farklı bir sayfa ya da sütun düzeni: eski satırlar geçersiz
+            self.conn.execute("DELETE FROM rows")
+
+        self.conn.execute("DELETE FROM meta WHERE key = 'modified_time'")
+        self._set_meta("source", source_key)
+        self._set_meta("headers", json.dumps(headers, ensure_ascii=False))
+        self.conn.commit()
+
+    def write_page(
+        self,
+        first_row: int,
+        last_row: int,
+        rows: List[Tuple[int, List[str]]],
+        status_index: Optional[int],
+        key_indexes: Optional[List[Optional[int]]] = None
+    ) -> int:
+        """
+        [first_row, last_row] aralığındaki uzak satırları yazar; yalnızca içeriği değişenler güncellenir,
+        aralıkta artık bulunmayan (boşaltılmış) satırlar silinir.
+
+        Args:
+            key_indexes: Kayda giren sütunların (COLUMN_MAPPING sırasıyla) 0-tabanlı indeksleri,
+                sayfada olmayanlar None; satırın key_hash özeti bunlardan hesaplanır
+
+        Returns:
+            Eklenen veya güncellenen satır sayısı
+        """
+        known = dict(self.conn.execute(
+            "SELECT row_num, hash FROM rows WHERE row_num BETWEEN ? AND ?",
+            (first_row, last_row)
+        ))
+        changed = []
+        for row_num, values in rows:
+            digest = row_hash(values)
+            if known.pop(row_num, None) != digest:
+                status = _cell(values, status_index).strip()
+                keys = _keys(values, key_indexes)
+                changed.append((row_num, digest, status, json.dumps(values, ensure_ascii=False), keys))
+
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO rows(row_num, hash, status, data, keys) VALUES(?, ?, ?, ?, ?)",
+            changed
+        )
+        self.conn.executemany("DELETE FROM rows WHERE row_num = ?", [(r,) for r in known])
+        self.conn.commit()
+        return len(changed)
+
+    def finish_sync(self, end_row: int, modified_time: Optional[str]):
+        # Sayfanın sonundan sonra kalan eski satırları siler ve anlık görüntüyü güncel işaretler.
+        self.conn.execute("DELETE FROM rows WHERE row_num >= ?", (end_row,))
+        if modified_time:
+            self._set_meta("modified_time", modified_time)
+        self.conn.commit()
+
+    def iter_rows(self, statuses: Optional[List[str]] = None) -> Iterator[Tuple[int, List[str]]]:
+        # (satır_no, değerler) çiftlerini satır sırasıyla döndürür; istenirse duruma göre süzer.
+        if statuses is None:
+            cursor = self.conn.execute("SELECT row_num, data FROM rows ORDER BY row_num")
+        else:
+            marks = ",".join("?" * len(statuses))
+            cursor = self.conn.execute(
+                f"SELECT row_num, data FROM rows WHERE status IN ({marks}) ORDER BY row_num",
+                list(statuses)
+            )
+        for row_num, data in cursor:
+            yield row_num, json.loads(data)
+
+    def apply_cells(
+        self,
+        cells: Dict[Tuple[int, int], str],
+        status_index: Optional[int],
+        key_indexes: Optional[List[Optional[int]]] = None
+    ):
+        """
+        E-tabloya başarıyla yazılan hücreleri anlık görüntüye de işler.
+
+        Args:
+            cells: (0-tabanlı satır_no, 0-tabanlı sütun) -> yeni değer
+            status_index: Durum sütununun 0-tabanlı indeksi
+            key_indexes: Anahtar sütunlarının 0-tabanlı indeksleri (bkz. write_page)
+        """
+        by_row: Dict[int, Dict[int, str]] = {}
+        for (row_num, col), value in cells.items():
+            by_row.setdefault(row_num, {})[col] = value
+
+        for row_num, updates in by_row.items():
+            found = self.conn.execute(
+                "SELECT data FROM rows WHERE row_num = ?", (row_num,)
+            ).fetchone()
+            if not found:
+                continue
+            values = json.loads(found[0])
+            for col, value in updates.items():
+                values.extend([""] * (col + 1 - len(values)))
+                values[col] = value
+            self.conn.execute(
+                "UPDATE rows SET hash = ?, status = ?, data = ?, keys = ? WHERE row_num = ?",
+                (
+                    row_hash(values),
+                    _cell(values, status_index).strip(),
+                    json.dumps(values, ensure_ascii=False),
+                    _keys(values, key_indexes),
+                    row_num
+                )
+            )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+def _cell(values: List[str], index: Optional[int]) -> str:
+    if index is None or index >= len(values):
+        return ""
+    return str(values[index])
+
+
+def _keys(values: List[str], key_indexes: Optional[List[Optional[int]]]) -> str:
+    if key_indexes is None:
+        return ""
+    return key_hash([_cell(values, index) for index in key_indexes])
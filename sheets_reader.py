@@ -1,24 +1,49 @@
+import atexit
+import time
 import gspread
+from gspread.urls import DRIVE_FILES_API_V3_URL
+from gspread.utils import rowcol_to_a1
 from oauth2client.service_account import ServiceAccountCredentials
-from typing import List, Dict, Optional
+from typing import Iterable, Iterator, List, Dict, Optional, Set, Tuple
 import config
+from alumni_record import AlumniRecord, field_indexes_for
+from data_sources import AlumniSource
+from linkedin_urls import normalize_linkedin_url
 from logger_utils import setup_logger
+from metrics import span, timed
+from sheets_cache import SheetSnapshot, key_hash
 
 logger = setup_logger(__name__)
 
-
-class GoogleSheetsReader:
+class GoogleSheetsReader(AlumniSource):
     """
     Mezun veri yönetimi için tüm Google E-Tablolar işlemlerini yürütür.
     """
     
-    def __init__(self, credentials_path: Optional[str] = None):
+    def __init__(self, credentials_path: Optional[str] = None, client=None):
         # Google E-Tablolar istemcisini başlatır.
+        # client verilirse (örn. fake_sheets.FakeSheetsClient) kimlik doğrulama yapılmaz.
         self.credentials_path = credentials_path or config.CREDENTIALS_PATH
-        self.client = None
+        self.client = client
         self.spreadsheet = None
         self.worksheet = None
-        self._connect()
+        
+        # Başlık satırı önbelleği ve bekleyen hücre yazımları: (satır, sütun) -> değer
+        self._headers: Optional[List[str]] = None
+        self._field_indexes: Dict[str, int] = {}
+        self._field_indexes_headers: Optional[List[str]] = None
+        self._pending_updates: Dict[Tuple[int, int], str] = {}
+        self._first_pending_at: Optional[float] = None
+        
+        # Kanonik LinkedIn URL -> 0-tabanlı satır dizini (ilk aramada kurulur)
+        self._url_index: Optional[Dict[str, int]] = None
+        
+        # Yerel anlık görüntü: e-tablo değişmediyse okumalar ağa çıkmaz
+        self.snapshot = SheetSnapshot() if config.SHEETS_CACHE_ENABLED else None
+        
+        if self.client is None:
+            self._connect()
+        atexit.register(self.flush_updates)
     
     def _connect(self):
         # Google Sheets API ile bağlantı kurar.
@@ -37,10 +62,10 @@ class GoogleSheetsReader:
             logger.info("Google Sheets API'ye başarıyla bağlanıldı")
             
         except FileNotFoundError:
-            logger.error(f"Kimlik doğrulama dosyası bulunamadı: {self.credentials_path}")
+            logger.error("Kimlik doğrulama dosyası bulunamadı: %s", self.credentials_path)
             raise
         except Exception as e:
-            logger.error(f"Google Sheets'e bağlanılamadı: {e}")
+            logger.error("Google Sheets'e bağlanılamadı: %s", e)
             raise
     
     def open_spreadsheet(
@@ -55,108 +80,421 @@ class GoogleSheetsReader:
         try:
             self.spreadsheet = self.client.open(spreadsheet_name)
             self.worksheet = self.spreadsheet.worksheet(worksheet_name)
-            logger.info(f"E-Tablo açıldı: {spreadsheet_name}/{worksheet_name}")
+            self._headers = None
+            self._url_index = None
+            logger.info("E-Tablo açıldı: %s/%s", spreadsheet_name, worksheet_name)
             
         except gspread.SpreadsheetNotFound:
-            logger.error(f"E-Tablo bulunamadı: {spreadsheet_name}")
+            logger.error("E-Tablo bulunamadı: %s", spreadsheet_name)
             logger.info("E-tabloyu servis hesabı e-postasıyla paylaştığınızdan emin olun")
             raise
         except gspread.WorksheetNotFound:
-            logger.error(f"Çalışma sayfası bulunamadı: {worksheet_name}")
+            logger.error("Çalışma sayfası bulunamadı: %s", worksheet_name)
             raise
     
-    def get_all_alumni(self) -> List[Dict]:
-        """
-        Çalışma sayfasındaki tüm mezun kayıtlarını çeker.
-        """
+    def _get_headers(self) -> List[str]:
+        # Başlık satırını bir kez okur ve sonraki çağrılar için önbellekte tutar.
         if not self.worksheet:
             self.open_spreadsheet()
         
+        if self._headers is None:
+            self._headers = self.worksheet.row_values(1)
+        return self._headers
+    
+    def _column_index(self, key: str) -> Optional[int]:
+        # COLUMN_MAPPING anahtarına karşılık gelen 1-tabanlı sütun numarasını döndürür.
+        column_name = config.COLUMN_MAPPING.get(key)
+        headers = self._get_headers()
+        
+        if column_name in headers:
+            return headers.index(column_name) + 1
+        return None
+    
+    def _source_key(self) -> str:
+        # Anlık görüntünün hangi e-tablo/çalışma sayfasına ait olduğunu belirtir.
+        return f"{self.spreadsheet.id}/{self.worksheet.title}"
+    
+    @timed("sheets.modified_time")
+    def _remote_modified_time(self) -> Optional[str]:
+        # E-tablonun Drive üzerindeki son değişiklik zamanını tek hafif istekle alır.
         try:
-            # Tüm kayıtları al
-            records = self.worksheet.get_all_records()
+            response = self.client.request(
+                "get",
+                f"{DRIVE_FILES_API_V3_URL}/{self.spreadsheet.id}",
+                params={"fields": "modifiedTime", "supportsAllDrives": True}
+            )
+            return response.json().get("modifiedTime")
+        except Exception as e:
+            logger.debug("E-tablo değişiklik zamanı alınamadı: %s", e)
+            return None
+    
+    def _status_index(self) -> Optional[int]:
+        status_col = self._column_index("status")
+        return status_col - 1 if status_col is not None else None
+    
+    def _key_indexes(self) -> List[Optional[int]]:
+        # Kayda giren sütunların (COLUMN_MAPPING sırasıyla) 0-tabanlı indeksleri; sayfada olmayanlar None.
+        headers = self._get_headers()
+        return [headers.index(name) if name in headers else None for name in config.COLUMN_MAPPING.values()]
+    
+    def _iter_rows(
+        self,
+        chunk_rows: int,
+        statuses: Optional[List[str]] = None
+    ) -> Iterator[Tuple[int, List[str]]]:
+        # (0-tabanlı satır_no, satır değerleri) çiftlerini tembel (lazy) olarak üretir.
+        # Anlık görüntü güncelse oradan, değilse e-tablodan sayfa sayfa okur.
+        if not self.worksheet:
+            self.open_spreadsheet()
+        
+        modified_time = None
+        if self.snapshot is not None:
+            modified_time = self._remote_modified_time()
+            if self.snapshot.is_fresh(self._source_key(), modified_time):
+                self._headers = self.snapshot.headers()
+                logger.info("Yerel anlık görüntü güncel, e-tablo yeniden indirilmedi")
+                yield from self.snapshot.iter_rows(statuses)
+                return
+            if self._sync_changed_rows(modified_time):
+                yield from self.snapshot.iter_rows(statuses)
+                return
+        
+        yield from self._stream_rows(chunk_rows, statuses, modified_time)
+    
+    def _sync_changed_rows(self, modified_time: Optional[str]) -> bool:
+        # E-tablo değiştiyse önce sadece kayda giren sütunlar (COLUMN_MAPPING) tek istekte çekilir;
+        # özetleri anlık görüntüdekinden farklı olan satır aralıkları tam olarak indirilir.
+        # Fark çok büyükse False döner (tam eşitleme yapılır).
+        self._headers = None
+        headers = self._get_headers()
+        key_indexes = self._key_indexes()
+        present = sorted({index for index in key_indexes if index is not None})
+        if not headers or not present or not self.snapshot.can_diff(self._source_key(), headers):
+            return False
+        
+        total_rows = self.worksheet.row_count
+        letters = [rowcol_to_a1(1, index + 1)[:-1] for index in present]
+        with span("sheets.read_keys", columns=len(present)):
+            pages = self.worksheet.batch_get([f"{letter}2:{letter}{total_rows}" for letter in letters])
+        columns = dict(zip(present, pages))
+        
+        known = self.snapshot.key_hashes()
+        empty = key_hash([""] * len(key_indexes))
+        last_row = min(
+            max(max((len(page) for page in pages), default=0), max(known, default=-1) + 1),
+            total_rows - 1
+        )
+        changed = [
+            row_num for row_num in range(last_row)
+            if key_hash([
+                self._column_cell(columns[index], row_num) if index is not None else ""
+                for index in key_indexes
+            ]) != known.get(row_num, empty)
+        ]
+        if len(changed) > config.SHEETS_DIFF_MAX_RATIO * max(len(known), 1):
+            logger.info("%d satır değişmiş, e-tablo baştan indirilecek", len(changed))
+            return False
+        
+        # Ardışık satırlar tek aralıkta çekilir: [ilk, son] (0-tabanlı)
+        ranges: List[List[int]] = []
+        for row_num in changed:
+            if ranges and row_num == ranges[-1][1] + 1:
+                ranges[-1][1] = row_num
+            else:
+                ranges.append([row_num, row_num])
+        
+        status_index = self._status_index()
+        last_col = rowcol_to_a1(1, len(headers))[:-1]
+        self.snapshot.begin_sync(self._source_key(), headers)
+        updated = 0
+        for i in range(0, len(ranges), config.SHEETS_DIFF_RANGES_PER_REQUEST):
+            batch = ranges[i:i + config.SHEETS_DIFF_RANGES_PER_REQUEST]
+            with span("sheets.read_changed", ranges=len(batch)):
+                pages = self.worksheet.batch_get([f"A{first + 2}:{last_col}{last + 2}" for first, last in batch])
+            for (first, last), page in zip(batch, pages):
+                rows = [
+                    (first + j, list(values))
+                    for j, values in enumerate(page)
+                    if any(str(v).strip() for v in values)
+                ]
+                updated += self.snapshot.write_page(first, last, rows, status_index, key_indexes)
+        
+        self.snapshot.finish_sync(total_rows - 1, modified_time)
+        logger.info("Anlık görüntü güncellendi: %d satır değişmiş, %d aralık indirildi", updated, len(ranges))
+        return True
+    
+    @staticmethod
+    def _column_cell(values: List[List[str]], row_num: int) -> str:
+        # Tek sütunluk aralıkta boş hücreler boş satır ([]) olarak, sondakiler hiç gelmez.
+        if row_num >= len(values) or not values[row_num]:
+            return ""
+        return str(values[row_num][0]).strip()
+    
+    def _stream_rows(
+        self,
+        chunk_rows: int,
+        statuses: Optional[List[str]],
+        modified_time: Optional[str]
+    ) -> Iterator[Tuple[int, List[str]]]:
+        # Çalışma sayfasını A1 aralıkları halinde sayfa sayfa çeker; her sayfa anlık görüntüye de yazılır.
+        self._headers = None
+        headers = self._get_headers()
+        if not headers:
+            return
+        
+        status_index = self._status_index()
+        key_indexes = self._key_indexes()
+        last_col = rowcol_to_a1(1, len(headers))[:-1]
+        total_rows = self.worksheet.row_count
+        
+        if self.snapshot is not None:
+            self.snapshot.begin_sync(self._source_key(), headers)
+        
+        changed = 0
+        start = 2  # 1. satır başlık
+        while start <= total_rows:
+            end = min(start + chunk_rows - 1, total_rows)
+            with span("sheets.read_page"):
+                page = self.worksheet.get(f"A{start}:{last_col}{end}")
             
-            # Config eşleşmelerini kullanarak sütun isimlerini standartlaştır
-            normalized_records = []
+            # Tamamen boş satırlar atlanır; satır numarası sayfadaki konumdan hesaplanır
+            rows = [
+                (start - 2 + i, list(values))
+                for i, values in enumerate(page)
+                if any(str(v).strip() for v in values)
+            ]
+            if self.snapshot is not None:
+                changed += self.snapshot.write_page(start - 2, end - 2, rows, status_index, key_indexes)
             
-            # --- enumerate ile sıra numarasını alıyoruz ---
-            for i, record in enumerate(records):
-                normalized = {}
-                for key, sheet_column in config.COLUMN_MAPPING.items():
-                    normalized[key] = record.get(sheet_column, "")
-                
-                # Orijinal veri ve SATIR NUMARASINI kaydet
-                normalized["_original"] = record
-                normalized["_row_num"] = i  
-                
-                normalized_records.append(normalized)
+            for row_num, values in rows:
+                if statuses is None or self._cell_value(values, status_index).strip() in statuses:
+                    yield row_num, values
+            start = end + 1
+        
+        # Tüketici yarıda bırakırsa buraya gelinmez; anlık görüntü bir sonraki okumada tamamlanır
+        if self.snapshot is not None:
+            self.snapshot.finish_sync(total_rows - 1, modified_time)
+            logger.info("Anlık görüntü yenilendi (%d satır değişmiş)", changed)
+    
+    @staticmethod
+    def _cell_value(values: List[str], index: Optional[int]) -> str:
+        # Kısa (sondaki boş hücreleri kırpılmış) satırlarda eksik hücreyi boş kabul eder.
+        if index is None or index >= len(values):
+            return ""
+        return str(values[index])
+    
+    def _normalize(self, values: List[str], row_num: int) -> AlumniRecord:
+        # Ham satırı config eşleşmelerine göre AlumniRecord'a çevirir.
+        # Sütun indeksleri başlık satırı değişmedikçe bir kez hesaplanır.
+        if self._field_indexes_headers is not self._headers:
+            self._field_indexes = field_indexes_for(self._headers)
+            self._field_indexes_headers = self._headers
+        return AlumniRecord.from_row(self._headers, values, row_num, self._field_indexes)
+    
+    def iter_alumni(
+        self,
+        chunk_rows: Optional[int] = None,
+        statuses: Optional[List[str]] = None
+    ) -> Iterator[AlumniRecord]:
+        """
+        Mezun kayıtlarını tüm sayfanın inmesini beklemeden, parça parça üretir.
+        
+        Args:
+            chunk_rows: Tek istekte çekilecek satır sayısı (varsayılan: config.SHEETS_CHUNK_ROWS)
+            statuses: Verilirse sadece bu durumlardaki kayıtlar üretilir
             
-            logger.info(f"{len(normalized_records)} adet mezun kaydı çekildi")
+        Yields:
+            Mezun kaydı (row_num 0-tabanlı veri satırı numarasıdır)
+        """
+        chunk_rows = chunk_rows or config.SHEETS_CHUNK_ROWS
+        for row_num, values in self._iter_rows(chunk_rows, statuses):
+            yield self._normalize(values, row_num)
+    
+    def iter_pending_alumni(self, chunk_rows: Optional[int] = None) -> Iterator[AlumniRecord]:
+        # Beklemedeki mezunları ilk sayfa iner inmez üretmeye başlar.
+        return self.iter_alumni(chunk_rows, ["", config.STATUS_PENDING])
+    
+    def get_all_alumni(self) -> List[AlumniRecord]:
+        """
+        Çalışma sayfasındaki tüm mezun kayıtlarını çeker.
+        E-tablo son okumadan beri değişmediyse kayıtlar yerel anlık görüntüden gelir.
+        """
+        try:
+            normalized_records = list(self.iter_alumni())
+            
+            logger.info("%d adet mezun kaydı çekildi", len(normalized_records))
             return normalized_records
             
         except Exception as e:
-            logger.error(f"Mezun verileri alınırken hata oluştu: {e}")
+            logger.error("Mezun verileri alınırken hata oluştu: %s", e)
             raise
     
-    def get_pending_alumni(self) -> List[Dict]:
+    def get_pending_alumni(self) -> List[AlumniRecord]:
         # Sadece 'beklemede' (işlem yapılmamış) durumundaki mezunları getirir.
-        all_alumni = self.get_all_alumni()
-        
-        pending = [
-            alumni for alumni in all_alumni
-            if alumni.get("status", "").strip() in ["", config.STATUS_PENDING]
-        ]
+        # Anlık görüntü güncelse süzme, durum sütunu üzerindeki SQLite indeksiyle yapılır.
+        try:
+            pending = list(self.iter_pending_alumni())
+        except Exception as e:
+            logger.error("Mezun verileri alınırken hata oluştu: %s", e)
+            raise
         
-        logger.info(f"{len(pending)} adet beklemede olan mezun kaydı bulundu")
+        logger.info("%d adet beklemede olan mezun kaydı bulundu", len(pending))
         return pending
     
-    def update_status(self, row_index: int, status: str, notes: str = ""):
-        # Belirli bir mezun için durum sütununu günceller.
-        if not self.worksheet:
-            self.open_spreadsheet()
-        
+    def update_status(self, row_index: int, status: str, notes: str = "") -> bool:
+        # Belirli bir mezun için durum (ve varsa notlar) sütununu güncellenmek üzere tampona ekler.
+        # Hücreler SHEETS_BATCH_SIZE / SHEETS_FLUSH_INTERVAL eşiğinde tek istekle yazılır.
+        # Tampona alınamadıysa False döner (yazım hatası sessizce kaybolmasın).
         try:
-            # Durum sütununu bul
-            headers = self.worksheet.row_values(1)
-            status_col_name = config.COLUMN_MAPPING.get("status", "Durum")
+            status_col = self._column_index("status")
+            if status_col is None:
+                status_col_name = config.COLUMN_MAPPING.get("status", "Durum")
+                logger.warning("Durum sütunu '%s' bulunamadı", status_col_name)
+                return False
             
-            if status_col_name in headers:
-                status_col = headers.index(status_col_name) + 1
-                # Satır indeksi + 2 (0-tabanlıdan 1-tabanlıya geçiş + başlık satırı)
-                actual_row = row_index + 2
-                self.worksheet.update_cell(actual_row, status_col, status)
-                logger.debug(f"{actual_row}. satır durumu güncellendi: {status}")
-            else:
-                logger.warning(f"Durum sütunu '{status_col_name}' bulunamadı")
+            # Satır indeksi + 2 (0-tabanlıdan 1-tabanlıya geçiş + başlık satırı)
+            actual_row = row_index + 2
+            self._queue_cell(actual_row, status_col, status)
+            
+            if notes:
+                notes_col = self._column_index("notes")
+                if notes_col is not None:
+                    self._queue_cell(actual_row, notes_col, notes)
+            
+            logger.debug("%d. satır durumu tampona alındı: %s", actual_row, status)
+            
+            if self._flush_due():
+                self.flush_updates()
+            return True
                 
         except Exception as e:
-            logger.error(f"Durum güncelleme hatası: {e}")
+            logger.error("Durum güncelleme hatası: %s", e)
+            return False
     
-    def find_alumni_row(self, linkedin_url: str) -> Optional[int]:
-        # LinkedIn URL'sine göre bir mezunun satır numarasını bulur.
-        if not self.worksheet:
-            self.open_spreadsheet()
+    def _queue_cell(self, row: int, col: int, value: str):
+        # Aynı hücreye gelen son değer öncekilerin yerine geçer.
+        if self._first_pending_at is None:
+            self._first_pending_at = time.monotonic()
+        self._pending_updates[(row, col)] = value
+    
+    def _flush_due(self) -> bool:
+        # Boyut veya zaman eşiği aşıldıysa True döner.
+        if not self._pending_updates:
+            return False
+        if len(self._pending_updates) >= config.SHEETS_BATCH_SIZE:
+            return True
+        elapsed = time.monotonic() - self._first_pending_at
+        return elapsed >= config.SHEETS_FLUSH_INTERVAL
+    
+    def flush_updates(self) -> bool:
+        """
+        Bekleyen tüm hücre yazımlarını tek bir batch_update isteğiyle gönderir.
+        Başarısız olursa yazımlar tamponda kalır ve bir sonraki boşaltmada tekrar denenir.
+        """
+        if not self._pending_updates:
+            return True
+        
+        updates = self._pending_updates
+        self._pending_updates = {}
+        self._first_pending_at = None
+        
+        data = [
+            {"range": rowcol_to_a1(row, col), "values": [[value]]}
+            for (row, col), value in sorted(updates.items())
+        ]
         
         try:
+            with span("sheets.flush", cells=len(data)):
+                self.worksheet.batch_update(data)
+            logger.debug("%d hücre tek istekte güncellendi", len(data))
+        except Exception as e:
+            logger.error("Toplu durum güncelleme hatası: %s", e)
+            # Bu arada daha yeni bir değer yazılmadıysa eskileri geri koy
+            for key, value in updates.items():
+                self._pending_updates.setdefault(key, value)
+            self._first_pending_at = time.monotonic()
+            return False
+        
+        if self.snapshot is not None:
+            # Kendi yazımlarımız anlık görüntüye işlenir; değişiklik zamanı ilerletilmez, çünkü
+            # araya başkasının düzenlemesi girmiş olabilir. Sonraki okumada fark kontrolü kendi
+            # yazdığımız satırları aynı bulur, sadece başkalarının değiştirdikleri indirilir.
+            try:
+                self.snapshot.apply_cells(
+                    {(row - 2, col - 1): value for (row, col), value in updates.items()},
+                    self._status_index(),
+                    self._key_indexes()
+                )
+            except Exception as e:
+                logger.warning("Anlık görüntü güncellenemedi: %s", e)
+        return True
+    
+    def pending_rows(self) -> Set[int]:
+        # Tamponda bekleyen (henüz e-tabloya yazılmamış) 0-tabanlı satırlar.
+        return {row - 2 for row, _ in self._pending_updates}
+    
+    def close(self):
+        # Kapanışta bekleyen yazımları boşaltır.
+        self.flush_updates()
+        atexit.unregister(self.flush_updates)
+        if self.snapshot is not None:
+            self.snapshot.close()
+    
+    @timed("sheets.url_index")
+    def _build_url_index(self):
+        # URL sütununu tek bir batch_get isteğiyle çekip bellek içi dizini kurar.
+        url_col = self._column_index("linkedin_url")
+        if url_col is None:
             url_column = config.COLUMN_MAPPING.get("linkedin_url", "LinkedIn URL")
-            headers = self.worksheet.row_values(1)
-            
-            if url_column in headers:
-                col_index = headers.index(url_column) + 1
-                cell = self.worksheet.find(linkedin_url, in_column=col_index)
-                if cell:
-                    return cell.row - 2  # 0-tabanlı indekse çevir
-            return None
+            logger.warning("URL sütunu '%s' bulunamadı", url_column)
+            self._url_index = {}
+            return
+        
+        letter = rowcol_to_a1(1, url_col)[:-1]
+        url_cells = self.worksheet.batch_get([f"{letter}2:{letter}"])[0]
+        
+        url_index: Dict[str, int] = {}
+        for row_num, cell in enumerate(url_cells):
+            key = normalize_linkedin_url(cell[0] if cell else "")
+            if key:
+                # worksheet.find ile aynı davranış: ilk eşleşen satır kazanır
+                url_index.setdefault(key, row_num)
+        
+        self._url_index = url_index
+        logger.debug("URL dizini kuruldu: %d kayıt", len(url_index))
+    
+    def find_rows(self, linkedin_urls: Iterable[str], refresh: bool = False) -> Dict[str, Optional[int]]:
+        """
+        Birden çok LinkedIn URL'sinin satır numaralarını tek seferde bulur.
+        Dizin ilk çağrıda bir kez kurulur; sonraki aramalar ağa çıkmaz.
+        
+        Args:
+            linkedin_urls: Aranacak URL'ler (biçim farkları önemsizdir)
+            refresh: True ise dizin e-tablodan yeniden kurulur
             
+        Returns:
+            URL -> 0-tabanlı satır numarası (bulunamazsa None)
+        """
+        if not self.worksheet:
+            self.open_spreadsheet()
+        
+        try:
+            if refresh or self._url_index is None:
+                self._build_url_index()
         except Exception as e:
-            logger.error(f"Mezun satırı bulma hatası: {e}")
-            return None
+            logger.error("URL dizini kurulamadı: %s", e)
+            return {url: None for url in linkedin_urls}
+        
+        return {
+            url: self._url_index.get(normalize_linkedin_url(url))
+            for url in linkedin_urls
+        }
 
 def get_alumni_data(
     spreadsheet_name: Optional[str] = None,
     worksheet_name: Optional[str] = None,
     only_pending: bool = True
-) -> List[Dict]:
+) -> List[AlumniRecord]:
     # Mezun verilerini almak için yardımcı fonksiyon.
     reader = GoogleSheetsReader()
     reader.open_spreadsheet(spreadsheet_name, worksheet_name)
@@ -176,9 +514,8 @@ if __name__ == "__main__":
         print(f"\n✅ {len(alumni)} adet kayıt başarıyla çekildi")
         if alumni:
             print("\nİlk kayıt örneği:")
-            print(f"  Satır Numarası: {alumni[0].get('_row_num')}")
-            for key, value in alumni[0].items():
-                if key not in ["_original", "_row_num"]:
-                    print(f"  {key}: {value}")
+            print(f"  Satır Numarası: {alumni[0].row_num}")
+            for key, value in alumni[0].to_dict().items():
+                print(f"  {key}: {value}")
     except Exception as e:
         print(f"\n❌ Hata: {e}")
\ No newline at end of file
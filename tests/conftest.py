@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Modüller düz dizinde durur; testler depo kökünden içe aktarır
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,91 @@
+import asyncio
+
+import config
+from alumni_record import AlumniRecord
+from campaign_runner import CampaignRunner
+from data_sources import AlumniSource
+from outcomes import sent
+from priority_scheduler import PriorityScheduler
+from retry_queue import RetryQueue
+from scheduler import RateScheduler
+
+
+class BufferedSource(AlumniSource):
+    """Durumları SHEETS_BATCH_SIZE dolana kadar tamponlayan, boşaltmaları sayan kaynak."""
+
+    def __init__(self):
+        self.pending = {}
+        self.flushes = []
+
+    def iter_alumni(self, chunk_rows=None, statuses=None):
+        return iter([])
+
+    def update_status(self, row_index, status, notes=""):
+        self.pending[row_index] = status
+        if len(self.pending) >= config.SHEETS_BATCH_SIZE:
+            self.flush_updates()
+        return True
+
+    def flush_updates(self):
+        if self.pending:
+            self.flushes.append(len(self.pending))
+            self.pending = {}
+        return True
+
+    def pending_rows(self):
+        return set(self.pending)
+
+
+class Bot:
+    def send_message_fast(self, url, message):
+        return sent()
+
+
+class Generator:
+    def generate(self, person):
+        return f"Merhaba {person.name}"
+
+
+def people(count):
+    return [
+        AlumniRecord(name=f"Kişi {i}", linkedin_url=f"https://www.linkedin.com/in/kisi-{i}/", row_num=i)
+        for i in range(count)
+    ]
+
+
+def make_runner(tmp_path, source, limits):
+    bots = {"a": Bot()}
+    return CampaignRunner(
+        source, bots, Generator(),
+        scheduler=RateScheduler(bots, limits=limits, path=tmp_path / "quota.json"),
+        retries=RetryQueue(tmp_path / "retry.json")
+    )
+
+
+def test_short_quota_waits_do_not_flush_the_buffer(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "SHEETS_BATCH_SIZE", 50)
+    monkeypatch.setattr(config, "SHEETS_FLUSH_INTERVAL", 60)
+    source = BufferedSource()
+    runner = make_runner(tmp_path, source, {"account_gap": (1, 1.1)})
+
+    assert asyncio.run(runner.run(iter(people(4)))) == 4
+    # Tek boşaltma: çalıştırmanın sonunda
+    assert source.flushes == [4]
+
+
+def test_people_left_unsent_are_released_from_the_priority_schedule(tmp_path):
+    source = BufferedSource()
+    pending = [
+        AlumniRecord(name=f"Kişi {i}", linkedin_url=f"https://www.linkedin.com/in/kisi-{i}/",
+                     graduation_year="2010", row_num=i)
+        for i in range(4)
+    ]
+    schedule = PriorityScheduler(pending, {"2010": (4, 0)})
+    runner = make_runner(tmp_path, source, {"account_day": (1, 86400)})
+    runner.on_result = lambda result: schedule.finished(result.job.person, result.sheet_status)
+
+    assert asyncio.run(runner.run(schedule)) == 1
+    assert runner.limit_reached
+    # Kota dolunca sırada kalanlar 'yolda' sayılmaz; kapsama sadece gönderilenle artar
+    cohort = schedule._cohorts["2010"]
+    assert (cohort.sent, cohort.in_flight) == (1, 0)
@@ -0,0 +1,37 @@
+import csv
+
+import config
+from data_sources import CsvSource, ReadOnlySource
+from journal import CampaignJournal
+from prevalidate import prevalidate
+
+HEADERS = list(config.COLUMN_MAPPING.values())
+
+
+def test_dry_run_source_leaves_rows_unchanged(tmp_path):
+    path = tmp_path / "mezunlar.csv"
+    with open(path, mode="w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADERS)
+        writer.writerow(["Ali", "linkedin.com/in/ali", "2010", "", "", "", ""])
+        writer.writerow(["Ali 2", "linkedin.com/in/ali/", "2010", "", "", "", ""])
+        writer.writerow(["Can", "linkedin.com/in/can", "2011", "", "", config.STATUS_PENDING, ""])
+        writer.writerow(["Boş", "", "2012", "", "", "", ""])
+    original = path.read_bytes()
+
+    source = ReadOnlySource(CsvSource(path))
+    journal = CampaignJournal(tmp_path / "journal.jsonl", fsync_policy="never")
+    records = list(source.iter_alumni())
+    journal.attempted(records[2])
+    journal.finished(records[2], True, config.STATUS_SENT)
+    journal.recover(source)
+
+    checked = prevalidate(records, {"linkedin.com/in/can"})
+    checked.write_statuses(source)
+    for person in checked.viable:
+        assert source.update_status(person.row_num, config.STATUS_SENT)
+    assert source.flush_updates()
+    assert source.find_rows(["https://www.linkedin.com/in/can/"]) == {"https://www.linkedin.com/in/can/": 2}
+    source.close()
+
+    assert path.read_bytes() == original
@@ -0,0 +1,87 @@
+import csv
+
+import config
+from alumni_record import AlumniRecord
+from data_sources import CsvSource
+from journal import CampaignJournal
+
+HEADERS = list(config.COLUMN_MAPPING.values())
+
+
+def write_csv(path, rows):
+    with open(path, mode="w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADERS)
+        for name, url, status in rows:
+            writer.writerow([name, url, "2010", "", "", status, ""])
+
+
+def read_statuses(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return {row["Ad Soyad"]: row["Durum"] for row in csv.DictReader(f)}
+
+
+def person(url, row):
+    return AlumniRecord(name="", linkedin_url=url, row_num=row)
+
+
+def test_replay_tracks_sent_failed_and_interrupted(tmp_path):
+    journal = CampaignJournal(tmp_path / "journal.jsonl", fsync_policy="never")
+    journal.attempted(person("linkedin.com/in/gitti", 0))
+    journal.finished(person("linkedin.com/in/gitti", 0), True, config.STATUS_SENT)
+    journal.attempted(person("linkedin.com/in/hata", 1))
+    journal.finished(person("linkedin.com/in/hata", 1), False, config.STATUS_ERROR)
+    journal.attempted(person("https://www.linkedin.com/in/kesildi/", 2))
+    journal.attempted(person("linkedin.com/in/yazildi", 3))
+    journal.finished(person("linkedin.com/in/yazildi", 3), True, config.STATUS_SENT)
+    journal.written([person("linkedin.com/in/yazildi", 3)])
+
+    state = journal.replay()
+    assert state.handled == {"linkedin.com/in/gitti", "linkedin.com/in/kesildi", "linkedin.com/in/yazildi"}
+    assert state.uncertain == {"linkedin.com/in/kesildi": 2}
+    assert state.unwritten == {
+        "linkedin.com/in/gitti": (0, config.STATUS_SENT),
+        "linkedin.com/in/hata": (1, config.STATUS_ERROR),
+    }
+    assert state.is_handled("https://tr.linkedin.com/in/Gitti?trk=x")
+
+
+def test_recover_writes_to_current_row_after_rows_move(tmp_path):
+    sheet = tmp_path / "mezunlar.csv"
+    journal = CampaignJournal(tmp_path / "journal.jsonl", fsync_policy="never")
+    journal.attempted(person("linkedin.com/in/ali", 0))
+    journal.finished(person("linkedin.com/in/ali", 0), True, config.STATUS_SENT)
+    journal.attempted(person("linkedin.com/in/silinen", 1))
+    journal.finished(person("linkedin.com/in/silinen", 1), False, config.STATUS_ERROR)
+
+    # Çökmeden sonra sayfanın başına bir satır eklenmiş, ikinci kişi silinmiş
+    write_csv(sheet, [
+        ("Yeni", "https://www.linkedin.com/in/yeni", ""),
+        ("Ali", "https://www.linkedin.com/in/ali/", ""),
+    ])
+    source = CsvSource(sheet)
+    state = journal.recover(source)
+    source.close()
+
+    assert read_statuses(sheet) == {"Yeni": "", "Ali": config.STATUS_SENT}
+    # Bulunamayan kişinin durumu yazılmadı; günlükte açık kalır
+    assert state.unwritten == {"linkedin.com/in/silinen": (1, config.STATUS_ERROR)}
+    assert journal.replay().unwritten == state.unwritten
+
+
+def test_recover_compacts_journal_to_open_entries(tmp_path):
+    sheet = tmp_path / "mezunlar.csv"
+    write_csv(sheet, [("Ali", "linkedin.com/in/ali", ""), ("Can", "linkedin.com/in/can", "")])
+    journal = CampaignJournal(tmp_path / "journal.jsonl", fsync_policy="never")
+    journal.attempted(person("linkedin.com/in/ali", 0))
+    journal.finished(person("linkedin.com/in/ali", 0), True, config.STATUS_SENT)
+    journal.attempted(person("linkedin.com/in/can", 1))
+
+    source = CsvSource(sheet)
+    journal.recover(source)
+    source.close()
+
+    state = journal.replay()
+    assert state.unwritten == {}
+    assert state.uncertain == {"linkedin.com/in/can": 1}
+    assert read_statuses(sheet)["Ali"] == config.STATUS_SENT
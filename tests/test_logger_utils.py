@@ -0,0 +1,42 @@
+import io
+
+import config
+from logger_utils import CampaignLogger, _iter_csv_records
+
+
+def test_iter_csv_records_joins_quoted_newlines_and_reports_offsets():
+    data = 'a,b\r\n"çok\nsatırlı",x\r\n"tırnak ""içinde""",y\r\n'.encode("utf-8")
+    records = list(_iter_csv_records(io.BytesIO(data), 0))
+
+    assert [values for _, values, _ in records] == [
+        ["a", "b"], ["çok\nsatırlı", "x"], ['tırnak "içinde"', "y"]
+    ]
+    # Kayıtlar boşluksuz ardışık; konumlar bayt cinsinden
+    assert records[0][0] == 0
+    assert [start for start, _, _ in records[1:]] == [end for _, _, end in records[:-1]]
+    assert records[-1][2] == len(data)
+
+
+def test_iter_csv_records_resumes_from_offset_and_skips_partial_tail():
+    data = b'a,1\r\nb,2\r\n"yar\xc4\xb1m\n'
+    first = list(_iter_csv_records(io.BytesIO(data), 0))
+    assert [values for _, values, _ in first] == [["a", "1"], ["b", "2"]]
+
+    resumed = list(_iter_csv_records(io.BytesIO(data), first[0][2]))
+    assert [values for _, values, _ in resumed] == [["b", "2"]]
+
+
+def test_sent_keys_pick_up_new_rows_incrementally(tmp_path):
+    log = CampaignLogger(tmp_path / "campaign_log.csv", tmp_path / "index.sqlite3")
+    log.log_action({"name": "Ali", "linkedin_url": "https://www.linkedin.com/in/ali/"}, "Mesaj", config.STATUS_SENT)
+    log.log_action({"name": "Can", "linkedin_url": "linkedin.com/in/can"}, "Mesaj", config.STATUS_ERROR)
+    assert log.sent_keys() == {"linkedin.com/in/ali"}
+
+    log.log_action({"name": "Ece", "linkedin_url": "tr.linkedin.com/in/Ece?trk=x"}, "Mesaj", config.STATUS_SENT)
+    assert log.sent_keys() == {"linkedin.com/in/ali", "linkedin.com/in/ece"}
+    log.close()
+
+    reopened = CampaignLogger(tmp_path / "campaign_log.csv", tmp_path / "index.sqlite3")
+    assert reopened.is_processed("https://linkedin.com/in/ece/")
+    assert not reopened.is_processed("linkedin.com/in/can")
+    reopened.close()
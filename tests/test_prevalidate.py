@@ -0,0 +1,100 @@
+import csv
+
+import pandas as pd
+
+import config
+from data_sources import CsvSource
+from linkedin_urls import normalize_linkedin_url
+from prevalidate import REASON_EMPTY, REASON_MALFORMED, canonical_keys, prevalidate
+from priority_scheduler import scan_records
+
+HEADERS = list(config.COLUMN_MAPPING.values())
+
+
+def make_source(tmp_path, urls):
+    path = tmp_path / "mezunlar.csv"
+    with open(path, mode="w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADERS)
+        for i, url in enumerate(urls):
+            writer.writerow([f"Kişi {i}", url, "2010", "", "", "", ""])
+    return CsvSource(path)
+
+
+def test_canonical_keys_match_normalize_linkedin_url():
+    urls = [
+        "https://www.linkedin.com/in/ali-veli/",
+        "tr.linkedin.com/in/Ali-Veli?trk=x",
+        "http://m.linkedin.com/in/can/#x",
+        "  HTTPS://LINKEDIN.COM/in/ayse  ",
+        None,
+        "https://google.com/foo",
+    ]
+    keys = canonical_keys(pd.Series(urls, dtype=object))
+    assert list(keys) == [normalize_linkedin_url(url) for url in urls]
+
+
+def test_duplicates_keep_first_row(tmp_path):
+    source = make_source(tmp_path, [
+        "https://www.linkedin.com/in/ali-veli/",
+        "linkedin.com/in/ali-veli",
+        "tr.linkedin.com/in/Ali-Veli?trk=x",
+    ])
+    result = prevalidate(source.iter_pending_alumni(), set())
+    assert [p.row_num for p in result.viable] == [0]
+    assert result.viable[0].linkedin_url == "https://www.linkedin.com/in/ali-veli/"
+    assert [(p.row_num, reason) for p, reason in result.skipped] == [
+        (1, "Aynı profil 2. satırda da var"),
+        (2, "Aynı profil 2. satırda da var"),
+    ]
+
+
+def test_empty_and_malformed_urls_are_skipped(tmp_path):
+    source = make_source(tmp_path, ["", "https://google.com/foo", "www.linkedin.com/company/acme"])
+    result = prevalidate(source.iter_pending_alumni(), set())
+    assert not result.viable
+    assert [reason for _, reason in result.skipped] == [REASON_EMPTY, REASON_MALFORMED, REASON_MALFORMED]
+
+
+def test_history_rows_are_written_as_sent(tmp_path):
+    source = make_source(tmp_path, [
+        "https://www.linkedin.com/in/ayse",
+        "https://www.linkedin.com/in/can",
+        "https://www.linkedin.com/in/deniz",
+    ])
+    result = prevalidate(
+        source.iter_pending_alumni(), {"linkedin.com/in/ayse"}, {"linkedin.com/in/can"}
+    )
+    assert [p.row_num for p in result.already_sent] == [0]
+    assert result.uncertain == 1
+    assert [p.row_num for p in result.viable] == [2]
+
+    result.write_statuses(source)
+    source.close()
+    statuses = [p.status for p in CsvSource(source.path).iter_alumni()]
+    # Yarıda kesilmiş gönderimin durumuna dokunulmaz
+    assert statuses == [config.STATUS_SENT, "", ""]
+
+
+def test_duplicate_of_already_sent_profile_is_not_viable(tmp_path):
+    source = make_source(tmp_path, ["linkedin.com/in/ayse", "https://tr.linkedin.com/in/ayse/"])
+    result = prevalidate(source.iter_pending_alumni(), {"linkedin.com/in/ayse"})
+    assert not result.viable
+    assert len(result.already_sent) == 2
+
+
+def test_pending_duplicate_of_row_already_sent_in_sheet(tmp_path):
+    # Kampanya logundan önceki gönderimler sadece e-tablodaki 'Gönderildi' durumundan bilinir
+    path = tmp_path / "mezunlar.csv"
+    with open(path, mode="w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADERS)
+        writer.writerow(["Ayşe", "https://www.linkedin.com/in/ayse/", "2010", "", "", config.STATUS_SENT, ""])
+        writer.writerow(["Ayşe (2)", "linkedin.com/in/Ayse?trk=x", "2010", "", "", "", ""])
+        writer.writerow(["Can", "linkedin.com/in/can", "2011", "", "", "", ""])
+    source = CsvSource(path)
+
+    candidates, _, sent_keys = scan_records(source.iter_alumni())
+    result = prevalidate(candidates, sent_keys)
+    assert [p.row_num for p in result.already_sent] == [1]
+    assert [p.row_num for p in result.viable] == [2]
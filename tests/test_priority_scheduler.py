@@ -0,0 +1,59 @@
+import config
+from alumni_record import AlumniRecord
+from priority_scheduler import PriorityScheduler, scan_records
+from retry_queue import RetryQueue
+from outcomes import TIMEOUT, failed
+
+
+def record(row, year, status="", url=None):
+    return AlumniRecord(
+        name=f"Kişi {row}", linkedin_url=url or f"linkedin.com/in/kisi-{row}",
+        graduation_year=year, status=status, row_num=row
+    )
+
+
+def test_scan_records_counts_cohorts_and_keeps_only_candidates(tmp_path):
+    retries = RetryQueue(tmp_path / "retry.json")
+    waiting = record(4, "2012", config.STATUS_ERROR)
+    retries.record(waiting, failed(TIMEOUT))
+    rows = [
+        record(0, "2010", config.STATUS_SENT),
+        record(1, "2010"),
+        record(2, " 2010 ", config.STATUS_SKIPPED),
+        record(3, "2012", config.STATUS_ERROR),
+        waiting,
+        record(5, "", config.STATUS_PENDING),
+    ]
+
+    candidates, cohorts, sent_keys = scan_records(iter(rows), retries)
+
+    # Kuyrukta olmayan 'Hata' hemen, bekleme süresi dolmamış olan sonra denenir
+    assert [person.row_num for person in candidates] == [1, 3, 5]
+    assert cohorts == {"2010": (3, 1), "2012": (2, 0), "": (1, 0)}
+    assert sent_keys == {"linkedin.com/in/kisi-0"}
+
+
+def test_cohort_furthest_behind_target_goes_first():
+    pending = [record(0, "2010"), record(1, "2010"), record(2, "2015"), record(3, "2015")]
+    cohorts = {"2010": (10, 5), "2015": (10, 0)}
+    schedule = PriorityScheduler(pending, cohorts, target=0.3)
+
+    first = next(schedule)
+    assert first.graduation_year == "2015"
+    schedule.finished(first, config.STATUS_SENT)
+    # 2015 hâlâ 2010'un gerisinde
+    assert next(schedule).graduation_year == "2015"
+    assert [person.graduation_year for person in schedule] == ["2010", "2010"]
+
+
+def test_failed_people_wait_behind_untried_in_same_year(tmp_path):
+    retries = RetryQueue(tmp_path / "retry.json")
+    tried = record(0, "2010", config.STATUS_ERROR)
+    retries.record(tried, failed(TIMEOUT), now=0)
+    pending = [tried, record(1, "2010"), record(2, "2010")]
+
+    schedule = PriorityScheduler(pending, {"2010": (3, 0)}, retries)
+
+    assert len(schedule) == 3
+    assert [person.row_num for person in schedule] == [1, 2, 0]
+    assert schedule.cohorts() == [("2010", 3, 0, 0, 0.0)]
@@ -0,0 +1,60 @@
+import config
+from alumni_record import AlumniRecord
+from outcomes import NO_MESSAGE_BUTTON, TIMEOUT, failed, sent
+from retry_queue import RetryQueue
+
+
+def make_queue(tmp_path, **kwargs):
+    kwargs.setdefault("max_attempts", 3)
+    kwargs.setdefault("base_delay", 60)
+    kwargs.setdefault("max_delay", 200)
+    return RetryQueue(tmp_path / "retry.json", **kwargs)
+
+
+def person(url="https://www.linkedin.com/in/ali/", row=4):
+    return AlumniRecord(name="Ali", linkedin_url=url, row_num=row)
+
+
+def test_backoff_doubles_up_to_max_delay(tmp_path):
+    queue = make_queue(tmp_path)
+    assert [queue.backoff(n) for n in (1, 2, 3, 4)] == [60, 120, 200, 200]
+
+
+def test_transient_failures_retry_then_skip(tmp_path):
+    queue = make_queue(tmp_path)
+
+    status, notes = queue.record(person(), failed(TIMEOUT), now=1000)
+    assert status == config.STATUS_ERROR
+    assert "(1/3" in notes
+    assert not queue.is_due("linkedin.com/in/ali", now=1059)
+    assert queue.is_due("tr.linkedin.com/in/Ali?trk=x", now=1060)
+
+    status, notes = queue.record(person(), failed(TIMEOUT), now=1060)
+    assert (status, queue.attempts("linkedin.com/in/ali")) == (config.STATUS_ERROR, 2)
+    assert queue.get("linkedin.com/in/ali")["next_at"] == 1180
+
+    status, notes = queue.record(person(), failed(TIMEOUT), now=1180)
+    assert status == config.STATUS_SKIPPED
+    assert notes.endswith("(3 deneme)")
+    assert queue.get("linkedin.com/in/ali") is None
+
+
+def test_permanent_failure_skips_immediately(tmp_path):
+    queue = make_queue(tmp_path)
+    status, notes = queue.record(person(), failed(NO_MESSAGE_BUTTON), now=0)
+    assert status == config.STATUS_SKIPPED
+    assert notes == failed(NO_MESSAGE_BUTTON).describe()
+    assert queue.entries == {}
+
+
+def test_success_clears_entry_and_state_survives_reload(tmp_path):
+    queue = make_queue(tmp_path)
+    queue.record(person(), failed(TIMEOUT), now=0)
+    queue.record(person("linkedin.com/in/can", row=7), failed(TIMEOUT), now=0)
+    assert queue.record(person(), sent()) == (config.STATUS_SENT, "")
+
+    reloaded = make_queue(tmp_path)
+    assert list(reloaded.entries) == ["linkedin.com/in/can"]
+    assert reloaded.get("linkedin.com/in/can")["row"] == 7
+    # Kuyrukta olmayan kişi hemen denenebilir
+    assert reloaded.is_due("linkedin.com/in/ali", now=0)
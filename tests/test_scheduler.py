@@ -0,0 +1,72 @@
+import json
+
+from scheduler import RateScheduler, SlidingWindow, TokenBucket
+
+
+def test_sliding_window_never_exceeds_cap_in_any_window():
+    window = SlidingWindow(3, 100)
+    sends = []
+    now = 0.0
+    while now < 1000:
+        if window.wait_time(now) <= 0:
+            window.take(now)
+            sends.append(now)
+        now += 1
+    # Herhangi bir 100 sn'lik pencerede en fazla 3 gönderim
+    for start in sends:
+        assert sum(1 for t in sends if start <= t < start + 100) <= 3
+
+
+def test_sliding_window_waits_for_oldest_send_to_expire():
+    window = SlidingWindow(2, 60, [10.0, 30.0])
+    assert window.wait_time(40.0) == 30.0
+    assert window.wait_time(70.0) == 0.0
+    assert window.remaining(70.0) == 1
+
+
+def test_token_bucket_refills_continuously():
+    bucket = TokenBucket(1, 5, tokens=0, updated=0.0)
+    assert bucket.wait_time(0.0) == 5.0
+    assert bucket.wait_time(5.0) == 0.0
+
+
+def test_day_cap_survives_restart(tmp_path):
+    path = tmp_path / "quota.json"
+    limits = {"account_day": (2, 86400)}
+    scheduler = RateScheduler(["a"], limits=limits, path=path)
+    assert scheduler.try_acquire("a")
+    assert RateScheduler(["a"], limits=limits, path=path).try_acquire("a")
+
+    # Yeni çalıştırma: aynı gün içinde üçüncü gönderim yok
+    restarted = RateScheduler(["a"], limits=limits, path=path)
+    assert not restarted.try_acquire("a")
+    assert restarted.wait_time("a") > 86000
+
+
+def test_global_limit_is_shared_between_accounts(tmp_path):
+    limits = {"global_hour": (1, 3600)}
+    scheduler = RateScheduler(["a", "b"], limits=limits, path=tmp_path / "quota.json")
+    assert scheduler.try_acquire("a")
+    assert not scheduler.try_acquire("b")
+
+
+def test_corrupt_state_fails_closed_until_windows_pass(tmp_path):
+    path = tmp_path / "quota.json"
+    path.write_text('{"account_day:a": {"sends": [1.0, ')
+    written = path.stat().st_mtime
+    limits = {"account_day": (25, 86400), "account_gap": (1, 5)}
+    scheduler = RateScheduler(["a"], limits=limits, path=path)
+
+    assert not scheduler.try_acquire("a")
+    assert scheduler.wait_time("a", now=written + 3600) > 0
+    assert scheduler.wait_time("a", now=written + 86400) == 0
+
+
+def test_other_accounts_state_is_kept(tmp_path):
+    path = tmp_path / "quota.json"
+    path.write_text(json.dumps({"account_day:other": {"sends": [1.0]}}))
+    scheduler = RateScheduler(["a"], limits={"account_day": (5, 86400)}, path=path)
+    scheduler.try_acquire("a")
+    saved = json.loads(path.read_text())
+    assert saved["account_day:other"] == {"sends": [1.0]}
+    assert len(saved["account_day:a"]["sends"]) == 1
@@ -0,0 +1,54 @@
+from selector_engine import SelectorEngine, SelectorStats
+
+NAME_XPATH = "//div[contains(@class, 'msg-overlay-conversation-bubble') and .//h2[contains(., 'Ali')]]//div[@role='textbox']"
+GENERIC = "div[role='textbox']"
+
+
+class FakeDriver:
+    """Her grup için verilen seçiciyi 'görünür' sayar ve gönderilen aday sırasını saklar."""
+
+    def __init__(self):
+        self.visible = {}
+        self.payloads = []
+
+    def execute_script(self, script, payload):
+        self.payloads.append(payload)
+        result = {}
+        for group in payload:
+            queries = [c["q"] for c in group["candidates"]]
+            wanted = self.visible.get(group["name"])
+            index = queries.index(wanted) if wanted in queries else -1
+            result[group["name"]] = {
+                "index": index,
+                "elements": ["el"] if index >= 0 else [],
+                "tried": [{"hit": i == index, "ms": 1.0} for i in range(index + 1 if index >= 0 else len(queries))],
+            }
+        return result
+
+
+def make_engine(tmp_path, selectors=None):
+    driver = FakeDriver()
+    stats = SelectorStats(tmp_path / "stats.json")
+    return driver, SelectorEngine(driver, selectors or {}, stats)
+
+
+def test_dynamic_candidates_keep_caller_order_after_fallback_hit(tmp_path):
+    driver, engine = make_engine(tmp_path)
+
+    driver.visible["message_bubble"] = GENERIC
+    match = engine.first("message_bubble", [NAME_XPATH, GENERIC])
+    assert match.index == 1
+
+    # Yedek seçicinin isabeti bir sonraki kişide isimli kutunun önüne geçmemeli
+    engine.first("message_bubble", [NAME_XPATH, GENERIC])
+    assert [c["q"] for c in driver.payloads[-1][0]["candidates"]] == [NAME_XPATH, GENERIC]
+    assert engine.stats.data == {}
+
+
+def test_tracked_group_winner_is_tried_first(tmp_path):
+    driver, engine = make_engine(tmp_path, {"send_button": ["button.a", "button.b"]})
+
+    driver.visible["send_button"] = "button.b"
+    engine.first("send_button")
+    engine.first("send_button")
+    assert [c["q"] for c in driver.payloads[-1][0]["candidates"]] == ["button.b", "button.a"]
@@ -0,0 +1,64 @@
+import pytest
+
+pytest.importorskip("gspread")
+
+import config  # noqa: E402
+from fake_sheets import FakeSheetsClient  # noqa: E402
+from sheets_reader import GoogleSheetsReader  # noqa: E402
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "SHEETS_CACHE_PATH", tmp_path / "snapshot.sqlite3")
+    monkeypatch.setattr(config, "SHEETS_CACHE_ENABLED", True)
+    rows = [[f"Kişi {i}", f"https://www.linkedin.com/in/kisi-{i}", "2010", "", "", "", ""] for i in range(20)]
+    return FakeSheetsClient(rows=rows)
+
+
+def worksheet(client):
+    return client.spreadsheets[config.SPREADSHEET_NAME].worksheets[config.WORKSHEET_NAME]
+
+
+def edit(client, row_num, field, value):
+    # Başka bir kullanıcının e-tabloda yaptığı düzenleme (0-tabanlı veri satırı)
+    ws = worksheet(client)
+    ws._set(row_num + 2, ws.values[0].index(config.COLUMN_MAPPING[field]) + 1, value)
+    client._touch()
+
+
+def read(client):
+    reader = GoogleSheetsReader(client=client)
+    records = {person.row_num: person for person in reader.iter_alumni()}
+    return reader, records
+
+
+def test_own_flush_does_not_hide_concurrent_edits(client):
+    reader, _ = read(client)
+    edit(client, 7, "status", config.STATUS_SKIPPED)
+    reader.update_status(3, config.STATUS_SENT)
+    reader.flush_updates()
+    reader.close()
+
+    _, records = read(client)
+    assert records[3].status == config.STATUS_SENT
+    assert records[7].status == config.STATUS_SKIPPED
+
+
+def test_edits_to_any_mapped_column_are_picked_up(client):
+    reader, _ = read(client)
+    reader.close()
+    edit(client, 2, "name", "Ayşe Yılmaz")
+    edit(client, 5, "graduation_year", "2014")
+    edit(client, 9, "company", "Örnek A.Ş.")
+
+    reader, records = read(client)
+    reader.close()
+    assert records[2].name == "Ayşe Yılmaz"
+    assert records[5].graduation_year == "2014"
+    assert records[9].company == "Örnek A.Ş."
+
+
+def test_find_rows_matches_any_url_form(client):
+    reader = GoogleSheetsReader(client=client)
+    rows = reader.find_rows(["linkedin.com/in/KISI-4?trk=x", "https://www.linkedin.com/in/yok/"])
+    assert rows == {"linkedin.com/in/KISI-4?trk=x": 4, "https://www.linkedin.com/in/yok/": None}
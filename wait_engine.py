@@ -0,0 +1,103 @@
+"""
+Sabit time.sleep çağrıları yerine, sayfanın gerçekten hazır olmasını bekleyen koşul tabanlı bekleme katmanı.
+"""
+import time
+from typing import Callable, Dict, List, Optional
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+import config
+from logger_utils import setup_logger
+from metrics import get_recorder
+
+logger = setup_logger(__name__)
+
+
+# ---------- KOŞULLAR ----------
+# Her koşul driver alır; sağlanmadıysa False/None, sağlandıysa doğru bir değer döndürür.
+
+def element_enabled(element) -> Callable:
+    def condition(driver):
+        return element if element.is_enabled() else None
+    return condition
+
+
+def element_text_empty(element) -> Callable:
+    # Mesaj kutusu gönderimden sonra boşaldığında True döner.
+    def condition(driver):
+        try:
+            return element.text.strip() == ""
+        except StaleElementReferenceException:
+            return True
+    return condition
+
+
+def url_contains_any(parts: List[str]) -> Callable:
+    # Adres listedeki parçalardan birini içerdiğinde o parçayı döndürür (ilk eşleşen).
+    def condition(driver):
+        url = driver.current_url
+        for part in parts:
+            if part in url:
+                return part
+        return None
+    return condition
+
+
+def is_focused(element) -> Callable:
+    def condition(driver):
+        return driver.switch_to.active_element == element
+    return condition
+
+
+class AdaptiveWaiter:
+    """
+    WebDriverWait'i adım adı ve yapılandırılabilir zaman aşımıyla sarar.
+    Her adımın gerçekte ne kadar sürdüğü metrik kaydına (wait.<adım>) yazılır.
+    """
+
+    def __init__(
+        self,
+        driver,
+        timeouts: Optional[Dict[str, float]] = None,
+        poll_interval: Optional[float] = None
+    ):
+        self.driver = driver
+        self.timeouts = {**config.WAIT_TIMEOUTS, **(timeouts or {})}
+        self.poll_interval = poll_interval or config.WAIT_POLL_INTERVAL
+
+    def until(
+        self,
+        step: str,
+        condition: Callable,
+        timeout: Optional[float] = None,
+        required: bool = False
+    ):
+        """
+        Koşul sağlanana kadar kısa aralıklarla yoklar.
+
+        Args:
+            step: Adım adı (zaman aşımı ve süre kaydı bu adla tutulur)
+            condition: driver alan koşul fonksiyonu
+            timeout: Verilmezse config.WAIT_TIMEOUTS[step]
+            required: True ise zaman aşımında TimeoutException fırlatılır
+
+        Returns:
+            Koşulun döndürdüğü değer; zaman aşımında (required=False) None
+        """
+        if timeout is None:
+            timeout = self.timeouts.get(step, config.ELEMENT_WAIT_TIMEOUT)
+
+        started = time.perf_counter()
+        try:
+            return WebDriverWait(
+                self.driver,
+                timeout,
+                poll_frequency=self.poll_interval,
+                ignored_exceptions=(StaleElementReferenceException,)
+            ).until(condition)
+        except TimeoutException:
+            if required:
+                raise
+            logger.debug("'%s' adımı %s sn içinde hazır olmadı", step, timeout)
+            return None
+        finally:
+            get_recorder().record(f"wait.{step}", time.perf_counter() - started)